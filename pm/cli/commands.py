@@ -126,6 +126,7 @@ def list(
     table.add_column("Priority", style="yellow")
     table.add_column("ETA", style="green")
 
+    now = datetime.now()
     for task in tasks:
         status_style = {
             TaskStatus.TODO: "white",
@@ -136,7 +137,7 @@ def list(
         }.get(task.status, "white")
 
         eta_str = task.eta.strftime("%Y-%m-%d") if task.eta else "-"
-        if task.is_overdue():
+        if task.is_overdue(now):
             eta_str = f"[red]{eta_str} (overdue)[/red]"
 
         table.add_row(
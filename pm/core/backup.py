@@ -8,7 +8,7 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupInfo:
     """Information about a backup file."""
     path: Path
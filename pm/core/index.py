@@ -0,0 +1,243 @@
+"""In-memory secondary indexes over the task table."""
+
+import bisect
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .task import Task, TaskStatus
+
+
+def _local_naive(value: datetime) -> datetime:
+    """Convert an aware datetime to naive local time so all keys compare."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+class TaskIndex(dict):
+    """Task table (ID -> Task) that maintains per-attribute postings.
+
+    Postings map an attribute value to the IDs of tasks holding it, so
+    filters can intersect small ID sets instead of scanning every task.
+    Postings are insertion-ordered dicts used as ordered sets, which keeps
+    filter results deterministic.
+
+    Assigning or deleting entries keeps the postings in sync. When a stored
+    task is mutated in place, call ``reindex(task_id)`` afterwards.
+    """
+
+    def __init__(self, tasks: Optional[Dict[str, Task]] = None):
+        """Initialize index.
+
+        Args:
+            tasks: Optional initial mapping of task IDs to tasks
+        """
+        super().__init__()
+        self.by_status: Dict[str, Dict[str, None]] = {}
+        self.by_type: Dict[str, Dict[str, None]] = {}
+        self.by_priority: Dict[str, Dict[str, None]] = {}
+        self.by_tag: Dict[str, Dict[str, None]] = {}
+        # (eta, ID) of unfinished tasks with an ETA, kept sorted
+        self._by_eta: List[Tuple[datetime, str]] = []
+        # (next check time, ID) of tasks with a check due some time, kept sorted
+        self._by_next_check: List[Tuple[datetime, str]] = []
+        # Lowercased "title\x1fdescription" per task, for substring search
+        self._search_text: Dict[str, str] = {}
+        # Attribute values each task was indexed under, for removal
+        self._keys: Dict[str, tuple] = {}
+
+        if tasks:
+            self.update(tasks)
+
+    def __setitem__(self, task_id: str, task: Task) -> None:
+        if task_id in self:
+            self._remove_postings(task_id)
+        super().__setitem__(task_id, task)
+        self._add_postings(task_id, task)
+
+    def __delitem__(self, task_id: str) -> None:
+        super().__delitem__(task_id)
+        self._remove_postings(task_id)
+
+    def pop(self, task_id: str, *default):
+        if task_id in self:
+            self._remove_postings(task_id)
+        return super().pop(task_id, *default)
+
+    def update(self, *args, **kwargs) -> None:
+        for task_id, task in dict(*args, **kwargs).items():
+            self[task_id] = task
+
+    def clear(self) -> None:
+        super().clear()
+        self.by_status.clear()
+        self.by_type.clear()
+        self.by_priority.clear()
+        self.by_tag.clear()
+        self._by_eta.clear()
+        self._by_next_check.clear()
+        self._search_text.clear()
+        self._keys.clear()
+
+    def reindex(self, task_id: str) -> None:
+        """Refresh postings for a task that was mutated in place.
+
+        Args:
+            task_id: ID of the task to reindex
+        """
+        task = self.get(task_id)
+        if task is None:
+            return
+        self._remove_postings(task_id)
+        self._add_postings(task_id, task)
+
+    def lookup(
+        self,
+        status: Optional[str] = None,
+        task_type: Optional[str] = None,
+        priority: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> List[Task]:
+        """Get tasks matching all given attribute values.
+
+        Args:
+            status: Status value to match
+            task_type: Type value to match
+            priority: Priority value to match
+            tags: Tags to match (any match)
+
+        Returns:
+            List of matching tasks
+        """
+        postings = []
+
+        if status:
+            postings.append(self.by_status.get(status, {}))
+        if task_type:
+            postings.append(self.by_type.get(task_type, {}))
+        if priority:
+            postings.append(self.by_priority.get(priority, {}))
+        if tags:
+            tags = list(tags)
+            if len(tags) == 1:
+                postings.append(self.by_tag.get(tags[0], {}))
+            else:
+                tagged: Dict[str, None] = {}
+                for tag in tags:
+                    tagged.update(self.by_tag.get(tag, {}))
+                postings.append(tagged)
+
+        if not postings:
+            return list(self.values())
+
+        postings.sort(key=len)
+        smallest, rest = postings[0], postings[1:]
+        return [
+            self[task_id] for task_id in smallest
+            if all(task_id in posting for posting in rest)
+        ]
+
+    def overdue(self, now: datetime) -> List[Task]:
+        """Get unfinished tasks whose ETA is before a given time.
+
+        Args:
+            now: Cutoff time (naive local time)
+
+        Returns:
+            List of overdue tasks, earliest ETA first
+        """
+        end = bisect.bisect_left(self._by_eta, (now, ""))
+        return [self[task_id] for _, task_id in self._by_eta[:end]]
+
+    def needing_check(self, now: datetime) -> List[Task]:
+        """Get tasks whose next status check is due at a given time.
+
+        Args:
+            now: Cutoff time (naive local time)
+
+        Returns:
+            List of tasks needing a check, longest overdue first
+        """
+        end = bisect.bisect_right(self._by_next_check, (now, "\uffff"))
+        return [self[task_id] for _, task_id in self._by_next_check[:end]]
+
+    def search(self, query: str, tasks: Optional[Iterable[Task]] = None) -> List[Task]:
+        """Get tasks whose title or description contains a query.
+
+        Matching is case-insensitive and runs against text lowercased
+        once at indexing time.
+
+        Args:
+            query: Substring to look for
+            tasks: Tasks to search within (defaults to all tasks)
+
+        Returns:
+            List of matching tasks, in input order
+        """
+        query = query.lower()
+        text = self._search_text
+        if tasks is None:
+            tasks = self.values()
+        return [task for task in tasks if query in text[task.id]]
+
+    def _add_postings(self, task_id: str, task: Task) -> None:
+        eta = None
+        if task.eta is not None and task.status != TaskStatus.DONE:
+            eta = _local_naive(task.eta)
+            bisect.insort(self._by_eta, (eta, task_id))
+        # Computed at write time so queries only bisect
+        next_check = task.next_check_at
+        if next_check is not None:
+            next_check = _local_naive(next_check)
+            bisect.insort(self._by_next_check, (next_check, task_id))
+
+        keys = (
+            task.status.value,
+            task.type.value,
+            task.priority.value,
+            tuple(task.tags),
+            eta,
+            next_check,
+        )
+        self._keys[task_id] = keys
+        # The separator keeps a match from spanning title and description
+        self._search_text[task_id] = f"{task.title}\x1f{task.description}".lower()
+
+        status, task_type, priority, tags = keys[:4]
+        self.by_status.setdefault(status, {})[task_id] = None
+        self.by_type.setdefault(task_type, {})[task_id] = None
+        self.by_priority.setdefault(priority, {})[task_id] = None
+        for tag in tags:
+            self.by_tag.setdefault(tag, {})[task_id] = None
+
+    def _remove_postings(self, task_id: str) -> None:
+        keys = self._keys.pop(task_id, None)
+        if keys is None:
+            return
+        del self._search_text[task_id]
+
+        status, task_type, priority, tags, eta, next_check = keys
+        if eta is not None:
+            self._remove_sorted(self._by_eta, (eta, task_id))
+        if next_check is not None:
+            self._remove_sorted(self._by_next_check, (next_check, task_id))
+        self._discard(self.by_status, status, task_id)
+        self._discard(self.by_type, task_type, task_id)
+        self._discard(self.by_priority, priority, task_id)
+        for tag in tags:
+            self._discard(self.by_tag, tag, task_id)
+
+    @staticmethod
+    def _remove_sorted(entries: List[Tuple[datetime, str]], entry: Tuple[datetime, str]) -> None:
+        i = bisect.bisect_left(entries, entry)
+        if i < len(entries) and entries[i] == entry:
+            del entries[i]
+
+    @staticmethod
+    def _discard(postings: Dict[str, Dict[str, None]], key: str, task_id: str) -> None:
+        posting = postings.get(key)
+        if posting is None:
+            return
+        posting.pop(task_id, None)
+        if not posting:
+            del postings[key]
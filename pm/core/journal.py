@@ -2,14 +2,34 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 import re
+import time
 
 from .task import Task, TaskStatus
 
-
-@dataclass
+# Checkbox lines: "- [x] task-abc123: ..."
+_CHECKBOX_RE = re.compile(r'- \[([ x])\] (task-[a-f0-9]+):')
+# One scan over a journal: day headers, other headings, and the first task
+# reference on each remaining line (the rest of the line is consumed)
+_JOURNAL_TOKEN_RE = re.compile(
+    r'^## (?P<day>\w+), \w+ \d+[^\n]*'
+    r'|^(?P<heading>##[^\n]*)'
+    r'|(?P<task>task-[a-f0-9]+):[^\n]*',
+    re.MULTILINE,
+)
+# Heading prefix -> section name; other headings end the current section
+_SECTION_HEADINGS = (
+    ('### 📋 Planned', 'planned'),
+    ('### 🚫 Blocked', 'blocked'),
+    ('### ✅ Completed', 'completed'),
+    ('### 📝 Notes', 'notes'),
+)
+
+
+@dataclass(slots=True)
 class DaySection:
     """Represents a single day's section in the weekly journal."""
     date: datetime
@@ -19,7 +39,7 @@ class DaySection:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklySummary:
     """Weekly summary data."""
     week_start: datetime
@@ -242,83 +262,88 @@ class WeeklyJournal:
         Returns:
             Dictionary mapping task IDs to checked status
         """
-        checkbox_pattern = r'- \[([ x])\] (task-[a-f0-9]+):'
         checkboxes = {}
 
-        for match in re.finditer(checkbox_pattern, content):
+        for match in _CHECKBOX_RE.finditer(content):
             checked = match.group(1) == 'x'
             task_id = match.group(2)
             checkboxes[task_id] = checked
 
         return checkboxes
 
-    def load(self, tasks_by_id: Dict[str, Task]) -> None:
+    def load(self, tasks_by_id: Dict[str, Task], content: Optional[str] = None) -> None:
         """Load journal from file and parse content.
 
         Args:
             tasks_by_id: Dictionary mapping task IDs to Task objects
+            content: Journal markdown already read by the caller (read from
+                the file if omitted)
         """
-        if not self.exists():
-            return
-
-        content = self.get_file_path().read_text()
+        if content is None:
+            if not self.exists():
+                return
+            content = self.get_file_path().read_text()
 
         # Parse checkboxes to determine completed tasks
         checkboxes = self.parse_checkboxes(content)
 
+        # Map day names to dates once for header lookups
+        day_dates = {}
+        for i in range(7):
+            day_date = self.week_start + timedelta(days=i)
+            day_dates.setdefault(self.get_day_name(day_date), day_date)
+
         # Parse day sections (simplified - just look for task IDs in each day)
         current_day = None
         current_section = None
 
-        for line in content.split('\n'):
-            # Detect day header
-            day_match = re.match(r'## (\w+), (\w+ \d+)', line)
-            if day_match:
-                # Find the date for this day
-                for i in range(7):
-                    day_date = self.week_start + timedelta(days=i)
-                    if self.get_day_name(day_date) == day_match.group(1):
+        for match in _JOURNAL_TOKEN_RE.finditer(content):
+            task_id = match.group('task')
+            if task_id is None:
+                day_name = match.group('day')
+                if day_name is not None:
+                    day_date = day_dates.get(day_name)
+                    if day_date is not None:
                         current_day = self.add_day_section(day_date)
-                        break
-                continue
+                    continue
 
-            # Detect section
-            if line.startswith('### 📋 Planned'):
-                current_section = 'planned'
-            elif line.startswith('### 🚫 Blocked'):
-                current_section = 'blocked'
-            elif line.startswith('### ✅ Completed'):
-                current_section = 'completed'
-            elif line.startswith('### 📝 Notes'):
-                current_section = 'notes'
-            elif line.startswith('###') or line.startswith('##'):
+                heading = match.group('heading')
                 current_section = None
+                for prefix, section in _SECTION_HEADINGS:
+                    if heading.startswith(prefix):
+                        current_section = section
+                        break
+                continue
 
-            # Parse task IDs
+            # Task references
             if current_day and current_section and current_section != 'notes':
-                task_match = re.search(r'(task-[a-f0-9]+):', line)
-                if task_match:
-                    task_id = task_match.group(1)
-
-                    if current_section == 'planned' and task_id not in current_day.planned:
-                        current_day.planned.append(task_id)
-                        # Check if completed based on checkbox
-                        if checkboxes.get(task_id, False):
-                            if task_id not in current_day.completed:
-                                current_day.completed.append(task_id)
-                    elif current_section == 'blocked' and task_id not in current_day.blocked:
-                        current_day.blocked.append(task_id)
+                if current_section == 'planned' and task_id not in current_day.planned:
+                    current_day.planned.append(task_id)
+                    # Check if completed based on checkbox
+                    if checkboxes.get(task_id, False):
+                        if task_id not in current_day.completed:
+                            current_day.completed.append(task_id)
+                elif current_section == 'blocked' and task_id not in current_day.blocked:
+                    current_day.blocked.append(task_id)
+
+
+@lru_cache(maxsize=1)
+def _week_for_minute(minute: int) -> tuple:
+    """Get the local ISO year and week for a minute since the epoch."""
+    iso_calendar = datetime.fromtimestamp(minute * 60).isocalendar()
+    return iso_calendar[0], iso_calendar[1]
 
 
 def get_current_week() -> tuple:
     """Get current ISO year and week number.
 
+    Weeks change at local midnight, which falls on a minute boundary, so
+    the result is computed once per minute.
+
     Returns:
         Tuple of (year, week)
     """
-    now = datetime.now()
-    iso_calendar = now.isocalendar()
-    return iso_calendar[0], iso_calendar[1]
+    return _week_for_minute(int(time.time()) // 60)
 
 
 def get_week_for_date(date: datetime) -> tuple:
@@ -1,8 +1,12 @@
 """Journal manager for integrating journals with task management."""
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Any, Tuple
+import bisect
+import os
+import re
 import subprocess
 
 from .journal import WeeklyJournal, DaySection, WeeklySummary, get_current_week, get_week_for_date
@@ -11,6 +15,28 @@ from .task import Task, TaskStatus
 from .storage import JournalStorage
 from .backup import BackupManager
 
+# Weekly journal file names, e.g. 2026-W02.md (summary files excluded)
+_WEEK_FILE_RE = re.compile(r"^(\d{4})-W(\d{2})\.md$")
+
+
+@lru_cache(maxsize=None)
+def _quarter_weeks(year: int, quarter: int) -> Tuple[tuple, tuple]:
+    """Get the first and last (year, week) scanned for a quarter's summary.
+
+    Args:
+        year: Year
+        quarter: Quarter number (1-4)
+
+    Returns:
+        Tuple of the first and last (year, week) keys, inclusive
+    """
+    quarter_start_month = (quarter - 1) * 3 + 1
+    quarter_start = datetime(year, quarter_start_month, 1)
+    quarter_end = datetime(year, quarter_start_month + 2, 1) + timedelta(days=90)
+    # Weekly steps from the quarter start, as far as the quarter end
+    last_step = quarter_start + timedelta(days=7 * ((quarter_end - quarter_start).days // 7))
+    return get_week_for_date(quarter_start), get_week_for_date(last_step)
+
 
 class JournalManager:
     """Manages weekly journals and syncs with tasks."""
@@ -236,8 +262,9 @@ class JournalManager:
             backup_path = self.backup_manager.create_backup(journal_path, trigger="sync")
             result["backup_path"] = str(backup_path) if backup_path else None
 
-        # Load journal content
-        content = journal_path.read_text()
+        # Load journal content (the only read of the file during the sync)
+        original_content = journal_path.read_text()
+        content = original_content
 
         # Get known task IDs from task files (before any changes)
         known_task_ids = set(self.task_manager._tasks.keys())
@@ -288,12 +315,12 @@ class JournalManager:
                 result["deleted"].append(task_id)
 
         # 4. Save updated journal content (with NEW: entries replaced)
-        if content != journal_path.read_text():
+        if content != original_content:
             journal_path.write_text(content)
 
-        # Reload journal structure
+        # Reload journal structure from the content already in memory
         tasks_by_id = {t.id: t for t in self.task_manager.get_all_tasks()}
-        journal.load(tasks_by_id)
+        journal.load(tasks_by_id, content)
 
         # Update completed lists in day sections
         for day_key, day_section in journal.days.items():
@@ -429,6 +456,20 @@ class JournalManager:
         summary_path = journal.get_summary_file_path()
         summary_path.write_text("\n".join(lines))
 
+    def _journal_weeks(self) -> List[tuple]:
+        """List the weeks that have a journal file.
+
+        Returns:
+            Sorted list of (year, week) tuples
+        """
+        weeks = []
+        for name in os.listdir(self.journal_dir):
+            match = _WEEK_FILE_RE.match(name)
+            if match:
+                weeks.append((int(match.group(1)), int(match.group(2))))
+        weeks.sort()
+        return weeks
+
     def get_quarterly_summary(self, year: int, quarter: int) -> Dict:
         """Get summary for a quarter (Q1-Q4).
 
@@ -439,27 +480,21 @@ class JournalManager:
         Returns:
             Dictionary with quarterly statistics
         """
-        # Determine weeks in quarter
-        quarter_start_month = (quarter - 1) * 3 + 1
-        quarter_start = datetime(year, quarter_start_month, 1)
-        quarter_end = datetime(year, quarter_start_month + 2, 1) + timedelta(days=90)
+        # Bisect the sorted journal weeks instead of probing every week
+        first_week, last_week = _quarter_weeks(year, quarter)
+        weeks = self._journal_weeks()
+        lo = bisect.bisect_left(weeks, first_week)
+        hi = bisect.bisect_right(weeks, last_week)
 
-        # Get all weeks in quarter
-        current_date = quarter_start
         weekly_summaries = []
+        tasks_by_id = {t.id: t for t in self.task_manager.get_all_tasks()} if lo < hi else {}
 
-        while current_date <= quarter_end:
-            year_week, week_num = get_week_for_date(current_date)
+        for year_week, week_num in weeks[lo:hi]:
             journal = WeeklyJournal(year_week, week_num, self.journal_dir)
+            journal.load(tasks_by_id)
 
-            if journal.exists():
-                tasks_by_id = {t.id: t for t in self.task_manager.get_all_tasks()}
-                journal.load(tasks_by_id)
-
-                if journal.summary:
-                    weekly_summaries.append(journal.summary)
-
-            current_date += timedelta(days=7)
+            if journal.summary:
+                weekly_summaries.append(journal.summary)
 
         # Aggregate stats
         total_completed = set()
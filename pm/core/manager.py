@@ -1,10 +1,12 @@
 """Task manager for CRUD operations."""
 
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 from datetime import datetime
 
 from .task import Task, TaskType, TaskStatus, TaskPriority, CheckFrequency
 from .storage import TaskStorage, JournalStorage
+from .index import TaskIndex
+from ..utils import clock
 from ..utils.config import get_config
 
 
@@ -33,12 +35,12 @@ class TaskManager:
                 storage_mode=self.config.storage_mode
             )
 
-        self._tasks: Dict[str, Task] = {}
+        self._tasks: TaskIndex = TaskIndex()
         self.load_tasks()
 
     def load_tasks(self) -> None:
         """Load all tasks from storage."""
-        self._tasks = self.storage.load_all_tasks()
+        self._tasks = TaskIndex(self.storage.load_all_tasks())
 
     def reload_tasks(self) -> None:
         """Reload tasks from storage (useful after external edits)."""
@@ -63,6 +65,16 @@ class TaskManager:
         """
         return list(self._tasks.values())
 
+    def iter_tasks(self) -> Iterator[Task]:
+        """Iterate over all tasks without building a list.
+
+        Tasks must not be added or removed while iterating.
+
+        Returns:
+            Iterator over all tasks
+        """
+        return iter(self._tasks.values())
+
     def create_task(
         self,
         title: str,
@@ -93,6 +105,57 @@ class TaskManager:
         Returns:
             Created task
         """
+        task = self._new_task(
+            title=title,
+            description=description,
+            task_type=task_type,
+            priority=priority,
+            status=status,
+            check_frequency=check_frequency,
+            eta=eta,
+            notify_at=notify_at,
+            tags=tags,
+            dependencies=dependencies,
+        )
+
+        # Save to storage
+        self._tasks[task.id] = task
+        self.storage.save_task(task)
+
+        return task
+
+    def create_tasks(self, specs: List[Dict[str, Any]]) -> List[Task]:
+        """Create several tasks and save them in one storage call.
+
+        Every task is built before anything is written, so an invalid spec
+        leaves storage untouched.
+
+        Args:
+            specs: Keyword arguments for create_task, one dict per task
+
+        Returns:
+            Created tasks, in the order of specs
+        """
+        tasks = [self._new_task(**spec) for spec in specs]
+        for task in tasks:
+            self._tasks[task.id] = task
+        self.storage.save_tasks(tasks)
+        return tasks
+
+    def _new_task(
+        self,
+        title: str,
+        description: str = "",
+        task_type: Optional[TaskType] = None,
+        priority: Optional[TaskPriority] = None,
+        status: Optional[TaskStatus] = None,
+        check_frequency: Optional[CheckFrequency] = None,
+        eta: Optional[datetime] = None,
+        notify_at: Optional[datetime] = None,
+        tags: Optional[List[str]] = None,
+        dependencies: Optional[List[str]] = None,
+    ) -> Task:
+        """Build a task, filling unset fields from config defaults."""
         # Use defaults from config if not provided
         if task_type is None:
             task_type = TaskType.GENERAL
@@ -106,8 +169,7 @@ class TaskManager:
         if check_frequency is None:
             check_frequency = CheckFrequency(self.config.defaults.check_frequency)
 
-        # Create task
-        task = Task(
+        return Task(
             title=title,
             description=description,
             type=task_type,
@@ -120,12 +182,6 @@ class TaskManager:
             dependencies=dependencies or [],
         )
 
-        # Save to storage
-        self._tasks[task.id] = task
-        self.storage.save_task(task)
-
-        return task
-
     def update_task(
         self,
         task_id: str,
@@ -186,6 +242,7 @@ class TaskManager:
 
         # Update timestamp
         task.updated_at = datetime.now()
+        self._tasks.reindex(task_id)
 
         # Save to storage
         self.storage.save_task(task)
@@ -271,26 +328,20 @@ class TaskManager:
         Returns:
             List of matching tasks
         """
-        tasks = self.get_all_tasks()
-
-        if status:
-            tasks = [t for t in tasks if t.status == status]
-
-        if task_type:
-            tasks = [t for t in tasks if t.type == task_type]
-
-        if priority:
-            tasks = [t for t in tasks if t.priority == priority]
-
-        if tags:
-            tasks = [t for t in tasks if any(tag in t.tags for tag in tags)]
+        if search and not (status or task_type or priority or tags):
+            # Search alone scans the index directly without copying it first
+            return self._tasks.search(search)
+
+        # Intersect attribute postings instead of scanning every task
+        tasks = self._tasks.lookup(
+            status=status.value if status else None,
+            task_type=task_type.value if task_type else None,
+            priority=priority.value if priority else None,
+            tags=tags,
+        )
 
         if search:
-            search_lower = search.lower()
-            tasks = [
-                t for t in tasks
-                if search_lower in t.title.lower() or search_lower in t.description.lower()
-            ]
+            tasks = self._tasks.search(search, tasks)
 
         return tasks
 
@@ -300,7 +351,8 @@ class TaskManager:
         Returns:
             List of overdue tasks
         """
-        return [t for t in self.get_all_tasks() if t.is_overdue()]
+        # ETA index lookup instead of checking every task
+        return self._tasks.overdue(clock.now())
 
     def get_tasks_needing_check(self) -> List[Task]:
         """Get tasks that need status check.
@@ -308,7 +360,8 @@ class TaskManager:
         Returns:
             List of tasks needing check
         """
-        return [t for t in self.get_all_tasks() if t.needs_check()]
+        # Next-check times are precomputed when tasks are indexed
+        return self._tasks.needing_check(clock.now())
 
     def get_tasks_needing_notification(self) -> List[Task]:
         """Get tasks that need notification.
@@ -316,7 +369,33 @@ class TaskManager:
         Returns:
             List of tasks needing notification
         """
-        return [t for t in self.get_all_tasks() if t.needs_notification()]
+        now = clock.now()
+        return [t for t in self.iter_tasks() if t.needs_notification(now)]
+
+    def get_counts(self) -> Dict[str, Any]:
+        """Count tasks by status, priority and type.
+
+        Counts come straight from the index postings, so no task is
+        scanned. Values with no tasks are left out.
+
+        Returns:
+            Dictionary with "total" and "by_status", "by_type",
+            "by_priority" counts keyed by enum value, in enum order
+        """
+        index = self._tasks
+
+        def count(postings: Dict[str, Dict[str, None]], enum_cls) -> Dict[str, int]:
+            return {
+                member.value: len(postings[member.value])
+                for member in enum_cls if member.value in postings
+            }
+
+        return {
+            "total": len(index),
+            "by_status": count(index.by_status, TaskStatus),
+            "by_type": count(index.by_type, TaskType),
+            "by_priority": count(index.by_priority, TaskPriority),
+        }
 
     def get_summary(self) -> Dict:
         """Get summary statistics.
@@ -324,30 +403,13 @@ class TaskManager:
         Returns:
             Dictionary with task counts by status, priority, type
         """
-        tasks = self.get_all_tasks()
+        counts = self.get_counts()
 
-        summary = {
-            "total": len(tasks),
-            "by_status": {},
-            "by_priority": {},
-            "by_type": {},
+        return {
+            "total": counts["total"],
+            "by_status": {s.value: counts["by_status"].get(s.value, 0) for s in TaskStatus},
+            "by_priority": {p.value: counts["by_priority"].get(p.value, 0) for p in TaskPriority},
+            "by_type": {t.value: counts["by_type"].get(t.value, 0) for t in TaskType},
             "overdue": len(self.get_overdue_tasks()),
             "needs_check": len(self.get_tasks_needing_check()),
         }
-
-        # Count by status
-        for status in TaskStatus:
-            count = len([t for t in tasks if t.status == status])
-            summary["by_status"][status.value] = count
-
-        # Count by priority
-        for priority in TaskPriority:
-            count = len([t for t in tasks if t.priority == priority])
-            summary["by_priority"][priority.value] = count
-
-        # Count by type
-        for task_type in TaskType:
-            count = len([t for t in tasks if t.type == task_type])
-            summary["by_type"][task_type.value] = count
-
-        return summary
@@ -1,11 +1,14 @@
 """Storage layer for reading/writing tasks to markdown files."""
 
+import copy
 import frontmatter
 import logging
+import os
 import re
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 from datetime import datetime
 
 from .task import Task, TaskType, TaskStatus, TaskPriority, CheckFrequency
@@ -13,6 +16,67 @@ from .backup import BackupManager
 
 logger = logging.getLogger(__name__)
 
+# Accepted type and priority values for NEW: journal entries
+_TASK_TYPE_VALUES = frozenset(t.value for t in TaskType)
+_TASK_PRIORITY_VALUES = frozenset(p.value for p in TaskPriority)
+# Hints appended to validation errors
+_TASK_TYPES_HINT = "Valid types: " + ", ".join(t.value for t in TaskType)
+_TASK_PRIORITIES_HINT = "Valid priorities: " + ", ".join(p.value for p in TaskPriority)
+
+
+@lru_cache(maxsize=4096)
+def _parse_task_text(text: str) -> Tuple[dict, str, Tuple[str, ...]]:
+    """Parse a task file into frontmatter, description and note lines.
+
+    Results are cached on the file text, so reloading unchanged task files
+    skips the YAML parse. The returned metadata must not be mutated.
+
+    Args:
+        text: Full task file content
+
+    Returns:
+        Tuple of (frontmatter metadata, description, note lines)
+    """
+    post = frontmatter.loads(text)
+
+    # Extract frontmatter data
+    metadata = post.metadata
+    content = post.content
+
+    # Parse description and notes from content
+    description = ""
+    notes = []
+
+    if content.strip():
+        # Normalize content - ensure ## Notes has a newline before it for consistent splitting
+        normalized_content = content
+        if content.strip().startswith("## Notes"):
+            normalized_content = "\n" + content
+
+        sections = normalized_content.split("\n## Notes")
+
+        if sections:
+            # Handle description section (everything before first ## Notes)
+            desc_section = sections[0]
+            if desc_section.strip():
+                if desc_section.strip().startswith("## Description"):
+                    desc_section = desc_section.replace("## Description", "", 1).strip()
+                description = desc_section.strip()
+
+        # Parse all notes sections (handle multiple ## Notes sections from malformed files)
+        if len(sections) > 1:
+            all_note_lines = []
+            for i in range(1, len(sections)):
+                notes_section = sections[i]
+                # Extract lines that start with "-" (bullet points)
+                for line in notes_section.split("\n"):
+                    line = line.strip()
+                    if line and line.startswith("-"):
+                        all_note_lines.append(line)
+            notes = all_note_lines
+
+    return metadata, description, tuple(notes)
+
 
 class TaskStorage:
     """Handles task persistence using markdown files with YAML frontmatter."""
@@ -22,12 +86,17 @@ class TaskStorage:
 
         Args:
             data_dir: Directory where task files are stored
-            storage_mode: 'multi_file' or 'single_file'
+            storage_mode: 'multi_file', 'single_file' or 'memory'
         """
         self.data_dir = Path(data_dir).expanduser()
         self.storage_mode = storage_mode
         self.tasks_dir = self.data_dir / "tasks"
 
+        # Memory mode keeps tasks in this process only and never touches disk
+        self._memory: Dict[str, Task] = {}
+        if storage_mode == "memory":
+            return
+
         # Ensure directories exist
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.tasks_dir.mkdir(parents=True, exist_ok=True)
@@ -40,24 +109,59 @@ class TaskStorage:
         """
         tasks = {}
 
-        if self.storage_mode == "single_file":
+        if self.storage_mode == "memory":
+            tasks = {task_id: copy.deepcopy(task) for task_id, task in self._memory.items()}
+        elif self.storage_mode == "single_file":
             tasks = self._load_from_single_file()
         else:
             tasks = self._load_from_multi_file()
 
         return tasks
 
+    def load_task(self, task_id: str) -> Optional[Task]:
+        """Load a single task from storage.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Task if found and readable, None otherwise
+        """
+        if self.storage_mode == "memory":
+            task = self._memory.get(task_id)
+            return copy.deepcopy(task) if task is not None else None
+        if self.storage_mode == "single_file":
+            return self._load_from_single_file().get(task_id)
+
+        task_file = self.get_task_file_path(task_id)
+        if not task_file.exists():
+            return None
+        try:
+            return self._read_task_file(task_file)
+        except Exception as e:
+            print(f"Warning: Failed to load task from {task_file}: {e}")
+            return None
+
     def _load_from_multi_file(self) -> Dict[str, Task]:
         """Load tasks from individual markdown files."""
         tasks = {}
 
-        for task_file in self.tasks_dir.glob("*.md"):
-            try:
-                task = self._read_task_file(task_file)
-                if task:
-                    tasks[task.id] = task
-            except Exception as e:
-                print(f"Warning: Failed to load task from {task_file}: {e}")
+        try:
+            entries = os.scandir(self.tasks_dir)
+        except FileNotFoundError:
+            return tasks
+
+        # DirEntry caches the file type, so filtering needs no extra stat
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                try:
+                    task = self._read_task_file(entry.path)
+                    if task:
+                        tasks[task.id] = task
+                except Exception as e:
+                    print(f"Warning: Failed to load task from {entry.path}: {e}")
 
         return tasks
 
@@ -89,52 +193,21 @@ class TaskStorage:
 
         return tasks
 
-    def _read_task_file(self, file_path: Path) -> Optional[Task]:
+    def _read_task_file(self, file_path: Union[str, Path]) -> Optional[Task]:
         """Read a single task file."""
-        post = frontmatter.load(file_path)
-
-        # Extract frontmatter data
-        metadata = post.metadata
-        content = post.content
-
-        # Parse description and notes from content
-        description = ""
-        notes = []
-
-        if content.strip():
-            # Normalize content - ensure ## Notes has a newline before it for consistent splitting
-            normalized_content = content
-            if content.strip().startswith("## Notes"):
-                normalized_content = "\n" + content
-
-            sections = normalized_content.split("\n## Notes")
-
-            if sections:
-                # Handle description section (everything before first ## Notes)
-                desc_section = sections[0]
-                if desc_section.strip():
-                    if desc_section.strip().startswith("## Description"):
-                        desc_section = desc_section.replace("## Description", "", 1).strip()
-                    description = desc_section.strip()
-
-            # Parse all notes sections (handle multiple ## Notes sections from malformed files)
-            if len(sections) > 1:
-                all_note_lines = []
-                for i in range(1, len(sections)):
-                    notes_section = sections[i]
-                    # Extract lines that start with "-" (bullet points)
-                    for line in notes_section.split("\n"):
-                        line = line.strip()
-                        if line and line.startswith("-"):
-                            all_note_lines.append(line)
-                notes = all_note_lines
-
-        # Add parsed content to metadata
-        metadata["description"] = description
-        metadata["notes"] = notes
+        with open(file_path, encoding="utf-8") as f:
+            metadata, description, notes = _parse_task_text(f.read())
+
+        # The parse is cached and shared, so copy anything Task would keep
+        data = {
+            key: value.copy() if isinstance(value, (list, dict)) else value
+            for key, value in metadata.items()
+        }
+        data["description"] = description
+        data["notes"] = notes
 
         # Create task from metadata
-        return Task.from_dict(metadata)
+        return Task.from_dict(data)
 
     def _parse_task_section(self, section: str) -> Optional[Task]:
         """Parse a task from a section in single-file mode."""
@@ -148,11 +221,28 @@ class TaskStorage:
         Args:
             task: Task to save
         """
-        if self.storage_mode == "single_file":
+        if self.storage_mode == "memory":
+            self._save_to_memory(task)
+        elif self.storage_mode == "single_file":
             self._save_to_single_file(task)
         else:
             self._save_to_multi_file(task)
 
+    def save_tasks(self, tasks: List[Task]) -> None:
+        """Save several tasks to storage in one call.
+
+        Args:
+            tasks: Tasks to save
+        """
+        if self.storage_mode == "memory":
+            save = self._save_to_memory
+        elif self.storage_mode == "single_file":
+            save = self._save_to_single_file
+        else:
+            save = self._save_to_multi_file
+        for task in tasks:
+            save(task)
+
     def _save_to_multi_file(self, task: Task) -> None:
         """Save task to individual markdown file."""
         file_path = self.tasks_dir / f"{task.id}.md"
@@ -186,11 +276,23 @@ class TaskStorage:
         with open(file_path, "w") as f:
             f.write(frontmatter.dumps(post))
 
+    def _save_to_memory(self, task: Task) -> None:
+        """Save a copy of the task in memory."""
+        self._memory[task.id] = copy.deepcopy(task)
+
     def _save_to_single_file(self, task: Task) -> None:
         """Save task to single tasks.md file."""
         # Not implementing fully for now - focus on multi_file mode
         pass
 
+    def clear_memory(self) -> None:
+        """Drop every task held in memory.
+
+        Only affects storage_mode="memory"; file-backed modes keep nothing
+        in memory, so this is a no-op for them.
+        """
+        self._memory.clear()
+
     def delete_task(self, task_id: str) -> bool:
         """Delete a task from storage.
 
@@ -200,7 +302,9 @@ class TaskStorage:
         Returns:
             True if deleted, False if not found
         """
-        if self.storage_mode == "single_file":
+        if self.storage_mode == "memory":
+            return self._memory.pop(task_id, None) is not None
+        elif self.storage_mode == "single_file":
             return self._delete_from_single_file(task_id)
         else:
             return self._delete_from_multi_file(task_id)
@@ -243,6 +347,8 @@ class TaskStorage:
         Returns:
             True if task exists
         """
+        if self.storage_mode == "memory":
+            return task_id in self._memory
         return self.get_task_file_path(task_id).exists()
 
 
@@ -268,6 +374,12 @@ class JournalStorage:
         re.MULTILINE
     )
 
+    # Checkbox state and task ID only; the title is not needed for those
+    CHECKBOX_STATE_PATTERN = re.compile(r'- \[([ x])\] (task-[a-f0-9]+):')
+
+    # Any NEW: line, well-formed or not, so malformed entries can be reported
+    NEW_ENTRY_LINE_PATTERN = re.compile(r'- \[ \] NEW:\s*(.+)$', re.MULTILINE)
+
     def __init__(
         self,
         data_dir: str,
@@ -345,8 +457,7 @@ class JournalStorage:
         Returns:
             Task if found, None otherwise
         """
-        tasks = self._task_storage.load_all_tasks()
-        return tasks.get(task_id)
+        return self._task_storage.load_task(task_id)
 
     def detect_new_tasks(self, content: str) -> Tuple[List[Dict], List[str]]:
         """Find NEW: entries in daily sections.
@@ -360,12 +471,14 @@ class JournalStorage:
         new_tasks = []
         errors = []
 
-        # Also look for malformed NEW: entries to report errors
-        malformed_pattern = re.compile(r'- \[ \] NEW:\s*(.+)$', re.MULTILINE)
+        # Line numbers are counted incrementally from the previous match
+        line_num = 1
+        counted_to = 0
 
-        for match in malformed_pattern.finditer(content):
+        for match in self.NEW_ENTRY_LINE_PATTERN.finditer(content):
             line = match.group(0)
-            line_num = content[:match.start()].count('\n') + 1
+            line_num += content.count('\n', counted_to, match.start())
+            counted_to = match.start()
 
             # Check if it matches the proper format
             proper_match = self.NEW_TASK_PATTERN.match(line)
@@ -376,20 +489,16 @@ class JournalStorage:
                 priority = proper_match.group(3).strip().lower()
 
                 # Validate task type
-                valid_types = [t.value for t in TaskType]
-                if task_type not in valid_types:
+                if task_type not in _TASK_TYPE_VALUES:
                     errors.append(
-                        f"Line {line_num}: Invalid task type '{task_type}'. "
-                        f"Valid types: {', '.join(valid_types)}"
+                        f"Line {line_num}: Invalid task type '{task_type}'. " + _TASK_TYPES_HINT
                     )
                     continue
 
                 # Validate priority
-                valid_priorities = [p.value for p in TaskPriority]
-                if priority not in valid_priorities:
+                if priority not in _TASK_PRIORITY_VALUES:
                     errors.append(
-                        f"Line {line_num}: Invalid priority '{priority}'. "
-                        f"Valid priorities: {', '.join(valid_priorities)}"
+                        f"Line {line_num}: Invalid priority '{priority}'. " + _TASK_PRIORITIES_HINT
                     )
                     continue
 
@@ -420,10 +529,7 @@ class JournalStorage:
         Returns:
             Set of task IDs found in journal
         """
-        task_ids = set()
-        for match in self.CHECKBOX_PATTERN.finditer(content):
-            task_ids.add(match.group(2))
-        return task_ids
+        return {task_id for _, task_id in self.CHECKBOX_STATE_PATTERN.findall(content)}
 
     def detect_deleted_tasks(
         self,
@@ -455,14 +561,10 @@ class JournalStorage:
         Returns:
             Dictionary mapping task IDs to checked status
         """
-        checkboxes = {}
-
-        for match in self.CHECKBOX_PATTERN.finditer(content):
-            is_checked = match.group(1) == 'x'
-            task_id = match.group(2)
-            checkboxes[task_id] = is_checked
-
-        return checkboxes
+        return {
+            task_id: mark == 'x'
+            for mark, task_id in self.CHECKBOX_STATE_PATTERN.findall(content)
+        }
 
     def save_task(self, task: Task, year: int = None, week: int = None) -> None:
         """Save a task to the task files.
@@ -474,6 +576,14 @@ class JournalStorage:
         """
         self._task_storage.save_task(task)
 
+    def save_tasks(self, tasks: List[Task]) -> None:
+        """Save several tasks to the task files.
+
+        Args:
+            tasks: Tasks to save
+        """
+        self._task_storage.save_tasks(tasks)
+
     def delete_task(self, task_id: str) -> bool:
         """Delete a task from task files.
 
@@ -503,8 +613,10 @@ class JournalStorage:
         for error in errors:
             logger.warning(error)
 
-        # Process in reverse order to maintain string positions
-        for entry in reversed(new_entries):
+        # Splice replacements in one pass; entries are in content order
+        pieces = []
+        position = 0
+        for entry in new_entries:
             try:
                 # Create new task
                 task = Task(
@@ -520,11 +632,9 @@ class JournalStorage:
 
                 # Replace NEW: line with proper task reference
                 new_line = f"- [ ] {task.id}: {task.title} ({task.type.value}, {task.priority.value})"
-                content = (
-                    content[:entry["match_start"]] +
-                    new_line +
-                    content[entry["match_end"]:]
-                )
+                pieces.append(content[position:entry["match_start"]])
+                pieces.append(new_line)
+                position = entry["match_end"]
 
                 logger.info(f"Created task {task.id}: {task.title}")
 
@@ -534,7 +644,8 @@ class JournalStorage:
                 errors.append(error_msg)
                 logger.error(error_msg)
 
-        # Reverse to maintain creation order
-        created_tasks.reverse()
+        if pieces:
+            pieces.append(content[position:])
+            content = "".join(pieces)
 
         return content, created_tasks, errors
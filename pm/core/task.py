@@ -1,7 +1,7 @@
 """Task data model for the PM app."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import List, Optional
 import uuid
@@ -41,7 +41,16 @@ class CheckFrequency(str, Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+# Time between status checks; CUSTOM has no fixed interval
+CHECK_INTERVALS = {
+    CheckFrequency.DAILY: timedelta(days=1),
+    CheckFrequency.WEEKLY: timedelta(days=7),
+    CheckFrequency.BIWEEKLY: timedelta(days=14),
+    CheckFrequency.MONTHLY: timedelta(days=30),
+}
+
+
+@dataclass(slots=True)
 class Note:
     """A timestamped note for a task."""
     timestamp: datetime
@@ -68,7 +77,7 @@ class Note:
             return cls(timestamp=datetime.now(), content=note_str)
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Task data model."""
 
@@ -103,40 +112,49 @@ class Task:
         self.notes.append(note)
         self.updated_at = datetime.now()
 
-    def is_overdue(self) -> bool:
-        """Check if task is past its ETA."""
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
+        """Check if task is past its ETA.
+
+        Args:
+            now: Time to compare against (defaults to the current time)
+        """
         if self.eta is None or self.status == TaskStatus.DONE:
             return False
-        return datetime.now() > self.eta
+        return (now or datetime.now()) > self.eta
 
-    def needs_check(self) -> bool:
-        """Determine if task needs status check based on check_frequency."""
-        if self.status == TaskStatus.DONE:
-            return False
+    @property
+    def next_check_at(self) -> Optional[datetime]:
+        """Time the next status check is due, or None if never due.
 
+        Never-checked tasks are due immediately (``datetime.min``).
+        """
+        if self.status == TaskStatus.DONE:
+            return None
         if self.last_checked is None:
-            return True
-
-        now = datetime.now()
-        delta = now - self.last_checked
-
-        frequency_days = {
-            CheckFrequency.DAILY: 1,
-            CheckFrequency.WEEKLY: 7,
-            CheckFrequency.BIWEEKLY: 14,
-            CheckFrequency.MONTHLY: 30,
-        }
-
-        if self.check_frequency in frequency_days:
-            return delta.days >= frequency_days[self.check_frequency]
-
-        return False
-
-    def needs_notification(self) -> bool:
-        """Check if notification should be sent."""
+            return datetime.min
+        interval = CHECK_INTERVALS.get(self.check_frequency)
+        if interval is None:
+            return None
+        return self.last_checked + interval
+
+    def needs_check(self, now: Optional[datetime] = None) -> bool:
+        """Determine if task needs status check based on check_frequency.
+
+        Args:
+            now: Time to compare against (defaults to the current time)
+        """
+        next_check = self.next_check_at
+        return next_check is not None and (now or datetime.now()) >= next_check
+
+    def needs_notification(self, now: Optional[datetime] = None) -> bool:
+        """Check if notification should be sent.
+
+        Args:
+            now: Time to compare against (defaults to the current time)
+        """
         if self.notify_at is None or self.status == TaskStatus.DONE:
             return False
-        return datetime.now() >= self.notify_at
+        return (now or datetime.now()) >= self.notify_at
 
     def mark_checked(self) -> None:
         """Mark task as checked now."""
@@ -1,5 +1,6 @@
 """Serializers for converting PM objects to JSON-safe dictionaries."""
 
+import operator
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -21,6 +22,14 @@ def serialize_datetime(dt: Optional[datetime]) -> Optional[str]:
     return dt.isoformat()
 
 
+# Reads every serialized Task attribute in a single call
+_task_fields = operator.attrgetter(
+    "id", "title", "description", "type", "status", "priority", "check_frequency",
+    "created_at", "updated_at", "eta", "last_checked", "notify_at",
+    "tags", "dependencies", "notes",
+)
+
+
 def serialize_task(task: Task) -> Dict[str, Any]:
     """Serialize a Task object to JSON-safe dictionary.
 
@@ -30,22 +39,27 @@ def serialize_task(task: Task) -> Dict[str, Any]:
     Returns:
         Dictionary representation of the task
     """
+    (
+        task_id, title, description, task_type, status, priority, check_frequency,
+        created_at, updated_at, eta, last_checked, notify_at,
+        tags, dependencies, notes,
+    ) = _task_fields(task)
     return {
-        "id": task.id,
-        "title": task.title,
-        "description": task.description,
-        "type": task.type.value,
-        "status": task.status.value,
-        "priority": task.priority.value,
-        "check_frequency": task.check_frequency.value,
-        "created_at": serialize_datetime(task.created_at),
-        "updated_at": serialize_datetime(task.updated_at),
-        "eta": serialize_datetime(task.eta),
-        "last_checked": serialize_datetime(task.last_checked),
-        "notify_at": serialize_datetime(task.notify_at),
-        "tags": task.tags,
-        "dependencies": task.dependencies,
-        "notes": [str(note) for note in task.notes],
+        "id": task_id,
+        "title": title,
+        "description": description,
+        "type": task_type.value,
+        "status": status.value,
+        "priority": priority.value,
+        "check_frequency": check_frequency.value,
+        "created_at": created_at.isoformat() if created_at is not None else None,
+        "updated_at": updated_at.isoformat() if updated_at is not None else None,
+        "eta": eta.isoformat() if eta is not None else None,
+        "last_checked": last_checked.isoformat() if last_checked is not None else None,
+        "notify_at": notify_at.isoformat() if notify_at is not None else None,
+        "tags": tags,
+        "dependencies": dependencies,
+        "notes": [str(note) for note in notes],
     }
 
 
@@ -58,7 +72,7 @@ def serialize_task_list(tasks: List[Task]) -> List[Dict[str, Any]]:
     Returns:
         List of serialized task dictionaries
     """
-    return [serialize_task(task) for task in tasks]
+    return list(map(serialize_task, tasks))
 
 
 def serialize_day_section(day: DaySection) -> Dict[str, Any]:
@@ -4,9 +4,17 @@ Exposes task management, queries, and journal operations via Model Context Proto
 """
 
 import asyncio
+import json
 import logging
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -14,6 +22,7 @@ from mcp.types import Tool, TextContent
 from .tools import (
     # Task management
     create_task,
+    create_tasks_bulk,
     list_tasks,
     get_task,
     update_task,
@@ -38,6 +47,14 @@ from .tools import (
     restore_journal_backup,
 )
 
+
+def _dumps(result: Any) -> str:
+    """Encode a tool result as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(result, indent=2)
+
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -47,43 +64,66 @@ logger = logging.getLogger(__name__)
 app = Server("pm-app")
 
 
+# Fields accepted by create_task and by each create_tasks_bulk entry
+_CREATE_TASK_PROPERTIES = {
+    "title": {"type": "string", "description": "Task title (required)"},
+    "description": {"type": "string", "description": "Task description"},
+    "task_type": {
+        "type": "string",
+        "enum": ["dat_ticket", "cross_team", "project", "training_run", "general"],
+        "description": "Type of task",
+    },
+    "priority": {
+        "type": "string",
+        "enum": ["high", "medium", "low"],
+        "description": "Task priority",
+    },
+    "status": {
+        "type": "string",
+        "enum": ["todo", "in_progress", "waiting", "blocked", "done"],
+        "description": "Task status",
+    },
+    "check_frequency": {
+        "type": "string",
+        "enum": ["daily", "weekly", "biweekly", "monthly"],
+        "description": "How often to check on this task",
+    },
+    "eta": {"type": "string", "description": "Expected completion time (ISO datetime format)"},
+    "notify_at": {"type": "string", "description": "When to send notification (ISO datetime format)"},
+    "tags": {"type": "array", "items": {"type": "string"}, "description": "Task tags"},
+    "dependencies": {"type": "array", "items": {"type": "string"}, "description": "Task IDs this task depends on"},
+}
+
 # Tool definitions with JSON schemas
-TOOLS = [
+TOOLS: tuple[Tool, ...] = (
     # Task Management Tools
     Tool(
         name="create_task",
         description="Create a new task in the PM system with title, description, type, priority, status, and optional metadata like tags and dependencies",
+        inputSchema={
+            "type": "object",
+            "properties": _CREATE_TASK_PROPERTIES,
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="create_tasks_bulk",
+        description="Create several tasks at once; each entry takes the same fields as create_task",
         inputSchema={
             "type": "object",
             "properties": {
-                "title": {"type": "string", "description": "Task title (required)"},
-                "description": {"type": "string", "description": "Task description"},
-                "task_type": {
-                    "type": "string",
-                    "enum": ["dat_ticket", "cross_team", "project", "training_run", "general"],
-                    "description": "Type of task",
-                },
-                "priority": {
-                    "type": "string",
-                    "enum": ["high", "medium", "low"],
-                    "description": "Task priority",
-                },
-                "status": {
-                    "type": "string",
-                    "enum": ["todo", "in_progress", "waiting", "blocked", "done"],
-                    "description": "Task status",
+                "tasks": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": _CREATE_TASK_PROPERTIES,
+                        "required": ["title"],
+                        "additionalProperties": False,
+                    },
+                    "description": "Tasks to create",
                 },
-                "check_frequency": {
-                    "type": "string",
-                    "enum": ["daily", "weekly", "biweekly", "monthly"],
-                    "description": "How often to check on this task",
-                },
-                "eta": {"type": "string", "description": "Expected completion time (ISO datetime format)"},
-                "notify_at": {"type": "string", "description": "When to send notification (ISO datetime format)"},
-                "tags": {"type": "array", "items": {"type": "string"}, "description": "Task tags"},
-                "dependencies": {"type": "array", "items": {"type": "string"}, "description": "Task IDs this task depends on"},
             },
-            "required": ["title"],
+            "required": ["tasks"],
         },
     ),
     Tool(
@@ -264,12 +304,17 @@ TOOLS = [
             "required": ["backup_path"],
         },
     ),
-]
+)
+
+
+# The framework expects a list; build it once and hand out the same object
+_TOOLS_LIST: list[Tool] = list(TOOLS)
 
 
 # Map tool names to functions
 TOOL_HANDLERS = {
     "create_task": create_task,
+    "create_tasks_bulk": create_tasks_bulk,
     "list_tasks": list_tasks,
     "get_task": get_task,
     "update_task": update_task,
@@ -291,29 +336,43 @@ TOOL_HANDLERS = {
     "restore_journal_backup": restore_journal_backup,
 }
 
+# Input schema validators, compiled once instead of on every call
+_VALIDATORS = {
+    tool.name: validator_for(tool.inputSchema)(tool.inputSchema)
+    for tool in TOOLS
+}
+
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """List available tools."""
-    return TOOLS
+    return _TOOLS_LIST
 
 
-@app.call_tool()
+# Arguments are validated against the precompiled validators below
+@app.call_tool(validate_input=False)
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Call a tool with the given arguments."""
-    logger.info(f"Calling tool: {name} with args: {arguments}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Calling tool: {name} with args: {arguments}")
 
-    if name not in TOOL_HANDLERS:
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
 
+    validator = _VALIDATORS.get(name)
+    if validator is not None:
+        try:
+            validator.validate(arguments)
+        except ValidationError as e:
+            return [TextContent(type="text", text=f"Error: Invalid arguments: {e.message}")]
+
     try:
         # Call the tool function
-        handler = TOOL_HANDLERS[name]
         result = handler(**arguments)
 
         # Format result as JSON string
-        import json
-        result_text = json.dumps(result, indent=2)
+        result_text = _dumps(result)
 
         return [TextContent(type="text", text=result_text)]
 
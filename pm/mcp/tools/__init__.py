@@ -4,6 +4,7 @@ from .sync_helper import sync_before_read, sync_before_write, SyncError
 
 from .task_tools import (
     create_task,
+    create_tasks_bulk,
     list_tasks,
     get_task,
     update_task,
@@ -32,8 +33,9 @@ from .journal_tools import (
 )
 
 __all__ = [
-    # Task management tools (8)
+    # Task management tools (9)
     "create_task",
+    "create_tasks_bulk",
     "list_tasks",
     "get_task",
     "update_task",
@@ -0,0 +1,121 @@
+"""Shared manager instances for MCP tools."""
+
+import threading
+import time
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ...core.manager import TaskManager
+from ...core.journal_manager import JournalManager
+from ...utils.config import get_config
+from .read_cache import MTIME_SETTLE_SECONDS, dir_stamp, file_stamp
+
+_lock = threading.Lock()
+# Config values -> (TaskManager, JournalManager)
+_managers: Dict[tuple, Tuple[TaskManager, JournalManager]] = {}
+# Keep only a few configurations alive (tests switch data dirs often)
+_MAX_MANAGERS = 4
+# Config values -> stamp of the task files when tasks were last loaded
+_loaded_stamps: Dict[tuple, tuple] = {}
+# Managers bound to the current context, used instead of the shared ones
+_bound: ContextVar[Optional[Tuple[TaskManager, JournalManager]]] = ContextVar(
+    "pm_mcp_managers", default=None
+)
+
+
+def bind_managers(task_manager: TaskManager, journal_manager: JournalManager) -> Token:
+    """Make tools in the current context use the given managers.
+
+    Args:
+        task_manager: TaskManager to hand to tools
+        journal_manager: JournalManager built on ``task_manager``
+
+    Returns:
+        Token to pass to ``unbind_managers``
+    """
+    return _bound.set((task_manager, journal_manager))
+
+
+def unbind_managers(token: Token) -> None:
+    """Restore the managers bound before ``bind_managers`` was called.
+
+    Args:
+        token: Token returned by ``bind_managers``
+    """
+    _bound.reset(token)
+
+
+def _tasks_stamp(data_path: Path) -> tuple:
+    """Stamp the files tasks are loaded from."""
+    return dir_stamp(data_path / "tasks"), file_stamp(data_path / "tasks.md")
+
+
+def _record_load(key: tuple, stamp: tuple, taken_at: float) -> None:
+    """Remember the task files stamp taken before a load, if it can be trusted.
+
+    Args:
+        key: Config key of the managers
+        stamp: Stamp of the task files taken before the load
+        taken_at: Wall-clock time the stamp was taken
+    """
+    newest = max(stamp[0][1], stamp[1][0] if stamp[1] else 0) / 1e9
+    if newest < taken_at - MTIME_SETTLE_SECONDS:
+        _loaded_stamps[key] = stamp
+    else:
+        _loaded_stamps.pop(key, None)
+
+
+def mark_tasks_stale() -> None:
+    """Force the next get_managers call to reload tasks from storage."""
+    with _lock:
+        _loaded_stamps.clear()
+
+
+def get_managers() -> Tuple[TaskManager, JournalManager]:
+    """Get the task and journal managers for the current config.
+
+    The managers are built once per configuration and reused across tool
+    calls. Tasks are reloaded from storage whenever the task files have
+    changed since the last load, so edits made outside the server are
+    picked up.
+
+    Managers bound with ``bind_managers`` take precedence.
+
+    Returns:
+        Tuple of (TaskManager, JournalManager)
+    """
+    bound = _bound.get()
+    if bound is not None:
+        bound[0].reload_tasks()
+        return bound
+
+    config = get_config()
+    key = (
+        str(config.data_path),
+        config.storage_mode,
+        config.backup.enabled,
+        config.backup.max_backups_per_week,
+        config.backup.retention_days,
+    )
+
+    with _lock:
+        # Stamp before loading so an edit made during the load shows up as
+        # a change on the next call
+        taken_at = time.time()
+        stamp = _tasks_stamp(config.data_path)
+        managers = _managers.get(key)
+        if managers is None:
+            task_manager = TaskManager()
+            managers = (task_manager, JournalManager(task_manager))
+            if len(_managers) >= _MAX_MANAGERS:
+                _managers.clear()
+                _loaded_stamps.clear()
+            _managers[key] = managers
+        elif _loaded_stamps.get(key) != stamp:
+            managers[0].reload_tasks()
+        else:
+            return managers
+        _record_load(key, stamp, taken_at)
+
+    return managers
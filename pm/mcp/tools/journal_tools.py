@@ -1,16 +1,56 @@
 """MCP tools for journal management."""
 
+import re
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-from ...core.manager import TaskManager
-from ...core.journal_manager import JournalManager
 from ...core.backup import BackupManager
+from ...core.journal_manager import JournalManager
+from ...utils import clock
 from ...utils.config import get_config
 from ..serializers import serialize_day_section, serialize_weekly_summary
+from ._managers import get_managers
+from .read_cache import cached_read, invalidates_read_cache
+
+# Calendar month (1-12) -> quarter; index 0 is unused
+_MONTH_TO_QUARTER = (0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4)
+_VALID_QUARTERS = frozenset({1, 2, 3, 4})
+
+# Backup week directory name, e.g. "2026-W02"
+_WEEK_RE = re.compile(r"^(\d{4})-W(\d{2})$")
+
+
+@lru_cache(maxsize=8)
+def _cached_backup_manager(
+    backup_dir: Path,
+    max_backups_per_week: int,
+    retention_days: int,
+) -> BackupManager:
+    """Build a BackupManager once per distinct backup configuration."""
+    return BackupManager(
+        backup_dir=backup_dir,
+        max_backups_per_week=max_backups_per_week,
+        retention_days=retention_days,
+    )
 
 
+def _get_backup_manager() -> BackupManager:
+    """Get the shared BackupManager for the current config.
+
+    Keyed on the config values, so a changed data directory or retention
+    setting yields a fresh manager.
+    """
+    config = get_config()
+    return _cached_backup_manager(
+        config.data_path / "backups",
+        config.backup.max_backups_per_week,
+        config.backup.retention_days,
+    )
+
+
+@invalidates_read_cache
 def start_journal_day() -> Dict[str, Any]:
     """Start a new journal day.
 
@@ -20,8 +60,7 @@ def start_journal_day() -> Dict[str, Any]:
     Returns:
         Dictionary with journal path, day name, and planned tasks
     """
-    task_manager = TaskManager()
-    journal_manager = JournalManager(task_manager)
+    _, journal_manager = get_managers()
 
     # Start today's journal - returns DaySection
     day_section = journal_manager.start_day()
@@ -36,6 +75,7 @@ def start_journal_day() -> Dict[str, Any]:
     }
 
 
+@invalidates_read_cache
 def end_journal_day() -> Dict[str, Any]:
     """End the current journal day.
 
@@ -45,8 +85,7 @@ def end_journal_day() -> Dict[str, Any]:
     Returns:
         Dictionary with day name and completed task IDs
     """
-    task_manager = TaskManager()
-    journal_manager = JournalManager(task_manager)
+    _, journal_manager = get_managers()
 
     # End today's journal - returns DaySection or None
     day_section = journal_manager.end_day()
@@ -64,18 +103,29 @@ def get_current_journal() -> Dict[str, Any]:
     Returns:
         Dictionary with journal path and content (full markdown)
     """
-    task_manager = TaskManager()
-    journal_manager = JournalManager(task_manager)
+    _, journal_manager = get_managers()
 
-    # Get current journal
-    now = datetime.now()
-    journal = journal_manager.get_journal_for_date(now)
-    journal_path = journal.get_file_path()
+    # Create the journal if it doesn't exist yet
+    journal = journal_manager.get_journal_for_date(datetime.now())
+    if not journal.get_file_path().exists():
+        _create_current_journal(journal_manager)
+
+    return _read_current_journal()
+
+
+@invalidates_read_cache
+def _create_current_journal(journal_manager: JournalManager) -> None:
+    """Start today's section, creating the current week's journal file."""
+    journal_manager.start_day()
 
-    # Read journal content (create if doesn't exist)
-    if not journal_path.exists():
-        journal_manager.start_day()
 
+@cached_read()
+def _read_current_journal() -> Dict[str, Any]:
+    """Read the current week's journal without creating it."""
+    _, journal_manager = get_managers()
+
+    journal = journal_manager.get_journal_for_date(datetime.now())
+    journal_path = journal.get_file_path()
     content = journal_path.read_text() if journal_path.exists() else ""
 
     return {
@@ -86,6 +136,7 @@ def get_current_journal() -> Dict[str, Any]:
     }
 
 
+@invalidates_read_cache
 def sync_journal() -> Dict[str, Any]:
     """Sync journal with task system (bidirectional).
 
@@ -105,8 +156,7 @@ def sync_journal() -> Dict[str, Any]:
         - deleted_ids: List of deleted task IDs
         - updated_ids: List of task IDs with status changes
     """
-    task_manager = TaskManager()
-    journal_manager = JournalManager(task_manager)
+    _, journal_manager = get_managers()
 
     # Sync current journal (returns detailed results)
     result = journal_manager.sync_journal()
@@ -126,6 +176,7 @@ def sync_journal() -> Dict[str, Any]:
     }
 
 
+@invalidates_read_cache
 def generate_week_summary() -> Dict[str, Any]:
     """Generate summary for the current week.
 
@@ -135,8 +186,7 @@ def generate_week_summary() -> Dict[str, Any]:
     Returns:
         Serialized weekly summary dictionary
     """
-    task_manager = TaskManager()
-    journal_manager = JournalManager(task_manager)
+    _, journal_manager = get_managers()
 
     # Generate summary for current week (no notes parameter)
     summary = journal_manager.generate_week_summary()
@@ -144,6 +194,7 @@ def generate_week_summary() -> Dict[str, Any]:
     return serialize_weekly_summary(summary)
 
 
+@cached_read()
 def get_quarterly_summary(
     year: Optional[int] = None,
     quarter: Optional[int] = None,
@@ -163,20 +214,19 @@ def get_quarterly_summary(
         ValueError: If quarter is not 1-4 or year is invalid
     """
     # Default to current quarter
-    now = datetime.now()
+    now = clock.now()
     if year is None:
         year = now.year
     if quarter is None:
-        quarter = (now.month - 1) // 3 + 1
+        quarter = _MONTH_TO_QUARTER[now.month]
 
     # Validate inputs
-    if not 1 <= quarter <= 4:
+    if quarter not in _VALID_QUARTERS:
         raise ValueError(f"Quarter must be 1-4, got {quarter}")
     if year < 2000 or year > 2100:
         raise ValueError(f"Year must be between 2000-2100, got {year}")
 
-    task_manager = TaskManager()
-    journal_manager = JournalManager(task_manager)
+    _, journal_manager = get_managers()
 
     # Get quarterly summary
     summary_data = journal_manager.get_quarterly_summary(year, quarter)
@@ -214,18 +264,8 @@ def list_journal_backups(
     if week is None:
         week = now.isocalendar()[1]
 
-    # Get config and initialize backup manager
-    config = get_config()
-    backup_dir = config.data_path / "backups"
-
-    backup_manager = BackupManager(
-        backup_dir=backup_dir,
-        max_backups_per_week=config.backup.max_backups_per_week,
-        retention_days=config.backup.retention_days,
-    )
-
     # Get backups for the week
-    backups = backup_manager.list_backups(year, week)
+    backups = _get_backup_manager().list_backups(year, week)
 
     return {
         "year": year,
@@ -235,6 +275,7 @@ def list_journal_backups(
     }
 
 
+@invalidates_read_cache
 def restore_journal_backup(backup_path: str) -> Dict[str, Any]:
     """Restore a journal from a backup file.
 
@@ -263,27 +304,18 @@ def restore_journal_backup(backup_path: str) -> Dict[str, Any]:
     week_str = backup_file.parent.name  # e.g., "2026-W02"
 
     # Parse year and week
-    try:
-        parts = week_str.split("-W")
-        year = int(parts[0])
-        week = int(parts[1])
-    except (ValueError, IndexError):
+    match = _WEEK_RE.match(week_str)
+    if not match:
         raise ValueError(f"Invalid backup path format: {backup_path}")
+    year, week = int(match.group(1)), int(match.group(2))
 
     # Get config and paths
     config = get_config()
     journal_dir = config.data_path / "journal"
     journal_path = journal_dir / f"{week_str}.md"
-    backup_dir = config.data_path / "backups"
-
-    backup_manager = BackupManager(
-        backup_dir=backup_dir,
-        max_backups_per_week=config.backup.max_backups_per_week,
-        retention_days=config.backup.retention_days,
-    )
 
     # Restore from backup (creates backup of current state first)
-    current_backup = backup_manager.restore_backup(backup_file, journal_path)
+    current_backup = _get_backup_manager().restore_backup(backup_file, journal_path)
 
     return {
         "restored_from": str(backup_file),
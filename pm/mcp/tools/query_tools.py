@@ -4,41 +4,53 @@ from typing import Dict, Any, List
 
 from ...core.manager import TaskManager
 from ..serializers import serialize_task_list
-from .sync_helper import sync_before_read
+from .sync_helper import mcp_read_tool
+from .read_cache import cached_read
 
 
-def get_overdue_tasks() -> List[Dict[str, Any]]:
+@cached_read()
+@mcp_read_tool
+def get_overdue_tasks(manager: TaskManager) -> List[Dict[str, Any]]:
     """Get all overdue tasks.
 
     Returns tasks that are past their ETA and not yet done.
 
+    Args:
+        manager: Synced TaskManager (supplied by mcp_read_tool)
+
     Returns:
         List of serialized overdue task dictionaries
     """
-    # Auto-sync journal before read operation
-    manager = sync_before_read()
     tasks = manager.get_overdue_tasks()
     return serialize_task_list(tasks)
 
 
-def get_tasks_needing_check() -> List[Dict[str, Any]]:
+@cached_read()
+@mcp_read_tool
+def get_tasks_needing_check(manager: TaskManager) -> List[Dict[str, Any]]:
     """Get tasks that need periodic check.
 
     Returns tasks that are due for their periodic check based on
     their check_frequency and last_checked timestamp.
 
+    Args:
+        manager: Synced TaskManager (supplied by mcp_read_tool)
+
     Returns:
         List of serialized task dictionaries needing check
     """
-    # Auto-sync journal before read operation
-    manager = sync_before_read()
     tasks = manager.get_tasks_needing_check()
     return serialize_task_list(tasks)
 
 
-def get_task_summary() -> Dict[str, Any]:
+@cached_read()
+@mcp_read_tool
+def get_task_summary(manager: TaskManager) -> Dict[str, Any]:
     """Get summary statistics of all tasks.
 
+    Args:
+        manager: Synced TaskManager (supplied by mcp_read_tool)
+
     Returns:
         Dictionary with task counts by status, type, and priority:
         {
@@ -48,35 +60,21 @@ def get_task_summary() -> Dict[str, Any]:
             "by_priority": {"high": int, "medium": int, "low": int}
         }
     """
-    # Auto-sync journal before read operation
-    manager = sync_before_read()
-    summary = manager.get_summary()
-
-    # Filter out zero counts for cleaner output
-    by_status = {k: v for k, v in summary["by_status"].items() if v > 0}
-    by_type = {k: v for k, v in summary["by_type"].items() if v > 0}
-    by_priority = {k: v for k, v in summary["by_priority"].items() if v > 0}
+    # Zero counts are already left out for cleaner output
+    return manager.get_counts()
 
-    return {
-        "total": summary["total"],
-        "by_status": by_status,
-        "by_type": by_type,
-        "by_priority": by_priority,
-    }
 
-
-def search_tasks(query: str) -> List[Dict[str, Any]]:
+@mcp_read_tool
+def search_tasks(manager: TaskManager, query: str) -> List[Dict[str, Any]]:
     """Search tasks by keyword in title or description.
 
     Args:
+        manager: Synced TaskManager (supplied by mcp_read_tool)
         query: Search query string
 
     Returns:
         List of serialized task dictionaries matching the query
     """
-    # Auto-sync journal before read operation
-    manager = sync_before_read()
-
     # Use filter_tasks with search parameter
     tasks = manager.filter_tasks(search=query)
 
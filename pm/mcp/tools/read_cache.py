@@ -0,0 +1,191 @@
+"""Result cache for read-only MCP tools.
+
+Read tools sync the journal and reload every task file before answering.
+When nothing on disk has changed, that work produces the same result, so
+read results are memoized for a short time. Entries are keyed on the tool,
+its arguments, a data-directory stamp and a version counter that write
+tools bump after running.
+
+Cached results are shared between callers and must not be mutated.
+"""
+
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from ...utils.config import get_config
+
+# Bumped by write tools so earlier read results are never reused
+_version = 0
+_lock = threading.Lock()
+# (tool, args, stamp) -> (version, stored_at, result)
+_cache: Dict[tuple, Tuple[int, float, Any]] = {}
+# Upper bound on entries; cleared wholesale when exceeded
+_MAX_ENTRIES = 256
+
+# A stamp can only be trusted once its newest file is this many seconds
+# older than the moment the stamp was taken. A second edit within the same
+# mtime tick keeps mtime and (often) size, so it would not change the stamp.
+# Two seconds covers the coarsest common mtime resolutions (FAT's 2 s, 1 s
+# on HFS+ and some network filesystems); files newer than that only cost a
+# rescan and reload on the next call.
+MTIME_SETTLE_SECONDS = 2.0
+
+# Directory stamps already taken during the current tool call, by path
+_call_stamps: ContextVar[Optional[Dict[str, Tuple[int, int, int]]]] = ContextVar(
+    "pm_mcp_call_stamps", default=None
+)
+
+
+def _scan_dir(directory: Path) -> Tuple[int, int, int]:
+    """Scan the markdown files directly inside a directory."""
+    count = latest = size = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md"):
+                    continue
+                stat = entry.stat()
+                count += 1
+                size += stat.st_size
+                if stat.st_mtime_ns > latest:
+                    latest = stat.st_mtime_ns
+    except FileNotFoundError:
+        pass
+    return count, latest, size
+
+
+def dir_stamp(directory: Path) -> Tuple[int, int, int]:
+    """Summarize the markdown files directly inside a directory.
+
+    Inside ``stamp_scope`` each directory is scanned at most once, so the
+    read cache, manager reloads and sync coalescing share one scan.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        Tuple of (file count, latest mtime in ns, total size)
+    """
+    stamps = _call_stamps.get()
+    if stamps is None:
+        return _scan_dir(directory)
+    key = str(directory)
+    stamp = stamps.get(key)
+    if stamp is None:
+        stamp = stamps[key] = _scan_dir(directory)
+    return stamp
+
+
+def file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Get (mtime in ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@contextmanager
+def stamp_scope() -> Iterator[None]:
+    """Reuse directory stamps for the rest of a tool call.
+
+    Stamps taken inside the scope may predate writes made later in the
+    same call. Callers only compare them with fresh stamps on later calls,
+    so a stale stamp causes an extra reload or sync, never a stale read.
+    Nested scopes share the outermost one.
+    """
+    if _call_stamps.get() is not None:
+        yield
+        return
+    token = _call_stamps.set({})
+    try:
+        yield
+    finally:
+        _call_stamps.reset(token)
+
+
+def _store_stamp() -> tuple:
+    """Get a stamp that changes whenever task or journal files change."""
+    data_path = get_config().data_path
+    return (
+        str(data_path),
+        dir_stamp(data_path / "tasks"),
+        dir_stamp(data_path / "journal"),
+        file_stamp(data_path / "tasks.md"),
+    )
+
+
+def invalidate_read_cache() -> None:
+    """Drop all cached read results."""
+    global _version
+    with _lock:
+        _version += 1
+        _cache.clear()
+
+
+def cached_read(ttl: float = 1.0) -> Callable:
+    """Memoize a read-only tool's result.
+
+    Args:
+        ttl: Seconds a cached result stays valid, which bounds staleness
+            for time-dependent results such as overdue tasks
+
+    Returns:
+        Decorator for the tool function
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stamp_scope():
+                return _cached_call(func, ttl, args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _cached_call(func: Callable, ttl: float, args: tuple, kwargs: dict) -> Any:
+    """Return a cached result of ``func`` or run it and cache the result."""
+    key = (func.__name__, args, frozenset(kwargs.items()), _store_stamp())
+    now = time.monotonic()
+
+    with _lock:
+        version = _version
+        entry = _cache.get(key)
+    if entry is not None and entry[0] == version and now - entry[1] < ttl:
+        return entry[2]
+
+    result = func(*args, **kwargs)
+
+    with _lock:
+        # Skip storing if a write happened while this read ran
+        if version == _version:
+            if len(_cache) >= _MAX_ENTRIES:
+                _cache.clear()
+            _cache[key] = (version, now, result)
+    return result
+
+
+def invalidates_read_cache(func: Callable) -> Callable:
+    """Mark a tool as a writer that invalidates cached read results.
+
+    Args:
+        func: Tool function that modifies tasks or journals
+
+    Returns:
+        Wrapped tool function
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            invalidate_read_cache()
+
+    return wrapper
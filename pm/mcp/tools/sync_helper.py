@@ -1,36 +1,112 @@
 """Helper module for auto-syncing journal before MCP operations."""
 
+import functools
 import logging
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
 
 from ...core.manager import TaskManager
 from ...core.journal_manager import JournalManager
+from ._managers import get_managers, mark_tasks_stale
+from .read_cache import MTIME_SETTLE_SECONDS, dir_stamp, invalidate_read_cache, stamp_scope
 
 logger = logging.getLogger(__name__)
 
+# Seconds during which back-to-back tool calls share one journal sync
+SYNC_COALESCE_WINDOW = 0.25
+
+_sync_lock = threading.Lock()
+# (journal_dir, synced_at monotonic, files stamp, sync_result) of the last sync
+_last_sync: Optional[tuple] = None
+
 
 class SyncError(Exception):
     """Error during journal sync."""
     pass
 
 
-def get_synced_manager() -> tuple[TaskManager, Dict[str, Any]]:
-    """Get a TaskManager with journal synced first.
+def _files_stamp(journal_manager: JournalManager) -> tuple:
+    """Stamp the journal and task files a sync reads."""
+    data_path = journal_manager.task_manager.config.data_path
+    return dir_stamp(journal_manager.journal_dir), dir_stamp(data_path / "tasks")
 
-    This ensures the task files are up-to-date with the journal
-    before any MCP operation reads or modifies tasks.
+
+def _coalesced_result(journal_manager: JournalManager, stamp: tuple) -> Optional[Dict[str, Any]]:
+    """Get the previous sync result if it can stand in for a new sync.
+
+    Args:
+        journal_manager: Manager that would run the sync
+        stamp: Current stamp of the journal and task files
 
     Returns:
-        Tuple of (TaskManager, sync_result dict)
+        Previous sync result, or None if a sync is needed
+    """
+    with _sync_lock:
+        last = _last_sync
+    if last is None:
+        return None
+
+    journal_dir, synced_at, last_stamp, sync_result = last
+    if journal_dir != journal_manager.journal_dir:
+        return None
+    if time.monotonic() - synced_at >= SYNC_COALESCE_WINDOW:
+        return None
+    if stamp != last_stamp:
+        return None
+    return sync_result
+
+
+def _record_sync(
+    journal_manager: JournalManager, stamp: tuple, taken_at: float, sync_result: Dict[str, Any]
+) -> None:
+    """Remember a finished sync so calls right after it can skip syncing.
+
+    Args:
+        journal_manager: Manager that ran the sync
+        stamp: Stamp of the journal and task files taken before the sync
+        taken_at: Wall-clock time the stamp was taken
+        sync_result: Result of the sync
+    """
+    global _last_sync
+    newest_mtime = max(stamp[0][1], stamp[1][1]) / 1e9
+
+    with _sync_lock:
+        if newest_mtime < taken_at - MTIME_SETTLE_SECONDS:
+            _last_sync = (journal_manager.journal_dir, time.monotonic(), stamp, sync_result)
+        else:
+            _last_sync = None
+
+
+def invalidate_sync() -> None:
+    """Force the next tool call to run a full journal sync."""
+    global _last_sync
+    with _sync_lock:
+        _last_sync = None
+
+
+def _sync_managers() -> tuple[TaskManager, JournalManager, Dict[str, Any]]:
+    """Sync the journal and return the managers that performed the sync.
+
+    Returns:
+        Tuple of (TaskManager, JournalManager, sync_result dict)
 
     Raises:
         SyncError: If sync fails due to malformed markdown
     """
-    task_manager = TaskManager()
-    journal_manager = JournalManager(task_manager)
+    task_manager, journal_manager = get_managers()
+
+    taken_at = time.time()
+    stamp = _files_stamp(journal_manager)
+    cached = _coalesced_result(journal_manager, stamp)
+    if cached is not None:
+        return task_manager, journal_manager, cached
 
     try:
         sync_result = journal_manager.sync_journal()
+        # Files the sync writes make the next stamp differ, so recording the
+        # stamp taken before it can only cost an extra sync
+        _record_sync(journal_manager, stamp, taken_at, sync_result)
 
         # Log sync activity
         created = len(sync_result.get("created", []))
@@ -47,13 +123,29 @@ def get_synced_manager() -> tuple[TaskManager, Dict[str, Any]]:
         for error in errors:
             logger.warning(f"Journal parse warning: {error}")
 
-        return task_manager, sync_result
+        return task_manager, journal_manager, sync_result
 
     except Exception as e:
         logger.error(f"Journal sync failed: {e}")
         raise SyncError(f"Failed to sync journal: {e}") from e
 
 
+def get_synced_manager() -> tuple[TaskManager, Dict[str, Any]]:
+    """Get a TaskManager with journal synced first.
+
+    This ensures the task files are up-to-date with the journal
+    before any MCP operation reads or modifies tasks.
+
+    Returns:
+        Tuple of (TaskManager, sync_result dict)
+
+    Raises:
+        SyncError: If sync fails due to malformed markdown
+    """
+    task_manager, _, sync_result = _sync_managers()
+    return task_manager, sync_result
+
+
 def sync_before_read() -> TaskManager:
     """Sync journal and return TaskManager for read operations.
 
@@ -70,6 +162,48 @@ def sync_before_write() -> tuple[TaskManager, JournalManager]:
     Returns:
         Tuple of (TaskManager, JournalManager)
     """
-    task_manager, _ = get_synced_manager()
-    journal_manager = JournalManager(task_manager)
+    task_manager, journal_manager, _ = _sync_managers()
+    # The caller is about to modify tasks; the next call must sync and
+    # reload again
+    invalidate_sync()
+    mark_tasks_stale()
     return task_manager, journal_manager
+
+
+def mcp_read_tool(func: Callable) -> Callable:
+    """Run a read tool with a synced TaskManager as its first argument.
+
+    Args:
+        func: Tool function taking ``(manager, ...)``
+
+    Returns:
+        Tool function taking only the tool arguments
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with stamp_scope():
+            return func(sync_before_read(), *args, **kwargs)
+
+    return wrapper
+
+
+def mcp_write_tool(func: Callable) -> Callable:
+    """Run a write tool with a synced TaskManager as its first argument.
+
+    Cached read results are invalidated once the tool has run.
+
+    Args:
+        func: Tool function taking ``(manager, ...)``
+
+    Returns:
+        Tool function taking only the tool arguments
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        manager, _ = sync_before_write()
+        try:
+            return func(manager, *args, **kwargs)
+        finally:
+            invalidate_read_cache()
+
+    return wrapper
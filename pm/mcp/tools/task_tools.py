@@ -2,25 +2,112 @@
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from dateutil import parser as date_parser
 
 from ...core.manager import TaskManager
 from ...core.task import TaskType, TaskStatus, TaskPriority, CheckFrequency
 from ..serializers import serialize_task, serialize_task_list
-from .sync_helper import sync_before_read, sync_before_write
+from .sync_helper import mcp_read_tool, mcp_write_tool
+
+# Value -> member tables; plain dict lookups are much cheaper than Enum(value)
+_TASK_TYPE_MAP = {e.value: e for e in TaskType}
+_TASK_STATUS_MAP = {e.value: e for e in TaskStatus}
+_TASK_PRIORITY_MAP = {e.value: e for e in TaskPriority}
+_CHECK_FREQUENCY_MAP = {e.value: e for e in CheckFrequency}
+
+# Tool argument name -> (value table, enum class)
+_ENUM_ARGS = {
+    "task_type": (_TASK_TYPE_MAP, TaskType),
+    "status": (_TASK_STATUS_MAP, TaskStatus),
+    "priority": (_TASK_PRIORITY_MAP, TaskPriority),
+    "check_frequency": (_CHECK_FREQUENCY_MAP, CheckFrequency),
+}
+
+
+def _to_enum(enum_map: Dict[str, Any], enum_cls: type, value: str) -> Any:
+    """Look up an enum member by value.
+
+    Raises:
+        ValueError: If value is not a member, matching Enum(value)
+    """
+    try:
+        return enum_map[value]
+    except (KeyError, TypeError):
+        if isinstance(value, enum_cls):
+            return value
+        raise ValueError(f"{value!r} is not a valid {enum_cls.__qualname__}") from None
+
+
+def _coerce_enums(**values: Optional[str]) -> Dict[str, Any]:
+    """Convert enum tool arguments to enum members.
+
+    Args:
+        **values: Enum argument values keyed by argument name; empty
+            values become None
+
+    Returns:
+        Dictionary of enum members (or None) keyed by argument name
+    """
+    return {
+        name: _to_enum(*_ENUM_ARGS[name], value) if value else None
+        for name, value in values.items()
+    }
 
 
 def _parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
-    """Parse datetime from string."""
+    """Parse datetime from string.
+
+    ISO-8601 input (what the tools emit) takes the fast path; anything
+    else falls back to dateutil's general-purpose parser.
+    """
     if not date_str:
         return None
     try:
+        if date_str.endswith("Z"):
+            # fromisoformat only accepts "Z" from Python 3.11
+            return datetime.fromisoformat(date_str[:-1] + "+00:00")
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    try:
+        from dateutil import parser as date_parser
+
         return date_parser.parse(date_str)
     except Exception:
         return None
 
 
+def _task_spec(
+    title: str,
+    description: str = "",
+    task_type: str = "general",
+    priority: str = "medium",
+    status: str = "todo",
+    check_frequency: str = "weekly",
+    eta: Optional[str] = None,
+    notify_at: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    dependencies: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Convert create_task tool arguments to TaskManager.create_task kwargs."""
+    return dict(
+        title=title,
+        description=description,
+        eta=_parse_datetime(eta),
+        notify_at=_parse_datetime(notify_at),
+        tags=tags or [],
+        dependencies=dependencies or [],
+        **_coerce_enums(
+            task_type=task_type,
+            priority=priority,
+            status=status,
+            check_frequency=check_frequency,
+        ),
+    )
+
+
+@mcp_write_tool
 def create_task(
+    manager: TaskManager,
     title: str,
     description: str = "",
     task_type: str = "general",
@@ -35,6 +122,7 @@ def create_task(
     """Create a new task.
 
     Args:
+        manager: Synced TaskManager (supplied by mcp_write_tool)
         title: Task title
         description: Task description
         task_type: Type of task (dat_ticket, cross_team, project, training_run, general)
@@ -49,37 +137,39 @@ def create_task(
     Returns:
         Serialized task dictionary
     """
-    # Auto-sync journal before write operation
-    manager, _ = sync_before_write()
-
-    # Parse enums
-    task_type_enum = TaskType(task_type)
-    priority_enum = TaskPriority(priority)
-    status_enum = TaskStatus(status)
-    check_freq_enum = CheckFrequency(check_frequency)
-
-    # Parse dates
-    eta_dt = _parse_datetime(eta)
-    notify_dt = _parse_datetime(notify_at)
-
-    # Create task
-    task = manager.create_task(
+    task = manager.create_task(**_task_spec(
         title=title,
         description=description,
-        task_type=task_type_enum,
-        priority=priority_enum,
-        status=status_enum,
-        check_frequency=check_freq_enum,
-        eta=eta_dt,
-        notify_at=notify_dt,
-        tags=tags or [],
-        dependencies=dependencies or [],
-    )
+        task_type=task_type,
+        priority=priority,
+        status=status,
+        check_frequency=check_frequency,
+        eta=eta,
+        notify_at=notify_at,
+        tags=tags,
+        dependencies=dependencies,
+    ))
 
     return serialize_task(task)
 
 
+@mcp_write_tool
+def create_tasks_bulk(manager: TaskManager, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Create several tasks with a single sync and storage call.
+
+    Args:
+        manager: Synced TaskManager (supplied by mcp_write_tool)
+        tasks: Task specs, each taking the same fields as create_task
+
+    Returns:
+        List of serialized task dictionaries, in input order
+    """
+    return serialize_task_list(manager.create_tasks([_task_spec(**spec) for spec in tasks]))
+
+
+@mcp_read_tool
 def list_tasks(
+    manager: TaskManager,
     status: Optional[str] = None,
     task_type: Optional[str] = None,
     priority: Optional[str] = None,
@@ -89,6 +179,7 @@ def list_tasks(
     """List tasks with optional filters.
 
     Args:
+        manager: Synced TaskManager (supplied by mcp_read_tool)
         status: Filter by status
         task_type: Filter by type
         priority: Filter by priority
@@ -98,37 +189,27 @@ def list_tasks(
     Returns:
         List of serialized task dictionaries
     """
-    # Auto-sync journal before read operation
-    manager = sync_before_read()
-
-    # Parse enums if provided
-    status_enum = TaskStatus(status) if status else None
-    type_enum = TaskType(task_type) if task_type else None
-    priority_enum = TaskPriority(priority) if priority else None
-
     # Filter tasks
     tasks = manager.filter_tasks(
-        status=status_enum,
-        task_type=type_enum,
-        priority=priority_enum,
         tags=tags,
         search=search,
+        **_coerce_enums(status=status, task_type=task_type, priority=priority),
     )
 
     return serialize_task_list(tasks)
 
 
-def get_task(task_id: str) -> Optional[Dict[str, Any]]:
+@mcp_read_tool
+def get_task(manager: TaskManager, task_id: str) -> Optional[Dict[str, Any]]:
     """Get a task by ID.
 
     Args:
+        manager: Synced TaskManager (supplied by mcp_read_tool)
         task_id: Task ID
 
     Returns:
         Serialized task dictionary or None if not found
     """
-    # Auto-sync journal before read operation
-    manager = sync_before_read()
     task = manager.get_task(task_id)
 
     if task is None:
@@ -137,7 +218,9 @@ def get_task(task_id: str) -> Optional[Dict[str, Any]]:
     return serialize_task(task)
 
 
+@mcp_write_tool
 def update_task(
+    manager: TaskManager,
     task_id: str,
     title: Optional[str] = None,
     description: Optional[str] = None,
@@ -153,6 +236,7 @@ def update_task(
     """Update a task.
 
     Args:
+        manager: Synced TaskManager (supplied by mcp_write_tool)
         task_id: Task ID
         title: New title
         description: New description
@@ -168,32 +252,21 @@ def update_task(
     Returns:
         Serialized updated task or None if not found
     """
-    # Auto-sync journal before write operation
-    manager, _ = sync_before_write()
-
-    # Parse enums if provided
-    type_enum = TaskType(task_type) if task_type else None
-    priority_enum = TaskPriority(priority) if priority else None
-    status_enum = TaskStatus(status) if status else None
-    check_freq_enum = CheckFrequency(check_frequency) if check_frequency else None
-
-    # Parse dates
-    eta_dt = _parse_datetime(eta) if eta else None
-    notify_dt = _parse_datetime(notify_at) if notify_at else None
-
     # Update task
     task = manager.update_task(
         task_id=task_id,
         title=title,
         description=description,
-        task_type=type_enum,
-        priority=priority_enum,
-        status=status_enum,
-        check_frequency=check_freq_enum,
-        eta=eta_dt,
-        notify_at=notify_dt,
+        eta=_parse_datetime(eta),
+        notify_at=_parse_datetime(notify_at),
         tags=tags,
         dependencies=dependencies,
+        **_coerce_enums(
+            task_type=task_type,
+            priority=priority,
+            status=status,
+            check_frequency=check_frequency,
+        ),
     )
 
     if task is None:
@@ -202,32 +275,32 @@ def update_task(
     return serialize_task(task)
 
 
-def delete_task(task_id: str) -> bool:
+@mcp_write_tool
+def delete_task(manager: TaskManager, task_id: str) -> bool:
     """Delete a task.
 
     Args:
+        manager: Synced TaskManager (supplied by mcp_write_tool)
         task_id: Task ID
 
     Returns:
         True if deleted, False if not found
     """
-    # Auto-sync journal before write operation
-    manager, _ = sync_before_write()
     return manager.delete_task(task_id)
 
 
-def add_task_note(task_id: str, note: str) -> Optional[Dict[str, Any]]:
+@mcp_write_tool
+def add_task_note(manager: TaskManager, task_id: str, note: str) -> Optional[Dict[str, Any]]:
     """Add a note to a task.
 
     Args:
+        manager: Synced TaskManager (supplied by mcp_write_tool)
         task_id: Task ID
         note: Note content
 
     Returns:
         Serialized updated task or None if not found
     """
-    # Auto-sync journal before write operation
-    manager, _ = sync_before_write()
     task = manager.add_note(task_id, note)
 
     if task is None:
@@ -236,17 +309,17 @@ def add_task_note(task_id: str, note: str) -> Optional[Dict[str, Any]]:
     return serialize_task(task)
 
 
-def mark_task_done(task_id: str) -> Optional[Dict[str, Any]]:
+@mcp_write_tool
+def mark_task_done(manager: TaskManager, task_id: str) -> Optional[Dict[str, Any]]:
     """Mark a task as done.
 
     Args:
+        manager: Synced TaskManager (supplied by mcp_write_tool)
         task_id: Task ID
 
     Returns:
         Serialized updated task or None if not found
     """
-    # Auto-sync journal before write operation
-    manager, _ = sync_before_write()
     task = manager.mark_done(task_id)
 
     if task is None:
@@ -255,17 +328,17 @@ def mark_task_done(task_id: str) -> Optional[Dict[str, Any]]:
     return serialize_task(task)
 
 
-def mark_task_in_progress(task_id: str) -> Optional[Dict[str, Any]]:
+@mcp_write_tool
+def mark_task_in_progress(manager: TaskManager, task_id: str) -> Optional[Dict[str, Any]]:
     """Mark a task as in progress.
 
     Args:
+        manager: Synced TaskManager (supplied by mcp_write_tool)
         task_id: Task ID
 
     Returns:
         Serialized updated task or None if not found
     """
-    # Auto-sync journal before write operation
-    manager, _ = sync_before_write()
     task = manager.mark_in_progress(task_id)
 
     if task is None:
@@ -14,7 +14,11 @@ Options:
 """
 
 import argparse
+import os
 import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple
@@ -25,6 +29,49 @@ from pm.core.journal import WeeklyJournal, get_week_for_date
 from pm.utils.config import get_config
 
 
+def copy_tree_snapshot(src: Path, dst: Path) -> None:
+    """Copy a directory tree for backup, sharing blocks where possible.
+
+    On Linux a single ``cp --reflink=auto`` makes copy-on-write clones on
+    filesystems that support them (btrfs, xfs) and a plain copy elsewhere.
+    Hard links are not used: task and journal files are rewritten in
+    place, which would silently change the backup too.
+
+    Args:
+        src: Directory to back up
+        dst: Destination directory (must not exist)
+    """
+    if sys.platform.startswith("linux") and shutil.which("cp"):
+        try:
+            subprocess.run(
+                ["cp", "-a", "--reflink=auto", str(src), str(dst)],
+                check=True,
+                capture_output=True,
+            )
+            return
+        except (OSError, subprocess.CalledProcessError):
+            # Clean up a partial copy before falling back
+            shutil.rmtree(dst, ignore_errors=True)
+
+    shutil.copytree(src, dst)
+
+
+def _has_md(directory: Path) -> bool:
+    """Check whether a directory holds at least one markdown file.
+
+    Stops at the first match and uses the directory entry types, so no
+    file is stat'ed individually.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return any(
+                entry.name.endswith(".md") and entry.is_file(follow_symlinks=False)
+                for entry in entries
+            )
+    except FileNotFoundError:
+        return False
+
+
 def group_tasks_by_week(tasks: Dict[str, Task]) -> Dict[Tuple[int, int], Dict[str, Task]]:
     """Group tasks by the week they were created.
 
@@ -35,17 +82,54 @@ def group_tasks_by_week(tasks: Dict[str, Task]) -> Dict[Tuple[int, int], Dict[st
         Dictionary mapping (year, week) tuples to task dictionaries
     """
     tasks_by_week: Dict[Tuple[int, int], Dict[str, Task]] = {}
+    week_for_date = get_week_for_date
 
     for task_id, task in tasks.items():
-        year, week = get_week_for_date(task.created_at)
-        key = (year, week)
+        tasks_by_week.setdefault(week_for_date(task.created_at), {})[task_id] = task
 
-        if key not in tasks_by_week:
-            tasks_by_week[key] = {}
+    return tasks_by_week
 
-        tasks_by_week[key][task_id] = task
 
-    return tasks_by_week
+def _migrate_week(
+    year: int,
+    week: int,
+    week_tasks: Dict[str, Task],
+    journal_dir: Path,
+    new_storage: JournalStorage,
+) -> Tuple[bool, int]:
+    """Write one week's tasks into its journal file.
+
+    Args:
+        year: Journal year
+        week: Journal ISO week
+        week_tasks: Tasks created that week
+        journal_dir: Directory holding journal files
+        new_storage: Journal storage used to read existing journals
+
+    Returns:
+        Tuple of (whether an existing journal was updated, tasks migrated)
+    """
+    journal_path = journal_dir / f"{year}-W{week:02d}.md"
+    updated = journal_path.exists()
+
+    # Load existing journal content if it exists
+    if updated:
+        content = journal_path.read_text()
+        existing_tasks = new_storage.parse_task_registry(content)
+        # Merge with new tasks
+        existing_tasks.update(week_tasks)
+        week_tasks = existing_tasks
+
+    # Create/update journal with Task Registry
+    journal = WeeklyJournal(year, week, journal_dir)
+
+    # Set task registry
+    journal.task_registry = week_tasks
+
+    # Generate and save content
+    journal.save(week_tasks)
+
+    return updated, len(week_tasks)
 
 
 def migrate_tasks_to_journal(dry_run: bool = False, backup: bool = True) -> Dict:
@@ -75,7 +159,7 @@ def migrate_tasks_to_journal(dry_run: bool = False, backup: bool = True) -> Dict
     }
 
     # Check if tasks directory exists
-    if not tasks_dir.exists() or not any(tasks_dir.glob("*.md")):
+    if not _has_md(tasks_dir):
         print("No task files found to migrate.")
         return result
 
@@ -104,12 +188,12 @@ def migrate_tasks_to_journal(dry_run: bool = False, backup: bool = True) -> Dict
 
         # Backup tasks directory
         if tasks_dir.exists():
-            shutil.copytree(tasks_dir, backup_dir / "tasks")
+            copy_tree_snapshot(tasks_dir, backup_dir / "tasks")
             print(f"  Backed up tasks directory")
 
         # Backup journal directory
         if journal_dir.exists():
-            shutil.copytree(journal_dir, backup_dir / "journal")
+            copy_tree_snapshot(journal_dir, backup_dir / "journal")
             print(f"  Backed up journal directory")
 
         result["backup_path"] = str(backup_dir)
@@ -126,44 +210,54 @@ def migrate_tasks_to_journal(dry_run: bool = False, backup: bool = True) -> Dict
     )
 
     # Process each week
-    for (year, week), week_tasks in sorted(tasks_by_week.items()):
-        journal_path = journal_dir / f"{year}-W{week:02d}.md"
-        action = "update" if journal_path.exists() else "create"
-
-        print(f"\n  Week {year}-W{week:02d}: {len(week_tasks)} tasks ({action})")
-
-        if dry_run:
-            for task_id, task in week_tasks.items():
-                print(f"    - {task_id}: {task.title}")
-            continue
-
-        try:
-            # Load existing journal content if it exists
-            if journal_path.exists():
-                content = journal_path.read_text()
-                existing_tasks = new_storage.parse_task_registry(content)
-                # Merge with new tasks
-                existing_tasks.update(week_tasks)
-                week_tasks = existing_tasks
-                result["journals_updated"] += 1
+    weeks = sorted(tasks_by_week.items())
+    futures = []
+    # Tallied locally and written to result once all weeks are done
+    tasks_migrated = journals_created = journals_updated = 0
+    errors = result["errors"]
+    # Weeks write to separate journal files, so they can be saved concurrently
+    executor = None
+    if not dry_run and weeks:
+        executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(weeks)))
+
+    try:
+        for (year, week), week_tasks in weeks:
+            journal_path = journal_dir / f"{year}-W{week:02d}.md"
+            action = "update" if journal_path.exists() else "create"
+
+            print(f"\n  Week {year}-W{week:02d}: {len(week_tasks)} tasks ({action})")
+
+            if dry_run:
+                for task_id, task in week_tasks.items():
+                    print(f"    - {task_id}: {task.title}")
+                continue
+
+            futures.append((year, week, executor.submit(
+                _migrate_week, year, week, week_tasks, journal_dir, new_storage
+            )))
+
+        # Collect in week order so errors are reported deterministically
+        for year, week, future in futures:
+            try:
+                updated, migrated = future.result()
+            except Exception as e:
+                error_msg = f"Error processing week {year}-W{week:02d}: {e}"
+                print(f"    ERROR: {error_msg}")
+                errors.append(error_msg)
+                continue
+
+            if updated:
+                journals_updated += 1
             else:
-                result["journals_created"] += 1
-
-            # Create/update journal with Task Registry
-            journal = WeeklyJournal(year, week, journal_dir)
-
-            # Set task registry
-            journal.task_registry = week_tasks
-
-            # Generate and save content
-            journal.save(week_tasks)
-
-            result["tasks_migrated"] += len(week_tasks)
-
-        except Exception as e:
-            error_msg = f"Error processing week {year}-W{week:02d}: {e}"
-            print(f"    ERROR: {error_msg}")
-            result["errors"].append(error_msg)
+                journals_created += 1
+            tasks_migrated += migrated
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    result["tasks_migrated"] = tasks_migrated
+    result["journals_created"] = journals_created
+    result["journals_updated"] = journals_updated
 
     # Summary
     print("\n" + "=" * 50)
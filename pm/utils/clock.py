@@ -0,0 +1,12 @@
+"""Clock shared by time-dependent queries.
+
+Callers go through the module (``clock.now()``) rather than importing the
+function, so tests can freeze time by patching ``pm.utils.clock.now``.
+"""
+
+from datetime import datetime
+
+
+def now() -> datetime:
+    """Get the current local time."""
+    return datetime.now()
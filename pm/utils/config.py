@@ -1,12 +1,21 @@
 """Configuration management for PM app."""
 
 import yaml
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
-from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional, Tuple
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
 
-@dataclass
+# Resolved config path -> (mtime_ns, size, parsed YAML data)
+_yaml_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+@dataclass(slots=True)
 class EmailConfig:
     """Email notification configuration."""
     enabled: bool = True
@@ -17,21 +26,21 @@ class EmailConfig:
     recipient: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TerminalConfig:
     """Terminal notification configuration."""
     enabled: bool = True
     show_on_login: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationConfig:
     """Notification settings."""
     email: EmailConfig = field(default_factory=EmailConfig)
     terminal: TerminalConfig = field(default_factory=TerminalConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class SchedulerConfig:
     """Background scheduler configuration."""
     check_interval: int = 3600  # seconds
@@ -39,14 +48,14 @@ class SchedulerConfig:
     weekly_summary_day: str = "Monday"
 
 
-@dataclass
+@dataclass(slots=True)
 class DefaultsConfig:
     """Default values for new tasks."""
     check_frequency: str = "weekly"
     priority: str = "medium"
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupConfig:
     """Backup settings for journal files."""
     enabled: bool = True
@@ -55,7 +64,7 @@ class BackupConfig:
     backup_on_sync: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration."""
     data_dir: str = "~/pm-data"
@@ -71,6 +80,33 @@ class Config:
         return Path(self.data_dir).expanduser()
 
 
+def _from_dict(cls: type, data: Dict[str, Any]) -> Any:
+    """Build a config dataclass from a parsed YAML mapping.
+
+    Missing or null keys keep the dataclass defaults, nested sections are
+    built recursively, and unknown keys are ignored.
+
+    Args:
+        cls: Config dataclass to build
+        data: Parsed mapping for this section
+
+    Returns:
+        Instance of cls
+    """
+    kwargs = {}
+    for f in fields(cls):
+        value = data.get(f.name)
+        if value is None:
+            continue
+        if is_dataclass(f.type):
+            # Ignore malformed sections rather than storing a non-dataclass
+            if isinstance(value, dict):
+                kwargs[f.name] = _from_dict(f.type, value)
+        else:
+            kwargs[f.name] = value
+    return cls(**kwargs)
+
+
 class ConfigManager:
     """Manages application configuration."""
 
@@ -83,6 +119,26 @@ class ConfigManager:
         self.config_file = self._find_config_file(config_file)
         self.config = self._load_config()
 
+    @classmethod
+    def from_mapping(cls, data: Dict[str, Any], config_file: Optional[str] = None) -> "ConfigManager":
+        """Build a config manager from already-parsed config data.
+
+        The data goes through the same parsing as a loaded config file, but
+        no file is read.
+
+        Args:
+            data: Config values as they would appear in the YAML file
+            config_file: Path used by save_config (defaults to the usual
+                locations)
+
+        Returns:
+            ConfigManager holding the parsed config
+        """
+        manager = cls.__new__(cls)
+        manager.config_file = manager._find_config_file(config_file)
+        manager.config = manager._parse_config(data)
+        return manager
+
     def _find_config_file(self, config_file: Optional[str]) -> Path:
         """Find configuration file.
 
@@ -109,14 +165,23 @@ class ConfigManager:
 
     def _load_config(self) -> Config:
         """Load configuration from file or use defaults."""
-        if not self.config_file.exists():
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
             # Use default configuration
             return Config()
 
         try:
-            with open(self.config_file, "r") as f:
-                data = yaml.safe_load(f) or {}
-
+            key = self.config_file.resolve()
+            cached = _yaml_cache.get(key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                data = cached[2]
+            else:
+                with open(self.config_file, "r") as f:
+                    data = yaml.load(f, Loader=SafeLoader) or {}
+                _yaml_cache[key] = (stat.st_mtime_ns, stat.st_size, data)
+
+            # Parsing builds a fresh Config, so callers never share one
             return self._parse_config(data)
 
         except Exception as e:
@@ -126,106 +191,20 @@ class ConfigManager:
 
     def _parse_config(self, data: Dict[str, Any]) -> Config:
         """Parse configuration dictionary."""
-        # Parse email config
-        email_data = data.get("notifications", {}).get("email", {})
-        email_config = EmailConfig(
-            enabled=email_data.get("enabled", True),
-            smtp_server=email_data.get("smtp_server", "smtp.gmail.com"),
-            smtp_port=email_data.get("smtp_port", 587),
-            sender=email_data.get("sender", ""),
-            password=email_data.get("password", ""),
-            recipient=email_data.get("recipient", ""),
-        )
-
-        # Parse terminal config
-        terminal_data = data.get("notifications", {}).get("terminal", {})
-        terminal_config = TerminalConfig(
-            enabled=terminal_data.get("enabled", True),
-            show_on_login=terminal_data.get("show_on_login", True),
-        )
-
-        # Parse notification config
-        notification_config = NotificationConfig(
-            email=email_config,
-            terminal=terminal_config,
-        )
-
-        # Parse scheduler config
-        scheduler_data = data.get("scheduler", {})
-        scheduler_config = SchedulerConfig(
-            check_interval=scheduler_data.get("check_interval", 3600),
-            daily_summary_time=scheduler_data.get("daily_summary_time", "09:00"),
-            weekly_summary_day=scheduler_data.get("weekly_summary_day", "Monday"),
-        )
-
-        # Parse defaults config
-        defaults_data = data.get("defaults", {})
-        defaults_config = DefaultsConfig(
-            check_frequency=defaults_data.get("check_frequency", "weekly"),
-            priority=defaults_data.get("priority", "medium"),
-        )
-
-        # Parse backup config
-        backup_data = data.get("backup", {})
-        backup_config = BackupConfig(
-            enabled=backup_data.get("enabled", True),
-            max_backups_per_week=backup_data.get("max_backups_per_week", 50),
-            retention_days=backup_data.get("retention_days", 90),
-            backup_on_sync=backup_data.get("backup_on_sync", True),
-        )
-
-        return Config(
-            data_dir=data.get("data_dir", "~/pm-data"),
-            storage_mode=data.get("storage_mode", "journal"),
-            notifications=notification_config,
-            scheduler=scheduler_config,
-            defaults=defaults_config,
-            backup=backup_config,
-        )
+        return _from_dict(Config, data)
 
     def save_config(self) -> None:
         """Save current configuration to file."""
         # Ensure directory exists
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert config to dict
-        data = {
-            "data_dir": self.config.data_dir,
-            "storage_mode": self.config.storage_mode,
-            "notifications": {
-                "email": {
-                    "enabled": self.config.notifications.email.enabled,
-                    "smtp_server": self.config.notifications.email.smtp_server,
-                    "smtp_port": self.config.notifications.email.smtp_port,
-                    "sender": self.config.notifications.email.sender,
-                    "password": self.config.notifications.email.password,
-                    "recipient": self.config.notifications.email.recipient,
-                },
-                "terminal": {
-                    "enabled": self.config.notifications.terminal.enabled,
-                    "show_on_login": self.config.notifications.terminal.show_on_login,
-                },
-            },
-            "scheduler": {
-                "check_interval": self.config.scheduler.check_interval,
-                "daily_summary_time": self.config.scheduler.daily_summary_time,
-                "weekly_summary_day": self.config.scheduler.weekly_summary_day,
-            },
-            "defaults": {
-                "check_frequency": self.config.defaults.check_frequency,
-                "priority": self.config.defaults.priority,
-            },
-            "backup": {
-                "enabled": self.config.backup.enabled,
-                "max_backups_per_week": self.config.backup.max_backups_per_week,
-                "retention_days": self.config.backup.retention_days,
-                "backup_on_sync": self.config.backup.backup_on_sync,
-            },
-        }
+        # Convert config to dict (field order matches the dataclasses)
+        data = asdict(self.config)
 
         # Write to file
+        _yaml_cache.pop(self.config_file.resolve(), None)
         with open(self.config_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
     def get_config(self) -> Config:
         """Get current configuration."""
@@ -249,3 +228,30 @@ def get_config_manager(config_file: Optional[str] = None) -> ConfigManager:
 def get_config(config_file: Optional[str] = None) -> Config:
     """Get configuration."""
     return get_config_manager(config_file).get_config()
+
+
+@contextmanager
+def override_config(config: Config) -> Iterator[Config]:
+    """Make the global config return the given config inside the block.
+
+    No config file is read. The previous global config manager is restored
+    on exit. save_config writes to config.yaml in the config's data
+    directory, never to the user's config file.
+
+    Args:
+        config: Config to use
+
+    Yields:
+        The given config
+    """
+    global _config_manager
+
+    manager = ConfigManager.__new__(ConfigManager)
+    manager.config_file = config.data_path / "config.yaml"
+    manager.config = config
+
+    previous, _config_manager = _config_manager, manager
+    try:
+        yield config
+    finally:
+        _config_manager = previous
@@ -5,13 +5,35 @@ Read-only view of weekly journal entries with navigation and filtering.
 
 import streamlit as st
 from datetime import datetime
+from pathlib import Path
 
+from pm.core.journal import get_current_week
 from pm.web.data_loader import JournalDataLoader
-from pm.web.components import render_week_selector, render_day_section, render_summary_view
+
+
+_CSS_PATH = Path(__file__).parent / "static" / "app.css"
+
+# Weeks listed in the selector before "Show older…" is clicked
+WEEKS_PAGE_SIZE = 26
+
+
+@st.cache_resource
+def _app_style() -> str:
+    """Custom stylesheet as a <style> block, read from disk once per process."""
+    return f"<style>\n{_CSS_PATH.read_text()}</style>"
+
+
+@st.cache_resource
+def _get_loader() -> JournalDataLoader:
+    """Process-wide data loader shared by all sessions."""
+    return JournalDataLoader()
 
 
 def main():
     """Main Streamlit application entry point."""
+    # Components are only needed when rendering
+    from pm.web.components import render_week_selector, render_day_section, render_summary_view
+
     # Page configuration
     st.set_page_config(
         page_title="PM Weekly Journal",
@@ -21,61 +43,26 @@ def main():
     )
 
     # Custom CSS for better dark mode styling
-    st.markdown("""
-        <style>
-        /* Metric cards */
-        [data-testid="stMetricValue"] {
-            font-size: 1.5rem;
-        }
-
-        /* Expander headers */
-        .streamlit-expanderHeader {
-            font-size: 1.1rem;
-            font-weight: 600;
-        }
-
-        /* Task items */
-        .task-item {
-            padding: 8px 12px;
-            margin: 4px 0;
-            border-radius: 6px;
-            background-color: rgba(255, 255, 255, 0.05);
-        }
-
-        /* Priority indicators */
-        .priority-high { border-left: 3px solid #ff4b4b; padding-left: 8px; }
-        .priority-medium { border-left: 3px solid #ffa726; padding-left: 8px; }
-        .priority-low { border-left: 3px solid #66bb6a; padding-left: 8px; }
-
-        /* Completed tasks */
-        .task-completed {
-            opacity: 0.7;
-        }
-
-        /* Sidebar styling */
-        [data-testid="stSidebar"] {
-            background-color: rgba(14, 17, 23, 0.95);
-        }
-        </style>
-    """, unsafe_allow_html=True)
-
-    # Initialize data loader
-    loader = JournalDataLoader()
+    st.markdown(_app_style(), unsafe_allow_html=True)
 
     # Sidebar - Week Selection
     with st.sidebar:
         st.title("📓 PM Journal")
         st.markdown("---")
 
-        # Get available weeks and current week
-        available_weeks = loader.get_available_weeks()
-        current_year, current_week = loader.get_current_week()
+        # Get available weeks (one extra to know whether older ones exist)
+        weeks_limit = st.session_state.setdefault("weeks_limit", WEEKS_PAGE_SIZE)
+        available_weeks = _get_loader().get_available_weeks(limit=weeks_limit + 1)
+        has_older = len(available_weeks) > weeks_limit
+        available_weeks = available_weeks[:weeks_limit]
+        current_year, current_week = get_current_week()
 
         # Week selector
         selected_year, selected_week = render_week_selector(
             available_weeks,
             current_year,
-            current_week
+            current_week,
+            has_older=has_older,
         )
 
         st.markdown("---")
@@ -85,12 +72,17 @@ def main():
         # Refresh button
         if st.button("🔄 Refresh", use_container_width=True):
             st.cache_data.clear()
+            # Rebuild the shared managers so out-of-band file changes are reread
+            st.cache_resource.clear()
             st.rerun()
 
     # Main content area
     st.title(f"Week {selected_week}, {selected_year}")
 
-    # Load journal data
+    # Load journal data; the loader outlives reruns, so pick up task edits
+    # first. Parsing is cached on the journal mtime and the task snapshot.
+    loader = _get_loader()
+    loader.reload()
     journal_data = loader.get_journal_data(selected_year, selected_week)
 
     if journal_data is None:
@@ -114,28 +106,27 @@ def main():
     st.markdown("---")
 
     # Day filter - tabs for each day
-    today = datetime.now()
-    sorted_days = sorted(journal_data.days.items())
+    today_date = datetime.now().date()
+    sorted_days = list(journal_data.iter_days())
 
     # Create tab labels
-    tab_labels = ["All Days"] + [
-        f"{data.day_name[:3]} {data.date_str}"
-        for _, data in sorted_days
-    ]
+    tab_labels = ["All Days"]
+    tab_labels.extend(f"{data.day_name[:3]} {data.date_str}" for _, data in sorted_days)
 
     tabs = st.tabs(tab_labels)
+    all_days_tab = tabs[0]
 
-    # All Days tab
-    with tabs[0]:
-        for day_key, day_data in sorted_days:
+    # Fill the All Days tab and each day's own tab in one pass
+    for day_tab, (day_key, day_data) in zip(tabs[1:], sorted_days):
+        with all_days_tab:
             # Expand today's section by default
-            is_today = day_data.date.date() == today.date()
-            render_day_section(day_data, expanded=is_today)
-
-    # Individual day tabs
-    for idx, (day_key, day_data) in enumerate(sorted_days):
-        with tabs[idx + 1]:
-            render_day_section(day_data, expanded=True)
+            render_day_section(
+                day_data,
+                expanded=day_data.date.date() == today_date,
+                key=f"all-{day_key}",
+            )
+        with day_tab:
+            render_day_section(day_data, expanded=True, key=f"day-{day_key}")
 
 
 if __name__ == "__main__":
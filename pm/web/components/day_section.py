@@ -1,46 +1,51 @@
 """Day section component for displaying daily journal entries."""
 
 import streamlit as st
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional
 
 if TYPE_CHECKING:
     from pm.web.data_loader import DaySectionData, TaskDisplayData
 
 
 def render_task_item(task: "TaskDisplayData", status_icon: str = ""):
-    """Render a single task item.
+    """Render a single task item as its own elements.
+
+    Day sections batch tasks through render_task_list instead.
 
     Args:
         task: Task data to display
         status_icon: Icon to show (checkbox, blocked, etc.)
     """
-    # Priority colors (using Unicode emojis)
-    priority_colors = {
-        "high": "🔴",
-        "medium": "🟠",
-        "low": "🟢"
-    }
-    priority_icon = priority_colors.get(task.priority, "")
-
-    # Status indicator
+    # Completed tasks always show a check mark
     if task.is_completed:
-        title_style = f"~~{task.title}~~"
         status_icon = "✅"
-    else:
-        title_style = task.title
 
-    # Build task display
-    st.markdown(f"{status_icon} {priority_icon} **{title_style}**")
-    st.caption(f"`{task.id}` | {task.type} | {task.priority}" +
-               (f" | ETA: {task.eta}" if task.eta else ""))
+    st.markdown(f"{status_icon} {task.markdown}")
+    st.caption(task.caption)
+
+
+def render_task_list(heading: str, tasks: List["TaskDisplayData"], status_icon: str = ""):
+    """Render a heading and its tasks as a single markdown element.
 
+    Args:
+        heading: Markdown heading for the list
+        tasks: Tasks to display
+        status_icon: Icon to show (checkbox, blocked, etc.)
+    """
+    st.markdown("\n\n".join([heading, *(t.markdown_with_icon(status_icon) for t in tasks)]))
 
-def render_day_section(day_data: "DaySectionData", expanded: bool = False):
+
+def render_day_section(day_data: "DaySectionData", expanded: bool = False, key: Optional[str] = None):
     """Render a single day's journal section.
 
+    With a key, the expander tracks its open state and only renders its
+    body while open, so collapsed days cost nothing beyond the header.
+    Toggling it reruns just this day's fragment.
+
     Args:
         day_data: Day section data to display
         expanded: Whether to expand by default
+        key: Optional unique widget key that enables lazy rendering
     """
     # Count tasks for the header
     task_count = len(day_data.planned_tasks)
@@ -55,44 +60,72 @@ def render_day_section(day_data: "DaySectionData", expanded: bool = False):
             header += f", {blocked_count} blocked"
         header += ")"
 
+    _render_day_expander(header, day_data, expanded, key)
+
+
+@st.fragment
+def _render_day_expander(
+    header: str,
+    day_data: "DaySectionData",
+    expanded: bool,
+    key: Optional[str]
+):
+    """Render a day's expander as a fragment.
+
+    Opening or closing a tracked expander reruns only this fragment, not
+    the whole page.
+
+    Args:
+        header: Expander label with task counts
+        day_data: Day section data to display
+        expanded: Whether to expand by default
+        key: Optional unique widget key that enables lazy rendering
+    """
     # Use expander for each day
-    with st.expander(header, expanded=expanded):
-        if not day_data.planned_tasks and not day_data.blocked_tasks:
-            st.caption("No tasks for this day")
-        else:
-            # Task sections in columns
-            col1, col2 = st.columns(2)
-
-            with col1:
-                # Planned tasks (not completed)
-                pending = [t for t in day_data.planned_tasks if not t.is_completed]
-                if pending:
-                    st.markdown("##### 📋 Planned")
-                    for task in pending:
-                        render_task_item(task, "⚪")
-
-                # Blocked tasks
-                if day_data.blocked_tasks:
-                    st.markdown("##### 🚫 Blocked")
-                    for task in day_data.blocked_tasks:
-                        render_task_item(task, "⚠️")
-
-            with col2:
-                # Completed tasks
-                if day_data.completed_tasks:
-                    st.markdown("##### ✅ Completed")
-                    for task in day_data.completed_tasks:
-                        render_task_item(task)
-
-                # In Progress tasks
-                if day_data.in_progress_tasks:
-                    st.markdown("##### 🔄 In Progress")
-                    for task in day_data.in_progress_tasks:
-                        if not task.is_completed:
-                            render_task_item(task, "🔵")
-
-        # Notes section
-        if day_data.notes and day_data.notes.strip():
-            st.markdown("---")
-            st.markdown("##### 📝 Notes")
-            st.markdown(day_data.notes)
+    if key is None:
+        expander = st.expander(header, expanded=expanded)
+    else:
+        expander = st.expander(header, expanded=expanded, key=key, on_change="rerun")
+
+    with expander:
+        # open is None when state is not tracked
+        if expander.open is not False:
+            _render_day_body(day_data)
+
+
+def _render_day_body(day_data: "DaySectionData"):
+    """Render the tasks and notes inside a day's expander.
+
+    Args:
+        day_data: Day section data to display
+    """
+    if not day_data.planned_tasks and not day_data.blocked_tasks:
+        st.caption("No tasks for this day")
+    else:
+        # Task sections in columns
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # Planned tasks (not completed)
+            pending = [t for t in day_data.planned_tasks if not t.is_completed]
+            if pending:
+                render_task_list("##### 📋 Planned", pending, "⚪")
+
+            # Blocked tasks
+            if day_data.blocked_tasks:
+                render_task_list("##### 🚫 Blocked", day_data.blocked_tasks, "⚠️")
+
+        with col2:
+            # Completed tasks
+            if day_data.completed_tasks:
+                render_task_list("##### ✅ Completed", day_data.completed_tasks)
+
+            # In Progress tasks (already excludes completed ones)
+            if day_data.in_progress_tasks:
+                render_task_list("##### 🔄 In Progress", day_data.in_progress_tasks, "🔵")
+
+    # Notes section
+    if day_data.notes and day_data.notes.strip():
+        st.markdown("---")
+        st.markdown("##### 📝 Notes")
+        st.markdown(day_data.notes)
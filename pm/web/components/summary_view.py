@@ -13,12 +13,6 @@ def render_summary_view(journal_data: "WeeklyJournalData"):
     Args:
         journal_data: Weekly journal data with totals
     """
-    # Calculate completion rate
-    if journal_data.total_planned > 0:
-        completion_rate = (journal_data.total_completed / journal_data.total_planned) * 100
-    else:
-        completion_rate = 0
-
     # Stats row using columns
     col1, col2, col3, col4 = st.columns(4)
 
@@ -42,17 +36,9 @@ def render_summary_view(journal_data: "WeeklyJournalData"):
         )
 
     with col4:
-        # Color the completion rate
-        if completion_rate >= 80:
-            delta_color = "normal"
-        elif completion_rate >= 50:
-            delta_color = "off"
-        else:
-            delta_color = "inverse"
-
         st.metric(
             label="📈 Progress",
-            value=f"{completion_rate:.0f}%",
+            value=f"{journal_data.completion_rate:.0f}%",
             delta=None,
-            delta_color=delta_color
+            delta_color=journal_data.delta_color
         )
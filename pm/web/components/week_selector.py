@@ -1,20 +1,68 @@
 """Week selector component for navigation."""
 
+import functools
+
 import streamlit as st
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+
+@functools.lru_cache(maxsize=8)
+def _week_lookup(
+    available_weeks: Tuple[Tuple[int, int, str], ...]
+) -> Tuple[List[str], Dict[str, Tuple[int, int]], Dict[Tuple[int, int], int]]:
+    """Build selectbox options and lookup tables for the available weeks.
+
+    Args:
+        available_weeks: Tuple of (year, week, display_string) tuples
+
+    Returns:
+        Tuple of (display options, display -> (year, week),
+        (year, week) -> option index)
+    """
+    options = [w[2] for w in available_weeks]
+    by_display = {w[2]: (w[0], w[1]) for w in available_weeks}
+    index_of = {}
+    for idx, (year, week, _) in enumerate(available_weeks):
+        # First match wins, like the old linear search
+        index_of.setdefault((year, week), idx)
+    return options, by_display, index_of
+
+
+def _goto_week(year: int, week: int):
+    """Button callback selecting a specific week."""
+    st.session_state.selected_year = year
+    st.session_state.selected_week = week
+
+
+def _goto_previous_week():
+    """Button callback stepping back one week."""
+    # Calculate previous week
+    if st.session_state.selected_week > 1:
+        st.session_state.selected_week -= 1
+    else:
+        st.session_state.selected_year -= 1
+        st.session_state.selected_week = 52
+
+
+def _show_older_weeks():
+    """Button callback doubling the number of weeks listed."""
+    st.session_state.weeks_limit *= 2
 
 
 def render_week_selector(
-    available_weeks: List[Tuple[int, int, str]],
+    available_weeks: Sequence[Tuple[int, int, str]],
     current_year: int,
-    current_week: int
+    current_week: int,
+    has_older: bool = False
 ) -> Tuple[int, int]:
     """Render week selector in sidebar.
 
     Args:
-        available_weeks: List of (year, week, display_string) tuples
+        available_weeks: Sequence of (year, week, display_string) tuples
         current_year: Current year
         current_week: Current ISO week number
+        has_older: Whether older weeks exist beyond available_weeks, which
+            shows a button that doubles st.session_state.weeks_limit
 
     Returns:
         Selected (year, week) tuple
@@ -22,40 +70,36 @@ def render_week_selector(
     st.subheader("Select Week")
 
     # Initialize session state if needed
-    if 'selected_year' not in st.session_state:
-        st.session_state.selected_year = current_year
-    if 'selected_week' not in st.session_state:
-        st.session_state.selected_week = current_week
+    st.session_state.setdefault("selected_year", current_year)
+    st.session_state.setdefault("selected_week", current_week)
 
-    # Quick navigation buttons
+    # Quick navigation buttons (callbacks run before the automatic rerun)
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("Current", use_container_width=True, help="Go to current week"):
-            st.session_state.selected_year = current_year
-            st.session_state.selected_week = current_week
-            st.rerun()
+        st.button(
+            "Current",
+            use_container_width=True,
+            help="Go to current week",
+            on_click=_goto_week,
+            args=(current_year, current_week),
+        )
 
     with col2:
-        if st.button("Previous", use_container_width=True, help="Go to previous week"):
-            # Calculate previous week
-            if st.session_state.selected_week > 1:
-                st.session_state.selected_week -= 1
-            else:
-                st.session_state.selected_year -= 1
-                st.session_state.selected_week = 52
-            st.rerun()
+        st.button(
+            "Previous",
+            use_container_width=True,
+            help="Go to previous week",
+            on_click=_goto_previous_week,
+        )
 
     # Dropdown for all available weeks
     if available_weeks:
-        # Create display options
-        options = [w[2] for w in available_weeks]
+        options, by_display, index_of = _week_lookup(tuple(available_weeks))
 
         # Find default index based on session state
-        default_idx = 0
-        for idx, (year, week, _) in enumerate(available_weeks):
-            if year == st.session_state.selected_year and week == st.session_state.selected_week:
-                default_idx = idx
-                break
+        default_idx = index_of.get(
+            (st.session_state.selected_year, st.session_state.selected_week), 0
+        )
 
         selected_option = st.selectbox(
             "Available Weeks",
@@ -64,12 +108,19 @@ def render_week_selector(
             key="week_dropdown"
         )
 
+        if has_older:
+            st.button(
+                "Show older…",
+                use_container_width=True,
+                on_click=_show_older_weeks,
+            )
+
         # Find selected week from option
-        for year, week, display in available_weeks:
-            if display == selected_option:
-                st.session_state.selected_year = year
-                st.session_state.selected_week = week
-                return year, week
+        if selected_option in by_display:
+            year, week = by_display[selected_option]
+            st.session_state.selected_year = year
+            st.session_state.selected_week = week
+            return year, week
 
     # Fallback to session state values
     return st.session_state.selected_year, st.session_state.selected_week
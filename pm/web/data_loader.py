@@ -3,20 +3,41 @@
 Provides read-only access to journal data through JournalManager.
 """
 
-from dataclasses import dataclass
+import functools
+import os
+import re
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import streamlit as st
 
 from pm.core.manager import TaskManager
 from pm.core.journal_manager import JournalManager
 from pm.core.journal import WeeklyJournal, DaySection, get_current_week
 from pm.core.task import Task, TaskStatus
+from pm.utils.config import get_config
+
+
+# Weekly journal filename, e.g. "2026-W02.md"
+_WEEK_FILE_RE = re.compile(r"^(\d{4})-W(\d{2})\.md$")
 
+# Priority icons (using Unicode emojis)
+_PRIORITY_ICON = {
+    "high": "🔴",
+    "medium": "🟠",
+    "low": "🟢"
+}.get
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TaskDisplayData:
-    """UI-friendly task representation."""
+    """UI-friendly task representation.
+
+    The markdown title line (without the leading status icon) and the
+    caption are built once here, so rendering only emits strings.
+    """
     id: str
     title: str
     type: str
@@ -25,9 +46,33 @@ class TaskDisplayData:
     is_completed: bool
     eta: Optional[str] = None
     notes_count: int = 0
+    markdown: str = field(init=False, default="")
+    caption: str = field(init=False, default="")
 
+    def __post_init__(self):
+        title = f"~~{self.title}~~" if self.is_completed else self.title
+        # Frozen, so derived fields are set through object.__setattr__
+        object.__setattr__(self, "markdown", f"{_PRIORITY_ICON(self.priority, '')} **{title}**")
+        object.__setattr__(self, "caption", f"`{self.id}` | {self.type} | {self.priority}" + (
+            f" | ETA: {self.eta}" if self.eta else ""
+        ))
 
-@dataclass
+    def markdown_with_icon(self, status_icon: str = "") -> str:
+        """Render the task as markdown, caption included on a second line.
+
+        Args:
+            status_icon: Icon to show (checkbox, blocked, etc.)
+
+        Returns:
+            Markdown for the task
+        """
+        # Completed tasks always show a check mark
+        if self.is_completed:
+            status_icon = "✅"
+        return f"{status_icon} {self.markdown}  \n:gray[{self.caption}]"
+
+
+@dataclass(slots=True, frozen=True)
 class DaySectionData:
     """UI-friendly day section representation."""
     date: datetime
@@ -40,9 +85,35 @@ class DaySectionData:
     notes: str
 
 
-@dataclass
+def empty_day(day_date: datetime) -> DaySectionData:
+    """Build the placeholder for a day without a journal section.
+
+    Args:
+        day_date: Date of the day
+
+    Returns:
+        DaySectionData with no tasks or notes
+    """
+    return DaySectionData(
+        date=day_date,
+        day_name=day_date.strftime("%A"),
+        date_str=day_date.strftime("%b %d"),
+        planned_tasks=[],
+        completed_tasks=[],
+        blocked_tasks=[],
+        in_progress_tasks=[],
+        notes=""
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class WeeklyJournalData:
-    """UI-friendly weekly journal representation."""
+    """UI-friendly weekly journal representation.
+
+    Only days with journal entries are stored in days; use iter_days()
+    to walk the full week. The completion rate and its metric color are
+    derived from the totals at construction.
+    """
     year: int
     week: int
     week_start: datetime
@@ -51,6 +122,230 @@ class WeeklyJournalData:
     days: Dict[str, DaySectionData]
     total_planned: int = 0
     total_completed: int = 0
+    completion_rate: float = field(init=False, default=0.0)
+    delta_color: str = field(init=False, default="normal")
+
+    def __post_init__(self):
+        if self.total_planned > 0:
+            rate = (self.total_completed / self.total_planned) * 100
+        else:
+            rate = 0.0
+        # Metric color for the completion rate
+        if rate >= 80:
+            color = "normal"
+        elif rate >= 50:
+            color = "off"
+        else:
+            color = "inverse"
+        object.__setattr__(self, "completion_rate", rate)
+        object.__setattr__(self, "delta_color", color)
+
+    def iter_days(self) -> Iterator[Tuple[str, DaySectionData]]:
+        """Yield (day_key, day data) for Monday to Sunday.
+
+        Days missing from days are filled in with empty_day().
+        """
+        for i in range(7):
+            day_date = self.week_start + timedelta(days=i)
+            day_key = day_date.strftime("%Y-%m-%d")
+            day_data = self.days.get(day_key)
+            yield day_key, day_data if day_data is not None else empty_day(day_date)
+
+
+# (id, title, type, priority, status, eta, notes_count)
+TaskSnapshot = Tuple[str, str, str, str, str, Optional[str], int]
+
+
+def _task_snapshot(task: Task) -> TaskSnapshot:
+    """Reduce a task to the immutable fields the UI displays."""
+    return (
+        task.id,
+        task.title,
+        task.type.value,
+        task.priority.value,
+        task.status.value,
+        task.eta.strftime("%Y-%m-%d") if task.eta else None,
+        len(task.notes),
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _week_display(year: int, week: int) -> str:
+    """Format a week with its date range, e.g. "2026-W02 (Jan 05 - Jan 11)"."""
+    week_start = WeeklyJournal._get_week_start(year, week)
+    week_end = week_start + timedelta(days=6)
+    return f"{year}-W{week:02d} ({week_start.strftime('%b %d')} - {week_end.strftime('%b %d')})"
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_weeks(journal_dir: str, dir_mtime_ns: int) -> Tuple[Tuple[int, int, str], ...]:
+    """List journal weeks found in a directory.
+
+    Args:
+        journal_dir: Journal directory path
+        dir_mtime_ns: Directory mtime, only used as part of the cache key
+
+    Returns:
+        Tuple of (year, week, display_string) tuples, sorted newest first
+    """
+    weeks = []
+
+    # Only names are needed, so plain strings from listdir suffice
+    for name in os.listdir(journal_dir):
+        # Match filenames like "2026-W02.md"
+        match = _WEEK_FILE_RE.match(name)
+        if match:
+            year, week = int(match.group(1)), int(match.group(2))
+            weeks.append((year, week, _week_display(year, week)))
+
+    # Sort by year and week descending (newest first)
+    weeks.sort(key=lambda x: (x[0], x[1]), reverse=True)
+    return tuple(weeks)
+
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def _load_journal_cached(
+    journal_dir: str,
+    year: int,
+    week: int,
+    mtime_ns: int,
+    tasks: Tuple[TaskSnapshot, ...]
+) -> WeeklyJournalData:
+    """Parse a journal file and convert it for display.
+
+    Args:
+        journal_dir: Journal directory path
+        year: Year number
+        week: ISO week number
+        mtime_ns: Journal file mtime, only used as part of the cache key
+        tasks: Snapshot of all tasks, also part of the cache key
+
+    Returns:
+        WeeklyJournalData for the week
+    """
+    journal = WeeklyJournal(year, week, Path(journal_dir))
+    journal.load({})
+    return _convert_journal(journal, {t[0]: t for t in tasks})
+
+
+def _convert_journal(
+    journal: WeeklyJournal,
+    tasks_by_id: Dict[str, TaskSnapshot]
+) -> WeeklyJournalData:
+    """Convert WeeklyJournal to WeeklyJournalData."""
+    week_range = f"{journal.week_start.strftime('%b %d')} - {journal.week_end.strftime('%b %d, %Y')}"
+
+    days_data = {}
+    total_planned = 0
+    total_completed = 0
+
+    # Only days with entries; iter_days() fills in the rest
+    for day_key, day_section in journal.days.items():
+        if not (day_section.planned or day_section.completed
+                or day_section.blocked or day_section.notes):
+            continue
+        day_data = _convert_day_section(day_section, tasks_by_id)
+        total_planned += len(day_data.planned_tasks)
+        total_completed += len(day_data.completed_tasks)
+        days_data[day_key] = day_data
+
+    return WeeklyJournalData(
+        year=journal.year,
+        week=journal.week,
+        week_start=journal.week_start,
+        week_end=journal.week_end,
+        week_range_str=week_range,
+        days=days_data,
+        total_planned=total_planned,
+        total_completed=total_completed
+    )
+
+
+def _convert_day_section(
+    section: DaySection,
+    tasks_by_id: Dict[str, TaskSnapshot]
+) -> DaySectionData:
+    """Convert DaySection to DaySectionData."""
+    completed_set = frozenset(section.completed)
+    in_progress_status = TaskStatus.IN_PROGRESS.value
+
+    # Display data is frozen, so a task listed twice (planned and
+    # completed, say) shares one instance
+    displays: Dict[Tuple[str, bool], TaskDisplayData] = {}
+
+    def task_to_display(task: TaskSnapshot, completed: bool) -> TaskDisplayData:
+        display = displays.get((task[0], completed))
+        if display is None:
+            task_id, title, task_type, priority, status, eta, notes_count = task
+            display = displays[task_id, completed] = TaskDisplayData(
+                id=task_id,
+                title=title,
+                type=task_type,
+                priority=priority,
+                status=status,
+                is_completed=completed,
+                eta=eta,
+                notes_count=notes_count
+            )
+        return display
+
+    planned = []
+    # Planned tasks that are not completed and have in_progress status
+    in_progress = []
+    for tid in section.planned:
+        task = tasks_by_id.get(tid)
+        if task:
+            display = task_to_display(task, tid in completed_set)
+            planned.append(display)
+            if not display.is_completed and display.status == in_progress_status:
+                in_progress.append(display)
+
+    completed = [
+        task_to_display(tasks_by_id[tid], True)
+        for tid in section.completed if tid in tasks_by_id
+    ]
+    blocked = [
+        task_to_display(tasks_by_id[tid], tid in completed_set)
+        for tid in section.blocked if tid in tasks_by_id
+    ]
+
+    return DaySectionData(
+        date=section.date,
+        day_name=section.date.strftime("%A"),
+        date_str=section.date.strftime("%b %d"),
+        planned_tasks=planned,
+        completed_tasks=completed,
+        blocked_tasks=blocked,
+        in_progress_tasks=in_progress,
+        notes=section.notes
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _get_task_manager(config_key: tuple) -> TaskManager:
+    """Process-wide TaskManager, shared by all sessions and loaders.
+
+    Args:
+        config_key: Config values the manager is built from
+
+    Returns:
+        TaskManager for the current config
+    """
+    return TaskManager()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_journal_manager(config_key: tuple, journal_dir: Optional[str]) -> JournalManager:
+    """Process-wide JournalManager on top of the shared TaskManager.
+
+    Args:
+        config_key: Config values the managers are built from
+        journal_dir: Optional custom journal directory path
+
+    Returns:
+        JournalManager for the current config and journal directory
+    """
+    return JournalManager(_get_task_manager(config_key), journal_dir=journal_dir)
 
 
 class JournalDataLoader:
@@ -59,47 +354,58 @@ class JournalDataLoader:
     def __init__(self, journal_dir: Optional[str] = None):
         """Initialize data loader.
 
+        Managers are shared across loaders; call reload() to pick up task
+        edits made since they were created.
+
         Args:
             journal_dir: Optional custom journal directory path
         """
-        self._task_manager = TaskManager()
-        self._journal_manager = JournalManager(
-            self._task_manager,
-            journal_dir=journal_dir
+        config = get_config()
+        # Config values the managers depend on, so each data dir gets its own
+        key = (
+            str(config.data_path),
+            config.storage_mode,
+            config.backup.enabled,
+            config.backup.max_backups_per_week,
+            config.backup.retention_days,
         )
+        self._task_manager = _get_task_manager(key)
+        self._journal_manager = _get_journal_manager(key, journal_dir)
+        # Task index the snapshot was built from; replaced on every reload
+        self._snapshot_source = None
+        self._tasks_snapshot: Tuple[TaskSnapshot, ...] = ()
 
-    def get_available_weeks(self) -> List[Tuple[int, int, str]]:
+    def reload(self) -> None:
+        """Reload tasks from storage so a long-lived loader sees new edits."""
+        self._task_manager.reload_tasks()
+
+    def get_available_weeks(self, limit: Optional[int] = 26) -> Tuple[Tuple[int, int, str], ...]:
         """Get list of available journal weeks.
 
+        The listing is cached on the journal directory's mtime, which
+        changes whenever a journal file is added, removed or renamed.
+
+        Args:
+            limit: Maximum number of weeks to return (newest first), or None
+                for all of them
+
         Returns:
-            List of (year, week, display_string) tuples, sorted newest first
+            Tuple of (year, week, display_string) tuples, sorted newest first
         """
         journal_dir = self._journal_manager.journal_dir
-        weeks = []
-
-        for file in journal_dir.glob("????-W??.md"):
-            # Parse filename like "2026-W02.md"
-            try:
-                stem = file.stem  # "2026-W02"
-                year = int(stem[:4])
-                week = int(stem[6:8])
-
-                # Get week date range for display
-                week_start = WeeklyJournal._get_week_start(year, week)
-                week_end = week_start + timedelta(days=6)
-                display = f"{year}-W{week:02d} ({week_start.strftime('%b %d')} - {week_end.strftime('%b %d')})"
-
-                weeks.append((year, week, display))
-            except (ValueError, IndexError):
-                continue
-
-        # Sort by year and week descending (newest first)
-        weeks.sort(key=lambda x: (x[0], x[1]), reverse=True)
-        return weeks
+        try:
+            dir_mtime_ns = journal_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return ()
+        weeks = _list_weeks(str(journal_dir), dir_mtime_ns)
+        return weeks if limit is None else weeks[:limit]
 
     def get_journal_data(self, year: int, week: int) -> Optional[WeeklyJournalData]:
         """Load journal data for a specific week.
 
+        Results are cached on the journal file's mtime and a snapshot of the
+        displayed task fields, so reruns skip parsing until something changes.
+
         Args:
             year: Year number
             week: ISO week number
@@ -107,106 +413,25 @@ class JournalDataLoader:
         Returns:
             WeeklyJournalData or None if journal doesn't exist
         """
-        journal = WeeklyJournal(year, week, self._journal_manager.journal_dir)
-
-        if not journal.exists():
+        journal_dir = self._journal_manager.journal_dir
+        try:
+            mtime_ns = (journal_dir / f"{year}-W{week:02d}.md").stat().st_mtime_ns
+        except FileNotFoundError:
             return None
 
-        # Load tasks for reference
-        tasks_by_id = {t.id: t for t in self._task_manager.get_all_tasks()}
-        journal.load(tasks_by_id)
-
-        # Convert to UI-friendly format
-        return self._convert_journal(journal, tasks_by_id)
-
-    def _convert_journal(
-        self,
-        journal: WeeklyJournal,
-        tasks_by_id: Dict[str, Task]
-    ) -> WeeklyJournalData:
-        """Convert WeeklyJournal to WeeklyJournalData."""
-        week_range = f"{journal.week_start.strftime('%b %d')} - {journal.week_end.strftime('%b %d, %Y')}"
-
-        days_data = {}
-        total_planned = 0
-        total_completed = 0
-
-        for i in range(7):  # Monday to Sunday
-            day_date = journal.week_start + timedelta(days=i)
-            day_key = journal.get_day_key(day_date)
-            day_section = journal.days.get(day_key)
-
-            if day_section:
-                day_data = self._convert_day_section(day_section, tasks_by_id)
-                total_planned += len(day_data.planned_tasks)
-                total_completed += len(day_data.completed_tasks)
-            else:
-                day_data = DaySectionData(
-                    date=day_date,
-                    day_name=day_date.strftime("%A"),
-                    date_str=day_date.strftime("%b %d"),
-                    planned_tasks=[],
-                    completed_tasks=[],
-                    blocked_tasks=[],
-                    in_progress_tasks=[],
-                    notes=""
-                )
-
-            days_data[day_key] = day_data
-
-        return WeeklyJournalData(
-            year=journal.year,
-            week=journal.week,
-            week_start=journal.week_start,
-            week_end=journal.week_end,
-            week_range_str=week_range,
-            days=days_data,
-            total_planned=total_planned,
-            total_completed=total_completed
+        return _load_journal_cached(
+            str(journal_dir), year, week, mtime_ns, self._task_snapshots()
         )
 
-    def _convert_day_section(
-        self,
-        section: DaySection,
-        tasks_by_id: Dict[str, Task]
-    ) -> DaySectionData:
-        """Convert DaySection to DaySectionData."""
-        def task_to_display(task_id: str, completed: bool = False) -> Optional[TaskDisplayData]:
-            task = tasks_by_id.get(task_id)
-            if not task:
-                return None
-            return TaskDisplayData(
-                id=task.id,
-                title=task.title,
-                type=task.type.value,
-                priority=task.priority.value,
-                status=task.status.value,
-                is_completed=completed or task_id in section.completed,
-                eta=task.eta.strftime("%Y-%m-%d") if task.eta else None,
-                notes_count=len(task.notes)
-            )
-
-        planned = [t for t in (task_to_display(tid) for tid in section.planned) if t]
-        completed = [t for t in (task_to_display(tid, True) for tid in section.completed) if t]
-        blocked = [t for t in (task_to_display(tid) for tid in section.blocked) if t]
-
-        # Identify in-progress tasks (planned but not completed, with in_progress status)
-        in_progress = [
-            t for t in planned
-            if not t.is_completed and tasks_by_id.get(t.id)
-            and tasks_by_id[t.id].status == TaskStatus.IN_PROGRESS
-        ]
-
-        return DaySectionData(
-            date=section.date,
-            day_name=section.date.strftime("%A"),
-            date_str=section.date.strftime("%b %d"),
-            planned_tasks=planned,
-            completed_tasks=completed,
-            blocked_tasks=blocked,
-            in_progress_tasks=in_progress,
-            notes=section.notes
-        )
+    def _task_snapshots(self) -> Tuple[TaskSnapshot, ...]:
+        """Get display snapshots of all tasks, rebuilt only after a reload."""
+        # The loader never writes tasks, so the index only changes when
+        # reload_tasks() swaps in a new one
+        index = self._task_manager._tasks
+        if index is not self._snapshot_source:
+            self._tasks_snapshot = tuple(_task_snapshot(t) for t in index.values())
+            self._snapshot_source = index
+        return self._tasks_snapshot
 
     def get_current_week(self) -> Tuple[int, int]:
         """Get current year and week number."""
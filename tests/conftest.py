@@ -1,24 +1,30 @@
 """Shared test fixtures for PM app tests."""
 
+import os
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 from datetime import datetime
 
 from pm.core.task import Task, TaskType, TaskStatus, TaskPriority, CheckFrequency
-from pm.core.storage import TaskStorage
+from pm.core.storage import TaskStorage, JournalStorage
 from pm.core.manager import TaskManager
 from pm.utils.config import Config
 
 
+def pytest_configure(config):
+    """Keep pytest's temporary directories in RAM when /dev/shm is available."""
+    shm = Path("/dev/shm")
+    if "PYTEST_DEBUG_TEMPROOT" not in os.environ and shm.is_dir() and os.access(shm, os.W_OK):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = str(shm)
+
+
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test data."""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    # Cleanup
-    shutil.rmtree(temp_path)
+def temp_dir(tmp_path):
+    """Create a temporary directory for test data.
+
+    Directories are left for pytest's basetemp cleanup.
+    """
+    return tmp_path
 
 
 @pytest.fixture
@@ -30,10 +36,47 @@ def test_config(temp_dir):
     )
 
 
+def _clear_files(directory: Path) -> None:
+    """Delete every file under a directory, keeping the directories."""
+    for path in directory.rglob("*"):
+        if path.is_file():
+            path.unlink()
+
+
+@pytest.fixture(scope="module")
+def _module_storage(tmp_path_factory):
+    """TaskStorage shared by the tests of one module."""
+    data_dir = tmp_path_factory.mktemp("pm", numbered=True)
+    return TaskStorage(data_dir=str(data_dir), storage_mode="multi_file")
+
+
+@pytest.fixture
+def storage(_module_storage):
+    """Create a TaskStorage instance for testing, emptied after each test."""
+    yield _module_storage
+    _clear_files(_module_storage.data_dir)
+
+
+@pytest.fixture(scope="module")
+def _module_journal_storage(tmp_path_factory):
+    """JournalStorage shared by the tests of one module."""
+    data_dir = tmp_path_factory.mktemp("pm-journal", numbered=True)
+    return JournalStorage(data_dir=str(data_dir), backup_enabled=False)
+
+
+@pytest.fixture
+def journal_storage(_module_journal_storage):
+    """Create a JournalStorage instance for testing, emptied after each test."""
+    yield _module_journal_storage
+    _clear_files(_module_journal_storage.data_dir)
+
+
 @pytest.fixture
-def storage(temp_dir):
-    """Create a TaskStorage instance for testing."""
-    return TaskStorage(data_dir=str(temp_dir), storage_mode="multi_file")
+def frozen_now(monkeypatch):
+    """Freeze the clock used by manager queries and journal tools."""
+    fixed = datetime(2026, 1, 10, 12, 0, 0)
+    monkeypatch.setattr("pm.utils.clock.now", lambda: fixed)
+    return fixed
 
 
 @pytest.fixture
@@ -83,18 +126,28 @@ def multiple_tasks():
     ]
 
 
-@pytest.fixture
-def manager(temp_dir, monkeypatch):
-    """Create a TaskManager instance for testing."""
-    # Mock get_config to return test config
+@pytest.fixture(scope="module")
+def _module_manager(tmp_path_factory):
+    """TaskManager shared by the tests of one module."""
+    # Mock get_config to return test config; tasks stay in memory since
+    # file round-trips are covered by the storage tests
     test_cfg = Config(
-        data_dir=str(temp_dir),
-        storage_mode="multi_file",
+        data_dir=str(tmp_path_factory.mktemp("pm", numbered=True)),
+        storage_mode="memory",
     )
 
     def mock_get_config(*args, **kwargs):
         return test_cfg
 
-    monkeypatch.setattr("pm.core.manager.get_config", mock_get_config)
+    # get_config is only read while the manager is constructed
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("pm.core.manager.get_config", mock_get_config)
+        return TaskManager()
 
-    return TaskManager()
+
+@pytest.fixture
+def manager(_module_manager):
+    """Create a TaskManager instance for testing, emptied after each test."""
+    yield _module_manager
+    _module_manager.storage.clear_memory()
+    _module_manager.load_tasks()
@@ -1,72 +1,49 @@
 """Test fixtures for MCP tests."""
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 from datetime import datetime
+from uuid import uuid4
 
 from pm.core.task import Task, TaskType, TaskStatus, TaskPriority, CheckFrequency
-from pm.core.journal import WeeklyJournal, DaySection, WeeklySummary, get_current_week
+from pm.core.journal import DaySection, WeeklySummary, get_current_week
 from pm.core.manager import TaskManager
 from pm.core.journal_manager import JournalManager
+from pm.mcp.tools._managers import bind_managers, unbind_managers
+from pm.utils.config import BackupConfig, Config, override_config
 
 
-@pytest.fixture
-def mcp_temp_dir():
-    """Create a temporary directory for MCP test data."""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    # Cleanup
-    shutil.rmtree(temp_path)
+@pytest.fixture(scope="session")
+def mcp_session_root(tmp_path_factory):
+    """Session-wide parent directory for MCP test data."""
+    return tmp_path_factory.mktemp("mcp-root")
+
 
+@pytest.fixture
+def mcp_temp_dir(mcp_session_root):
+    """Create a fresh data directory (with an empty tasks dir) for one test.
 
-@pytest.fixture(autouse=True)
-def clean_test_dir(mcp_temp_dir):
-    """Clean test directory before each test."""
-    # Clean tasks directory before each test
-    tasks_dir = mcp_temp_dir / "tasks"
-    if tasks_dir.exists():
-        shutil.rmtree(tasks_dir)
-    tasks_dir.mkdir(parents=True)
-    yield
+    Directories are left for pytest's basetemp cleanup rather than removed
+    after every test.
+    """
+    temp_path = mcp_session_root / f"t{uuid4().hex}"
+    (temp_path / "tasks").mkdir(parents=True)
+    return temp_path
 
 
 @pytest.fixture
-def mcp_manager(mcp_temp_dir, monkeypatch):
+def mcp_manager(mcp_temp_dir):
     """TaskManager with test data directory."""
-    import pm.utils.config as config_module
-    from pm.utils.config import Config, ConfigManager
-
-    # Reset the global config manager singleton
-    config_module._config_manager = None
-
     test_cfg = Config(
         data_dir=str(mcp_temp_dir),
         storage_mode="multi_file",
     )
 
-    # Create a test config manager
-    test_config_manager = ConfigManager.__new__(ConfigManager)
-    test_config_manager.config = test_cfg
-    test_config_manager.config_file = mcp_temp_dir / "test_config.yaml"
-
-    # Patch the global singleton
-    config_module._config_manager = test_config_manager
-
-    # Also patch get_config to ensure it returns our test config
-    def mock_get_config(*args, **kwargs):
-        return test_cfg
-
-    monkeypatch.setattr("pm.utils.config.get_config", mock_get_config)
-
-    # Create and return task manager (which will now use test config)
-    manager = TaskManager()
-
-    # Reset singleton after test to avoid affecting other tests
-    yield manager
-
-    config_module._config_manager = None
+    with override_config(test_cfg):
+        manager = TaskManager()
+        # Tools in this test use this manager rather than the shared ones
+        token = bind_managers(manager, JournalManager(manager))
+        yield manager
+        unbind_managers(token)
 
 
 @pytest.fixture
@@ -120,45 +97,24 @@ def sample_weekly_summary():
 
 
 @pytest.fixture
-def journal_mode_manager(mcp_temp_dir, monkeypatch):
+def journal_mode_manager(mcp_temp_dir):
     """TaskManager configured for journal mode with test data directory."""
-    import pm.utils.config as config_module
-    from pm.utils.config import Config, ConfigManager, BackupConfig
-
-    # Reset the global config manager singleton
-    config_module._config_manager = None
-
     test_cfg = Config(
         data_dir=str(mcp_temp_dir),
         storage_mode="journal",  # Use journal mode
         backup=BackupConfig(enabled=True),
     )
 
-    # Create a test config manager
-    test_config_manager = ConfigManager.__new__(ConfigManager)
-    test_config_manager.config = test_cfg
-    test_config_manager.config_file = mcp_temp_dir / "test_config.yaml"
-
-    # Patch the global singleton
-    config_module._config_manager = test_config_manager
-
-    # Also patch get_config to ensure it returns our test config
-    def mock_get_config(*args, **kwargs):
-        return test_cfg
-
-    monkeypatch.setattr("pm.utils.config.get_config", mock_get_config)
-
     # Create journal directory
     journal_dir = mcp_temp_dir / "journal"
     journal_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create and return task manager (which will now use test config)
-    manager = TaskManager()
-
-    # Reset singleton after test to avoid affecting other tests
-    yield manager
-
-    config_module._config_manager = None
+    with override_config(test_cfg):
+        manager = TaskManager()
+        # Tools in this test use this manager rather than the shared ones
+        token = bind_managers(manager, JournalManager(manager))
+        yield manager
+        unbind_managers(token)
 
 
 @pytest.fixture
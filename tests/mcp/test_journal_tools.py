@@ -1,8 +1,8 @@
 """Tests for MCP journal tools."""
 
 import pytest
-from datetime import datetime, timedelta
 
+from pm.mcp.tools import read_cache
 from pm.mcp.tools.task_tools import create_task
 from pm.mcp.tools.journal_tools import (
     start_journal_day,
@@ -11,6 +11,8 @@ from pm.mcp.tools.journal_tools import (
     sync_journal,
     generate_week_summary,
     get_quarterly_summary,
+    list_journal_backups,
+    restore_journal_backup,
 )
 
 
@@ -90,6 +92,16 @@ class TestGetCurrentJournal:
         # Should create a new journal or return info about missing journal
         assert isinstance(result, dict)
 
+    def test_get_current_journal_creating_call_invalidates(self, mcp_manager, mcp_temp_dir):
+        """Test a call that creates the journal invalidates cached reads."""
+        version = read_cache._version
+
+        result = get_current_journal()
+
+        assert result["content"]
+        assert read_cache._version > version
+        assert get_current_journal() == result
+
     def test_get_current_journal_has_days(self, mcp_manager, mcp_temp_dir):
         """Test that journal content includes day sections."""
         start_journal_day()
@@ -171,17 +183,14 @@ class TestGetQuarterlySummary:
         assert "quarter" in result
         assert "total_completed" in result or "achievements" in result
 
-    def test_get_quarterly_summary_current_quarter(self, mcp_manager, mcp_temp_dir):
+    def test_get_quarterly_summary_current_quarter(self, mcp_manager, mcp_temp_dir, frozen_now):
         """Test getting current quarter summary."""
-        # Should default to current quarter
-        now = datetime.now()
-        year = now.year
-        quarter = (now.month - 1) // 3 + 1
-
+        # Should default to the (frozen) current quarter
         result = get_quarterly_summary()
 
         assert isinstance(result, dict)
-        # Should use current year/quarter if not specified
+        assert result["year"] == frozen_now.year
+        assert result["quarter"] == 1
 
     def test_get_quarterly_summary_empty(self, mcp_manager, mcp_temp_dir):
         """Test quarterly summary with no completed tasks."""
@@ -190,6 +199,21 @@ class TestGetQuarterlySummary:
         assert isinstance(result, dict)
         assert result.get("total_completed", 0) == 0 or isinstance(result.get("achievements", []), list)
 
+    def test_quarterly_summary_loads_only_quarter_weeks(self, mcp_journal_manager, monkeypatch):
+        """Test only journals inside the quarter are loaded."""
+        from pm.core.journal import WeeklyJournal
+
+        journal_dir = mcp_journal_manager.journal_dir
+        for name in ("2026-W02.md", "2026-W02-summary.md", "2026-W30.md", "notes.txt"):
+            (journal_dir / name).write_text("# Week\n")
+        loaded = []
+        monkeypatch.setattr(WeeklyJournal, "load", lambda self, *args: loaded.append((self.year, self.week)))
+
+        mcp_journal_manager.get_quarterly_summary(2026, 1)
+
+        assert mcp_journal_manager._journal_weeks() == [(2026, 2), (2026, 30)]
+        assert loaded == [(2026, 2)]
+
     def test_get_quarterly_summary_invalid_quarter(self, mcp_manager, mcp_temp_dir):
         """Test quarterly summary with invalid quarter."""
         with pytest.raises(ValueError):
@@ -199,3 +223,60 @@ class TestGetQuarterlySummary:
         """Test quarterly summary with invalid year."""
         with pytest.raises(ValueError):
             get_quarterly_summary(year=1900, quarter=1)
+
+
+class TestJournalBackups:
+    """Test list_journal_backups and restore_journal_backup MCP tools."""
+
+    def _write_backup(self, mcp_temp_dir, content="# Backup\n"):
+        week_dir = mcp_temp_dir / "backups" / "2026-W02"
+        week_dir.mkdir(parents=True, exist_ok=True)
+        backup_path = week_dir / "2026-01-07T10-00-00.md"
+        backup_path.write_text(content)
+        return backup_path
+
+    def test_list_journal_backups_empty(self, mcp_manager, mcp_temp_dir):
+        """Test listing backups for a week without any."""
+        result = list_journal_backups(year=2026, week=2)
+
+        assert result["backup_count"] == 0
+        assert result["backups"] == []
+
+    def test_list_journal_backups(self, mcp_manager, mcp_temp_dir):
+        """Test listing existing backups."""
+        backup_path = self._write_backup(mcp_temp_dir)
+
+        result = list_journal_backups(year=2026, week=2)
+
+        assert result["backup_count"] == 1
+        assert result["backups"][0]["path"] == str(backup_path)
+
+    def test_restore_journal_backup(self, mcp_manager, mcp_temp_dir):
+        """Test restoring a journal from a backup."""
+        backup_path = self._write_backup(mcp_temp_dir, "# Restored\n")
+        (mcp_temp_dir / "journal").mkdir(exist_ok=True)
+
+        result = restore_journal_backup(str(backup_path))
+
+        assert result["year"] == 2026
+        assert result["week"] == 2
+        assert (mcp_temp_dir / "journal" / "2026-W02.md").read_text() == "# Restored\n"
+
+    def test_restore_journal_backup_missing(self, mcp_manager, mcp_temp_dir):
+        """Test restoring from a missing backup file."""
+        with pytest.raises(FileNotFoundError):
+            restore_journal_backup(str(mcp_temp_dir / "backups" / "2026-W02" / "nope.md"))
+
+    def test_restore_journal_backup_invalid_path(self, mcp_manager, mcp_temp_dir):
+        """Test restoring from a path outside a week directory."""
+        bad_path = mcp_temp_dir / "not-a-week.md"
+        bad_path.write_text("x")
+
+        with pytest.raises(ValueError):
+            restore_journal_backup(str(bad_path))
+
+    def test_backup_manager_reused(self, mcp_manager):
+        """Test the backup manager is shared across calls with the same config."""
+        from pm.mcp.tools.journal_tools import _get_backup_manager
+
+        assert _get_backup_manager() is _get_backup_manager()
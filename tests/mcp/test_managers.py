@@ -0,0 +1,79 @@
+"""Tests for shared MCP manager instances."""
+
+import os
+
+import pytest
+
+from pm.mcp.tools import _managers
+from pm.mcp.tools._managers import get_managers
+
+
+@pytest.fixture
+def shared_manager(mcp_manager):
+    """mcp_manager with its bound managers lifted, so tools use shared ones."""
+    token = _managers._bound.set(None)
+    yield mcp_manager
+    _managers._bound.reset(token)
+
+
+class TestGetManagers:
+    """Test get_managers helper."""
+
+    def test_managers_are_reused(self, shared_manager):
+        """Test repeated calls return the same instances."""
+        task_manager, journal_manager = get_managers()
+
+        assert get_managers() == (task_manager, journal_manager)
+        assert journal_manager.task_manager is task_manager
+
+    def test_reused_manager_sees_external_changes(self, shared_manager):
+        """Test tasks saved elsewhere are visible on the next call."""
+        get_managers()
+        task = shared_manager.create_task(title="Created Elsewhere")
+
+        task_manager, _ = get_managers()
+
+        assert task_manager.get_task(task.id) is not None
+
+    def test_new_data_dir_gets_new_managers(self, shared_manager, tmp_path):
+        """Test a config change builds fresh managers."""
+        task_manager, _ = get_managers()
+
+        shared_manager.config.data_dir = str(tmp_path)
+
+        assert get_managers()[0] is not task_manager
+
+    def test_bound_managers_take_precedence(self, mcp_manager):
+        """Test the fixture-bound manager is handed to tools."""
+        task_manager, journal_manager = get_managers()
+
+        assert task_manager is mcp_manager
+        assert journal_manager.task_manager is mcp_manager
+
+    def test_unchanged_files_skip_reload(self, shared_manager, monkeypatch):
+        """Test tasks are not reloaded while the task files are unchanged."""
+        task = shared_manager.create_task(title="Settled")
+        task_path = shared_manager.storage.tasks_dir / f"{task.id}.md"
+        os.utime(task_path, ns=(1_000_000_000, 1_000_000_000))
+        task_manager, _ = get_managers()
+
+        reloads = []
+        monkeypatch.setattr(task_manager, "reload_tasks", lambda: reloads.append(1))
+        get_managers()
+        assert reloads == []
+
+        _managers.mark_tasks_stale()
+        get_managers()
+        assert reloads == [1]
+
+    def test_changed_files_reload(self, shared_manager):
+        """Test an edit after a trusted load is picked up."""
+        task = shared_manager.create_task(title="Before")
+        task_path = shared_manager.storage.tasks_dir / f"{task.id}.md"
+        os.utime(task_path, ns=(1_000_000_000, 1_000_000_000))
+        get_managers()
+
+        shared_manager.update_task(task.id, title="After")
+        task_manager, _ = get_managers()
+
+        assert task_manager.get_task(task.id).title == "After"
@@ -1,9 +1,10 @@
 """Tests for MCP query tools."""
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 
-from pm.mcp.tools.task_tools import create_task
+from pm.core.manager import TaskManager
+from pm.mcp.tools.task_tools import create_task, create_tasks_bulk
 from pm.mcp.tools.query_tools import (
     get_overdue_tasks,
     get_tasks_needing_check,
@@ -15,10 +16,10 @@ from pm.mcp.tools.query_tools import (
 class TestGetOverdueTasks:
     """Test get_overdue_tasks MCP tool."""
 
-    def test_get_overdue_tasks_with_overdue(self, mcp_manager):
+    def test_get_overdue_tasks_with_overdue(self, mcp_manager, frozen_now):
         """Test getting overdue tasks."""
-        yesterday = (datetime.now() - timedelta(days=1)).isoformat()
-        tomorrow = (datetime.now() + timedelta(days=1)).isoformat()
+        yesterday = (frozen_now - timedelta(days=1)).isoformat()
+        tomorrow = (frozen_now + timedelta(days=1)).isoformat()
 
         # Create tasks
         create_task(title="Overdue Task 1", eta=yesterday, status="in_progress")
@@ -34,9 +35,9 @@ class TestGetOverdueTasks:
         assert "Overdue Task 1" in titles
         assert "Overdue Task 2" in titles
 
-    def test_get_overdue_tasks_excludes_done(self, mcp_manager):
+    def test_get_overdue_tasks_excludes_done(self, mcp_manager, frozen_now):
         """Test that done tasks are not included in overdue."""
-        yesterday = (datetime.now() - timedelta(days=1)).isoformat()
+        yesterday = (frozen_now - timedelta(days=1)).isoformat()
 
         create_task(title="Done but overdue", eta=yesterday, status="done")
         create_task(title="Overdue and active", eta=yesterday, status="in_progress")
@@ -46,9 +47,9 @@ class TestGetOverdueTasks:
         assert len(result) == 1
         assert result[0]["title"] == "Overdue and active"
 
-    def test_get_overdue_tasks_empty(self, mcp_manager):
+    def test_get_overdue_tasks_empty(self, mcp_manager, frozen_now):
         """Test getting overdue tasks when none exist."""
-        tomorrow = (datetime.now() + timedelta(days=1)).isoformat()
+        tomorrow = (frozen_now + timedelta(days=1)).isoformat()
 
         create_task(title="Future task", eta=tomorrow, status="todo")
         create_task(title="No ETA task", status="todo")
@@ -61,19 +62,17 @@ class TestGetOverdueTasks:
 class TestGetTasksNeedingCheck:
     """Test get_tasks_needing_check MCP tool."""
 
-    def test_get_tasks_needing_daily_check(self, mcp_manager):
+    def test_get_tasks_needing_daily_check(self, mcp_manager, frozen_now):
         """Test getting tasks that need daily check."""
-        yesterday = (datetime.now() - timedelta(days=1)).isoformat()
+        yesterday = (frozen_now - timedelta(days=1)).isoformat()
 
         # Task that needs check (last checked yesterday, daily frequency)
         create_task(title="Daily Task", check_frequency="daily", status="in_progress")
 
         # Manually update last_checked to yesterday
-        from pm.core.manager import TaskManager
         manager = TaskManager()
-        tasks = manager.get_all_tasks()
-        task = tasks[0]
-        task.last_checked = datetime.now() - timedelta(days=2)
+        task = next(manager.iter_tasks())
+        task.last_checked = frozen_now - timedelta(days=2)
         manager.storage.save_task(task)
 
         result = get_tasks_needing_check()
@@ -110,11 +109,13 @@ class TestGetTaskSummary:
     def test_get_task_summary(self, mcp_manager):
         """Test getting task summary statistics."""
         # Create tasks with different statuses, types, priorities
-        create_task(title="Todo 1", status="todo", task_type="dat_ticket", priority="high")
-        create_task(title="Todo 2", status="todo", task_type="project", priority="medium")
-        create_task(title="In Progress 1", status="in_progress", task_type="dat_ticket", priority="high")
-        create_task(title="Done 1", status="done", task_type="general", priority="low")
-        create_task(title="Blocked 1", status="blocked", task_type="cross_team", priority="medium")
+        create_tasks_bulk([
+            {"title": "Todo 1", "status": "todo", "task_type": "dat_ticket", "priority": "high"},
+            {"title": "Todo 2", "status": "todo", "task_type": "project", "priority": "medium"},
+            {"title": "In Progress 1", "status": "in_progress", "task_type": "dat_ticket", "priority": "high"},
+            {"title": "Done 1", "status": "done", "task_type": "general", "priority": "low"},
+            {"title": "Blocked 1", "status": "blocked", "task_type": "cross_team", "priority": "medium"},
+        ])
 
         result = get_task_summary()
 
@@ -165,78 +166,59 @@ class TestGetTaskSummary:
         assert result["by_priority"]["medium"] == 1
 
 
-class TestSearchTasks:
-    """Test search_tasks MCP tool."""
-
-    def test_search_tasks_by_title(self, mcp_manager):
-        """Test searching tasks by title."""
-        create_task(title="Review DAT-12345", description="Data labeling")
-        create_task(title="Update model", description="Review architecture")
-        create_task(title="Meeting notes", description="Weekly sync")
-
-        result = search_tasks("review")
-
-        assert len(result) == 2
-        titles = [task["title"] for task in result]
-        assert "Review DAT-12345" in titles
-        assert "Update model" in titles  # "Review" in description
+# (tasks as (title, description), query, expected titles)
+SEARCH_CASES = {
+    "by_title": (
+        [("Review DAT-12345", "Data labeling"), ("Update model", "Review architecture"),
+         ("Meeting notes", "Weekly sync")],
+        "review",
+        {"Review DAT-12345", "Update model"},  # "Review" in description
+    ),
+    "by_description": (
+        [("Task A", "Implement new feature"), ("Task B", "Fix bug in payment"),
+         ("Task C", "Update docs")],
+        "feature",
+        {"Task A"},
+    ),
+    "case_insensitive": (
+        [("URGENT Task", "High priority"), ("Regular task", "Normal priority")],
+        "urgent",
+        {"URGENT Task"},
+    ),
+    "partial_match": (
+        [("WaitNet v3 training", "DNN model"), ("Perception update", "Sensor fusion")],
+        "wait",
+        {"WaitNet v3 training"},
+    ),
+    "no_results": (
+        [("Task 1", "Description 1"), ("Task 2", "Description 2")],
+        "nonexistent",
+        set(),
+    ),
+    "empty_query_returns_all": (
+        [("Task 1", ""), ("Task 2", ""), ("Task 3", "")],
+        "",
+        {"Task 1", "Task 2", "Task 3"},
+    ),
+    "special_characters": (
+        [("Fix bug #123", "Critical issue"), ("Regular task", "Normal work")],
+        "#123",
+        {"Fix bug #123"},
+    ),
+}
 
-    def test_search_tasks_by_description(self, mcp_manager):
-        """Test searching tasks by description."""
-        create_task(title="Task A", description="Implement new feature")
-        create_task(title="Task B", description="Fix bug in payment")
-        create_task(title="Task C", description="Update docs")
-
-        result = search_tasks("feature")
-
-        assert len(result) == 1
-        assert result[0]["title"] == "Task A"
-
-    def test_search_tasks_case_insensitive(self, mcp_manager):
-        """Test search is case insensitive."""
-        create_task(title="URGENT Task", description="High priority")
-        create_task(title="Regular task", description="Normal priority")
-
-        result = search_tasks("urgent")
-
-        assert len(result) == 1
-        assert result[0]["title"] == "URGENT Task"
 
-    def test_search_tasks_partial_match(self, mcp_manager):
-        """Test search with partial word match."""
-        create_task(title="WaitNet v3 training", description="DNN model")
-        create_task(title="Perception update", description="Sensor fusion")
-
-        result = search_tasks("wait")
-
-        assert len(result) == 1
-        assert "WaitNet" in result[0]["title"]
-
-    def test_search_tasks_no_results(self, mcp_manager):
-        """Test search with no matching tasks."""
-        create_task(title="Task 1", description="Description 1")
-        create_task(title="Task 2", description="Description 2")
-
-        result = search_tasks("nonexistent")
-
-        assert result == []
-
-    def test_search_tasks_empty_query(self, mcp_manager):
-        """Test search with empty query returns all tasks."""
-        create_task(title="Task 1")
-        create_task(title="Task 2")
-        create_task(title="Task 3")
-
-        result = search_tasks("")
-
-        assert len(result) == 3
+class TestSearchTasks:
+    """Test search_tasks MCP tool."""
 
-    def test_search_tasks_special_characters(self, mcp_manager):
-        """Test search with special characters."""
-        create_task(title="Fix bug #123", description="Critical issue")
-        create_task(title="Regular task", description="Normal work")
+    @pytest.mark.parametrize(
+        "tasks,query,expected", list(SEARCH_CASES.values()), ids=list(SEARCH_CASES)
+    )
+    def test_search_tasks(self, mcp_manager, tasks, query, expected):
+        """Test search matches title or description, ignoring case."""
+        create_tasks_bulk([{"title": title, "description": description} for title, description in tasks])
 
-        result = search_tasks("#123")
+        result = search_tasks(query)
 
-        assert len(result) == 1
-        assert result[0]["title"] == "Fix bug #123"
+        assert {task["title"] for task in result} == expected
+        assert len(result) == len(expected)
@@ -0,0 +1,97 @@
+"""Tests for the MCP read tool result cache."""
+
+import pytest
+
+from pm.mcp.tools import read_cache
+from pm.mcp.tools.read_cache import cached_read, invalidate_read_cache, invalidates_read_cache
+from pm.mcp.tools.task_tools import create_task
+from pm.mcp.tools.query_tools import get_task_summary
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start each test with an empty cache."""
+    invalidate_read_cache()
+    yield
+    invalidate_read_cache()
+
+
+class TestCachedRead:
+    """Test cached_read decorator."""
+
+    def test_repeated_read_hits_cache(self, mcp_manager):
+        """Test unchanged store returns the memoized result."""
+        calls = []
+
+        @cached_read()
+        def read(value=None):
+            calls.append(value)
+            return {"value": value}
+
+        first = read(value=1)
+        second = read(value=1)
+
+        assert first is second
+        assert calls == [1]
+
+    def test_arguments_are_part_of_key(self, mcp_manager):
+        """Test different arguments are cached separately."""
+        calls = []
+
+        @cached_read()
+        def read(value=None):
+            calls.append(value)
+            return value
+
+        assert read(value=1) == 1
+        assert read(value=2) == 2
+        assert calls == [1, 2]
+
+    def test_expired_entry_is_recomputed(self, mcp_manager, monkeypatch):
+        """Test entries older than ttl are not reused."""
+        clock = iter([0.0, 5.0])
+        monkeypatch.setattr(read_cache.time, "monotonic", lambda: next(clock))
+        calls = []
+
+        @cached_read(ttl=1.0)
+        def read():
+            calls.append(1)
+            return len(calls)
+
+        assert read() == 1
+        assert read() == 2
+
+    def test_writer_invalidates(self, mcp_manager):
+        """Test write tools drop cached results."""
+        calls = []
+
+        @cached_read()
+        def read():
+            calls.append(1)
+            return len(calls)
+
+        @invalidates_read_cache
+        def write():
+            return None
+
+        read()
+        write()
+        read()
+
+        assert len(calls) == 2
+
+    def test_summary_reflects_new_tasks(self, mcp_manager):
+        """Test a cached summary is refreshed after create_task."""
+        assert get_task_summary()["total"] == 0
+
+        create_task(title="New Task")
+
+        assert get_task_summary()["total"] == 1
+
+    def test_summary_reflects_external_changes(self, mcp_manager):
+        """Test task files written outside the tools invalidate the cache."""
+        assert get_task_summary()["total"] == 0
+
+        mcp_manager.create_task(title="Written Directly")
+
+        assert get_task_summary()["total"] == 1
@@ -1,9 +1,10 @@
 """Tests for MCP serializers."""
 
 import pytest
+from dataclasses import fields
 from datetime import datetime
 
-from pm.core.task import Task, TaskType, TaskStatus, TaskPriority, CheckFrequency, Note
+from pm.core.task import Task
 from pm.core.journal import DaySection, WeeklySummary
 from pm.mcp.serializers import (
     serialize_task,
@@ -80,6 +81,12 @@ class TestTaskSerialization:
         assert result["dependencies"] == []
         assert result["notes"] == []
 
+    def test_serialize_task_covers_all_fields(self, sample_mcp_task):
+        """Test every Task dataclass field is serialized."""
+        result = serialize_task(sample_mcp_task)
+
+        assert set(result) == {f.name for f in fields(Task)}
+
     def test_serialize_task_list(self):
         """Test serializing a list of tasks."""
         tasks = [
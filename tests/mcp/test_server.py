@@ -0,0 +1,69 @@
+"""Tests for MCP server dispatch."""
+
+import asyncio
+import json
+
+import pytest
+
+from pm.mcp import server
+
+
+class TestDumps:
+    """Test tool result encoding."""
+
+    def test_dumps_matches_json(self):
+        """Test encoded output parses back to the same value."""
+        result = {"total": 2, "by_status": {"todo": 1, "done": 1}, "ids": ["task-1"]}
+
+        assert json.loads(server._dumps(result)) == result
+
+    def test_dumps_is_indented(self):
+        """Test encoded output keeps two-space indentation."""
+        text = server._dumps({"a": 1})
+
+        assert text == '{\n  "a": 1\n}'
+
+    def test_dumps_without_orjson(self, monkeypatch):
+        """Test fallback to the standard json module."""
+        monkeypatch.setattr(server, "orjson", None)
+
+        assert server._dumps({"a": [1, 2]}) == json.dumps({"a": [1, 2]}, indent=2)
+
+
+class TestCallTool:
+    """Test call_tool dispatch."""
+
+    def test_call_tool_unknown_name(self):
+        """Test unknown tool names are rejected."""
+        with pytest.raises(ValueError, match="Unknown tool: no_such_tool"):
+            asyncio.run(server.call_tool("no_such_tool", {}))
+
+    def test_call_tool_returns_json_text(self, monkeypatch):
+        """Test handler results are returned as JSON text content."""
+        monkeypatch.setitem(server.TOOL_HANDLERS, "echo", lambda **kwargs: kwargs)
+
+        content = asyncio.run(server.call_tool("echo", {"value": 1}))
+
+        assert len(content) == 1
+        assert json.loads(content[0].text) == {"value": 1}
+
+    def test_call_tool_reports_handler_errors(self, monkeypatch):
+        """Test handler exceptions become error text content."""
+        def boom():
+            raise RuntimeError("kaboom")
+
+        monkeypatch.setitem(server.TOOL_HANDLERS, "boom", boom)
+
+        content = asyncio.run(server.call_tool("boom", {}))
+
+        assert content[0].text == "Error: kaboom"
+
+    def test_call_tool_rejects_invalid_arguments(self):
+        """Test arguments are checked against the tool input schema."""
+        content = asyncio.run(server.call_tool("get_quarterly_summary", {"quarter": 5}))
+
+        assert content[0].text.startswith("Error: Invalid arguments:")
+
+    def test_validators_cover_all_tools(self):
+        """Test every declared tool has a compiled validator."""
+        assert set(server._VALIDATORS) == {tool.name for tool in server.TOOLS}
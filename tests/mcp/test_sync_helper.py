@@ -1,13 +1,62 @@
 """Tests for MCP sync helper and auto-sync functionality."""
 
+import functools
+
 import pytest
 from pathlib import Path
 
-from pm.mcp.tools.sync_helper import sync_before_read, sync_before_write, get_synced_manager
-from pm.mcp.tools import list_tasks, create_task, get_task, sync_journal
+from pm.core.manager import TaskManager
+from pm.core.journal_manager import JournalManager
+from pm.mcp.tools import sync_helper
+from pm.mcp.tools.sync_helper import (
+    sync_before_read,
+    sync_before_write,
+    get_synced_manager,
+    invalidate_sync,
+    mcp_read_tool,
+    mcp_write_tool,
+)
+from pm.mcp.tools import list_tasks, create_task, get_task
 from pm.core.journal import get_current_week
 
 
+# Minimal current-week journal with a single planned section
+WEEKLY_SKELETON = """# Week {week} - {year}
+
+## Monday, Jan 06
+
+### 📋 Planned
+{tasks}
+
+---
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _render_journal(year: int, week: int, tasks: str) -> str:
+    """Render the journal skeleton for a week and planned task lines."""
+    return WEEKLY_SKELETON.format(year=year, week=week, tasks=tasks)
+
+
+def _write_journal(data_dir: Path, tasks: str) -> Path:
+    """Write this week's journal with the given planned task lines.
+
+    Args:
+        data_dir: Test data directory
+        tasks: Planned task lines
+
+    Returns:
+        Path to the journal file
+    """
+    journal_dir = data_dir / "journal"
+    journal_dir.mkdir(parents=True, exist_ok=True)
+
+    year, week = get_current_week()
+    journal_path = journal_dir / f"{year}-W{week:02d}.md"
+    journal_path.write_text(_render_journal(year, week, tasks))
+    return journal_path
+
+
 class TestSyncBeforeRead:
     """Test sync_before_read function."""
 
@@ -29,7 +78,6 @@ class TestSyncBeforeRead:
 
     def test_sync_before_read_returns_manager(self, journal_mode_manager):
         """Test that sync_before_read returns a TaskManager instance."""
-        from pm.core.manager import TaskManager
 
         manager = sync_before_read()
         assert isinstance(manager, TaskManager)
@@ -49,13 +97,17 @@ class TestSyncBeforeWrite:
 
     def test_sync_before_write_returns_both_managers(self, journal_mode_manager):
         """Test that sync_before_write returns TaskManager and JournalManager."""
-        from pm.core.manager import TaskManager
-        from pm.core.journal_manager import JournalManager
 
         manager, journal_manager = sync_before_write()
         assert isinstance(manager, TaskManager)
         assert isinstance(journal_manager, JournalManager)
 
+    def test_sync_before_write_reuses_syncing_journal_manager(self, journal_mode_manager):
+        """Test the returned JournalManager wraps the returned TaskManager."""
+        manager, journal_manager = sync_before_write()
+
+        assert journal_manager.task_manager is manager
+
 
 class TestGetSyncedManager:
     """Test get_synced_manager function."""
@@ -125,22 +177,7 @@ class TestAutoSyncInMCPTools:
     def test_auto_sync_processes_new_entries(self, journal_mode_manager, mcp_temp_dir):
         """Test that auto-sync processes NEW: entries in journal."""
         # Create a journal with NEW: entries
-        journal_dir = mcp_temp_dir / "journal"
-        journal_dir.mkdir(parents=True, exist_ok=True)
-
-        year, week = get_current_week()
-        journal_path = journal_dir / f"{year}-W{week:02d}.md"
-
-        content = f"""# Week {week} - {year}
-
-## Monday, Jan 06
-
-### 📋 Planned
-- [ ] NEW: Auto-sync test task (general, high)
-
----
-"""
-        journal_path.write_text(content)
+        journal_path = _write_journal(mcp_temp_dir, "- [ ] NEW: Auto-sync test task (general, high)")
 
         # list_tasks should trigger auto-sync
         tasks = list_tasks()
@@ -153,26 +190,28 @@ class TestAutoSyncInMCPTools:
         assert "NEW:" not in updated_content
         assert tasks[0]["id"] in updated_content
 
-    def test_auto_sync_handles_checkbox_changes(self, journal_mode_manager, mcp_temp_dir):
-        """Test that auto-sync handles checkbox status changes."""
-        # Create a journal and sync to create task
-        journal_dir = mcp_temp_dir / "journal"
-        journal_dir.mkdir(parents=True, exist_ok=True)
+    def test_auto_sync_reads_journal_once(self, journal_mode_manager, mcp_temp_dir, monkeypatch):
+        """Test one sync reads the journal file a single time."""
+        journal_path = _write_journal(mcp_temp_dir, "- [ ] NEW: Read once task (general, low)")
+        invalidate_sync()
+        reads = []
+        original = Path.read_text
 
-        year, week = get_current_week()
-        journal_path = journal_dir / f"{year}-W{week:02d}.md"
-
-        # First, create with unchecked box
-        content = f"""# Week {week} - {year}
+        def counting_read(self, *args, **kwargs):
+            if self == journal_path:
+                reads.append(1)
+            return original(self, *args, **kwargs)
 
-## Monday, Jan 06
+        monkeypatch.setattr(Path, "read_text", counting_read)
+        manager = sync_before_read()
 
-### 📋 Planned
-- [ ] NEW: Checkbox test task (general, medium)
+        assert len(reads) == 1
+        assert [t.title for t in manager.get_all_tasks()] == ["Read once task"]
 
----
-"""
-        journal_path.write_text(content)
+    def test_auto_sync_handles_checkbox_changes(self, journal_mode_manager, mcp_temp_dir):
+        """Test that auto-sync handles checkbox status changes."""
+        # Create a journal with an unchecked box and sync to create task
+        _write_journal(mcp_temp_dir, "- [ ] NEW: Checkbox test task (general, medium)")
 
         # Sync to create task
         tasks = list_tasks()
@@ -182,10 +221,8 @@ class TestAutoSyncInMCPTools:
         task = get_task(task_id)
         assert task["status"] == "todo"
 
-        # Now update journal to check the box
-        updated_content = journal_path.read_text()
-        checked_content = updated_content.replace("- [ ]", "- [x]")
-        journal_path.write_text(checked_content)
+        # Now rewrite the journal with the box checked
+        _write_journal(mcp_temp_dir, f"- [x] {task_id}: Checkbox test task (general, medium)")
 
         # list_tasks should trigger auto-sync and update status
         tasks = list_tasks()
@@ -194,24 +231,11 @@ class TestAutoSyncInMCPTools:
 
     def test_auto_sync_handles_deleted_tasks(self, journal_mode_manager, mcp_temp_dir):
         """Test that auto-sync deletes tasks removed from journal."""
-        journal_dir = mcp_temp_dir / "journal"
-        journal_dir.mkdir(parents=True, exist_ok=True)
-
-        year, week = get_current_week()
-        journal_path = journal_dir / f"{year}-W{week:02d}.md"
-
         # Create journal with two tasks
-        content = f"""# Week {week} - {year}
-
-## Monday, Jan 06
-
-### 📋 Planned
-- [ ] NEW: Task to keep (general, high)
-- [ ] NEW: Task to delete (general, low)
-
----
-"""
-        journal_path.write_text(content)
+        _write_journal(
+            mcp_temp_dir,
+            "- [ ] NEW: Task to keep (general, high)\n- [ ] NEW: Task to delete (general, low)",
+        )
 
         # Sync to create tasks
         tasks = list_tasks()
@@ -220,11 +244,8 @@ class TestAutoSyncInMCPTools:
         # Get task IDs
         task_ids = {t["title"]: t["id"] for t in tasks}
 
-        # Update journal to remove one task
-        updated_content = journal_path.read_text()
-        lines = updated_content.split("\n")
-        lines = [l for l in lines if "Task to delete" not in l]
-        journal_path.write_text("\n".join(lines))
+        # Rewrite the journal without the removed task
+        _write_journal(mcp_temp_dir, f"- [ ] {task_ids['Task to keep']}: Task to keep (general, high)")
 
         # list_tasks should trigger auto-sync and delete the removed task
         tasks = list_tasks()
@@ -234,3 +255,90 @@ class TestAutoSyncInMCPTools:
         # Deleted task should not be found
         deleted_task = get_task(task_ids["Task to delete"])
         assert deleted_task is None
+
+
+class TestSyncCoalescing:
+    """Test that back-to-back tool calls share one journal sync."""
+
+    @pytest.fixture
+    def sync_calls(self, journal_mode_manager, monkeypatch):
+        """Count JournalManager.sync_journal calls."""
+
+        invalidate_sync()
+        calls = []
+        original = JournalManager.sync_journal
+
+        def counting_sync(self, *args, **kwargs):
+            calls.append(1)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(JournalManager, "sync_journal", counting_sync)
+        yield calls
+        invalidate_sync()
+
+    def test_repeated_reads_share_sync(self, sync_calls):
+        """Test a second read inside the window skips the sync."""
+        sync_before_read()
+        sync_before_read()
+
+        assert len(sync_calls) == 1
+
+    def test_write_forces_next_sync(self, sync_calls):
+        """Test calls after sync_before_write sync again."""
+        sync_before_write()
+        sync_before_read()
+
+        assert len(sync_calls) == 2
+
+    def test_journal_change_forces_sync(self, sync_calls, mcp_temp_dir):
+        """Test a journal edit inside the window is still synced."""
+        sync_before_read()
+
+        year, week = get_current_week()
+        journal_path = mcp_temp_dir / "journal" / f"{year}-W{week:02d}.md"
+        journal_path.write_text("# Week\n\n- [ ] NEW: Late task (general, low)\n")
+        manager = sync_before_read()
+
+        assert len(sync_calls) == 2
+        assert [t.title for t in manager.get_all_tasks()] == ["Late task"]
+
+    def test_window_expiry_forces_sync(self, sync_calls, monkeypatch):
+        """Test calls after the window sync again."""
+
+        sync_before_read()
+        monkeypatch.setattr(sync_helper, "SYNC_COALESCE_WINDOW", 0)
+        sync_before_read()
+
+        assert len(sync_calls) == 2
+
+
+class TestToolDecorators:
+    """Test mcp_read_tool and mcp_write_tool decorators."""
+
+    def test_read_tool_receives_manager(self, journal_mode_manager):
+        """Test the synced manager is passed ahead of tool arguments."""
+
+        @mcp_read_tool
+        def tool(manager, value, flag=False):
+            return manager, value, flag
+
+        manager, value, flag = tool(1, flag=True)
+
+        assert isinstance(manager, TaskManager)
+        assert (value, flag) == (1, True)
+        assert tool.__name__ == "tool"
+
+    def test_write_tool_invalidates_read_cache(self, journal_mode_manager, monkeypatch):
+        """Test write tools drop cached read results even on error."""
+
+        invalidations = []
+        monkeypatch.setattr(sync_helper, "invalidate_read_cache", lambda: invalidations.append(1))
+
+        @mcp_write_tool
+        def tool(manager):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            tool()
+
+        assert invalidations == [1]
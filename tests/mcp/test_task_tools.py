@@ -1,10 +1,12 @@
 """Tests for MCP task tools."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 
 from pm.mcp.tools.task_tools import (
+    _parse_datetime,
     create_task,
+    create_tasks_bulk,
     list_tasks,
     get_task,
     update_task,
@@ -15,6 +17,16 @@ from pm.mcp.tools.task_tools import (
 )
 
 
+@pytest.fixture
+def make_task(mcp_manager):
+    """Factory creating a task through the MCP tool and returning its ID."""
+    def _make(**kwargs):
+        kwargs.setdefault("title", "Task")
+        return create_task(**kwargs)["id"]
+
+    return _make
+
+
 class TestCreateTask:
     """Test create_task MCP tool."""
 
@@ -22,15 +34,18 @@ class TestCreateTask:
         """Test creating a basic task."""
         result = create_task(title="Test Task")
 
-        assert result["title"] == "Test Task"
-        assert result["description"] == ""
-        assert result["type"] == "general"
-        assert result["status"] == "todo"
-        assert result["priority"] == "medium"
-        assert result["check_frequency"] == "weekly"
+        expected = {
+            "title": "Test Task",
+            "description": "",
+            "type": "general",
+            "status": "todo",
+            "priority": "medium",
+            "check_frequency": "weekly",
+            "tags": [],
+            "dependencies": [],
+        }
         assert "id" in result
-        assert result["tags"] == []
-        assert result["dependencies"] == []
+        assert {k: result[k] for k in expected} == expected
 
     def test_create_task_with_all_fields(self, mcp_manager):
         """Test creating a task with all fields."""
@@ -47,36 +62,35 @@ class TestCreateTask:
             dependencies=["task-abc123"],
         )
 
-        assert result["title"] == "DAT Ticket Task"
-        assert result["description"] == "Review labeling quality"
-        assert result["type"] == "dat_ticket"
-        assert result["status"] == "in_progress"
-        assert result["priority"] == "high"
-        assert result["check_frequency"] == "daily"
-        assert result["eta"] == "2026-01-15T17:00:00"
-        assert result["notify_at"] == "2026-01-15T16:00:00"
-        assert result["tags"] == ["urgent", "labeling"]
-        assert result["dependencies"] == ["task-abc123"]
-
-    def test_create_task_with_invalid_type(self, mcp_manager):
-        """Test creating task with invalid type raises error."""
-        with pytest.raises(ValueError):
-            create_task(title="Bad Task", task_type="invalid_type")
-
-    def test_create_task_with_invalid_priority(self, mcp_manager):
-        """Test creating task with invalid priority raises error."""
-        with pytest.raises(ValueError):
-            create_task(title="Bad Task", priority="super_high")
-
-    def test_create_task_with_invalid_status(self, mcp_manager):
-        """Test creating task with invalid status raises error."""
+        expected = {
+            "title": "DAT Ticket Task",
+            "description": "Review labeling quality",
+            "type": "dat_ticket",
+            "status": "in_progress",
+            "priority": "high",
+            "check_frequency": "daily",
+            "eta": "2026-01-15T17:00:00",
+            "notify_at": "2026-01-15T16:00:00",
+            "tags": ["urgent", "labeling"],
+            "dependencies": ["task-abc123"],
+        }
+        assert {k: result[k] for k in expected} == expected
+
+    @pytest.mark.parametrize("field,value", [
+        ("task_type", "invalid_type"),
+        ("priority", "super_high"),
+        ("status", "completed"),
+        ("check_frequency", "hourly"),
+    ])
+    def test_create_task_with_invalid_field(self, mcp_manager, field, value):
+        """Test creating task with an invalid enum value raises error."""
         with pytest.raises(ValueError):
-            create_task(title="Bad Task", status="completed")
+            create_task(title="Bad Task", **{field: value})
 
-    def test_create_task_with_invalid_check_frequency(self, mcp_manager):
-        """Test creating task with invalid check frequency raises error."""
-        with pytest.raises(ValueError):
-            create_task(title="Bad Task", check_frequency="hourly")
+    def test_create_task_invalid_value_message(self, mcp_manager):
+        """Test invalid enum values keep the Enum error message."""
+        with pytest.raises(ValueError, match="'invalid_type' is not a valid TaskType"):
+            create_task(title="Bad Task", task_type="invalid_type")
 
     def test_create_task_with_invalid_eta(self, mcp_manager):
         """Test creating task with invalid ETA format."""
@@ -85,15 +99,40 @@ class TestCreateTask:
         assert result["eta"] is None
 
 
+class TestCreateTasksBulk:
+    """Test create_tasks_bulk MCP tool."""
+
+    def test_create_tasks_bulk(self, mcp_manager):
+        """Test creating several tasks in one call."""
+        result = create_tasks_bulk([
+            {"title": "First", "priority": "high"},
+            {"title": "Second", "task_type": "project", "eta": "2026-01-15T17:00:00"},
+        ])
+
+        assert [t["title"] for t in result] == ["First", "Second"]
+        assert result[0]["priority"] == "high"
+        assert result[1]["type"] == "project"
+        assert result[1]["eta"] == "2026-01-15T17:00:00"
+        assert {t["id"] for t in list_tasks()} == {t["id"] for t in result}
+
+    def test_create_tasks_bulk_invalid_entry_creates_nothing(self, mcp_manager):
+        """Test one invalid entry rejects the whole batch."""
+        with pytest.raises(ValueError):
+            create_tasks_bulk([{"title": "Good"}, {"title": "Bad", "status": "completed"}])
+
+        assert list_tasks() == []
+
+
 class TestListTasks:
     """Test list_tasks MCP tool."""
 
     def test_list_tasks_no_filter(self, mcp_manager):
         """Test listing all tasks without filters."""
-        # Create some tasks
-        create_task(title="Task 1", status="todo")
-        create_task(title="Task 2", status="in_progress")
-        create_task(title="Task 3", status="done")
+        create_tasks_bulk([
+            {"title": "Task 1", "status": "todo"},
+            {"title": "Task 2", "status": "in_progress"},
+            {"title": "Task 3", "status": "done"},
+        ])
 
         result = list_tasks()
 
@@ -104,47 +143,35 @@ class TestListTasks:
         assert "Task 2" in titles
         assert "Task 3" in titles
 
-    def test_list_tasks_with_status_filter(self, mcp_manager):
-        """Test listing tasks filtered by status."""
-        create_task(title="Todo Task", status="todo")
-        create_task(title="In Progress Task", status="in_progress")
-        create_task(title="Done Task", status="done")
-
-        result = list_tasks(status="in_progress")
-
-        assert len(result) == 1
-        assert result[0]["title"] == "In Progress Task"
-        assert result[0]["status"] == "in_progress"
-
-    def test_list_tasks_with_type_filter(self, mcp_manager):
-        """Test listing tasks filtered by type."""
-        create_task(title="DAT Task", task_type="dat_ticket")
-        create_task(title="Project Task", task_type="project")
-        create_task(title="General Task", task_type="general")
-
-        result = list_tasks(task_type="dat_ticket")
-
-        assert len(result) == 1
-        assert result[0]["title"] == "DAT Task"
-        assert result[0]["type"] == "dat_ticket"
-
-    def test_list_tasks_with_priority_filter(self, mcp_manager):
-        """Test listing tasks filtered by priority."""
-        create_task(title="High Priority", priority="high")
-        create_task(title="Medium Priority", priority="medium")
-        create_task(title="Low Priority", priority="low")
-
-        result = list_tasks(priority="high")
+    @pytest.fixture
+    def filter_corpus(self, mcp_manager):
+        """Three tasks that differ in status, type and priority."""
+        return create_tasks_bulk([
+            {"title": "In Progress Task", "status": "in_progress", "task_type": "general", "priority": "medium"},
+            {"title": "DAT Task", "status": "todo", "task_type": "dat_ticket", "priority": "low"},
+            {"title": "High Priority", "status": "done", "task_type": "project", "priority": "high"},
+        ])
+
+    @pytest.mark.parametrize("kwarg,value,field,expected_title", [
+        ("status", "in_progress", "status", "In Progress Task"),
+        ("task_type", "dat_ticket", "type", "DAT Task"),
+        ("priority", "high", "priority", "High Priority"),
+    ])
+    def test_list_tasks_single_filter(self, filter_corpus, kwarg, value, field, expected_title):
+        """Test listing tasks filtered by one attribute."""
+        result = list_tasks(**{kwarg: value})
 
         assert len(result) == 1
-        assert result[0]["title"] == "High Priority"
-        assert result[0]["priority"] == "high"
+        assert result[0]["title"] == expected_title
+        assert result[0][field] == value
 
     def test_list_tasks_with_tags_filter(self, mcp_manager):
         """Test listing tasks filtered by tags."""
-        create_task(title="Tagged Task 1", tags=["urgent", "review"])
-        create_task(title="Tagged Task 2", tags=["review"])
-        create_task(title="Untagged Task", tags=[])
+        create_tasks_bulk([
+            {"title": "Tagged Task 1", "tags": ["urgent", "review"]},
+            {"title": "Tagged Task 2", "tags": ["review"]},
+            {"title": "Untagged Task", "tags": []},
+        ])
 
         result = list_tasks(tags=["urgent"])
 
@@ -153,9 +180,11 @@ class TestListTasks:
 
     def test_list_tasks_with_search(self, mcp_manager):
         """Test listing tasks with search term."""
-        create_task(title="Review DAT-12345", description="Data labeling review")
-        create_task(title="Update model", description="Train new model")
-        create_task(title="Meeting notes", description="Weekly sync")
+        create_tasks_bulk([
+            {"title": "Review DAT-12345", "description": "Data labeling review"},
+            {"title": "Update model", "description": "Train new model"},
+            {"title": "Meeting notes", "description": "Weekly sync"},
+        ])
 
         result = list_tasks(search="review")
 
@@ -170,9 +199,11 @@ class TestListTasks:
 
     def test_list_tasks_with_multiple_filters(self, mcp_manager):
         """Test listing tasks with multiple filters combined."""
-        create_task(title="High Priority DAT", task_type="dat_ticket", priority="high", status="todo")
-        create_task(title="High Priority Project", task_type="project", priority="high", status="todo")
-        create_task(title="Low Priority DAT", task_type="dat_ticket", priority="low", status="todo")
+        create_tasks_bulk([
+            {"title": "High Priority DAT", "task_type": "dat_ticket", "priority": "high", "status": "todo"},
+            {"title": "High Priority Project", "task_type": "project", "priority": "high", "status": "todo"},
+            {"title": "Low Priority DAT", "task_type": "dat_ticket", "priority": "low", "status": "todo"},
+        ])
 
         result = list_tasks(task_type="dat_ticket", priority="high")
 
@@ -183,10 +214,9 @@ class TestListTasks:
 class TestGetTask:
     """Test get_task MCP tool."""
 
-    def test_get_task_exists(self, mcp_manager):
+    def test_get_task_exists(self, make_task):
         """Test getting an existing task."""
-        created = create_task(title="Test Task", description="Test description")
-        task_id = created["id"]
+        task_id = make_task(title="Test Task", description="Test description")
 
         result = get_task(task_id)
 
@@ -195,16 +225,9 @@ class TestGetTask:
         assert result["title"] == "Test Task"
         assert result["description"] == "Test description"
 
-    def test_get_task_not_found(self, mcp_manager):
-        """Test getting a non-existent task."""
-        result = get_task("nonexistent-id")
-
-        assert result is None
-
-    def test_get_task_with_notes(self, mcp_manager):
+    def test_get_task_with_notes(self, make_task):
         """Test getting task with notes."""
-        created = create_task(title="Task with notes")
-        task_id = created["id"]
+        task_id = make_task(title="Task with notes")
 
         # Add notes
         add_task_note(task_id, "First note")
@@ -220,29 +243,26 @@ class TestGetTask:
 class TestUpdateTask:
     """Test update_task MCP tool."""
 
-    def test_update_task_title(self, mcp_manager):
+    def test_update_task_title(self, make_task):
         """Test updating task title."""
-        created = create_task(title="Original Title")
-        task_id = created["id"]
+        task_id = make_task(title="Original Title")
 
         result = update_task(task_id, title="Updated Title")
 
         assert result is not None
         assert result["title"] == "Updated Title"
 
-    def test_update_task_status(self, mcp_manager):
+    def test_update_task_status(self, make_task):
         """Test updating task status."""
-        created = create_task(title="Task", status="todo")
-        task_id = created["id"]
+        task_id = make_task(status="todo")
 
         result = update_task(task_id, status="in_progress")
 
         assert result["status"] == "in_progress"
 
-    def test_update_task_multiple_fields(self, mcp_manager):
+    def test_update_task_multiple_fields(self, make_task):
         """Test updating multiple task fields."""
-        created = create_task(title="Task", priority="low", status="todo")
-        task_id = created["id"]
+        task_id = make_task(priority="low", status="todo")
 
         result = update_task(
             task_id,
@@ -257,25 +277,17 @@ class TestUpdateTask:
         assert result["status"] == "in_progress"
         assert result["tags"] == ["updated"]
 
-    def test_update_task_not_found(self, mcp_manager):
-        """Test updating non-existent task."""
-        result = update_task("nonexistent-id", title="New Title")
-
-        assert result is None
-
-    def test_update_task_with_eta(self, mcp_manager):
+    def test_update_task_with_eta(self, make_task):
         """Test updating task ETA."""
-        created = create_task(title="Task")
-        task_id = created["id"]
+        task_id = make_task()
 
         result = update_task(task_id, eta="2026-01-20T12:00:00")
 
         assert result["eta"] == "2026-01-20T12:00:00"
 
-    def test_update_task_clear_dependencies(self, mcp_manager):
+    def test_update_task_clear_dependencies(self, make_task):
         """Test clearing task dependencies."""
-        created = create_task(title="Task", dependencies=["task-1", "task-2"])
-        task_id = created["id"]
+        task_id = make_task(dependencies=["task-1", "task-2"])
 
         result = update_task(task_id, dependencies=[])
 
@@ -285,10 +297,9 @@ class TestUpdateTask:
 class TestDeleteTask:
     """Test delete_task MCP tool."""
 
-    def test_delete_task_exists(self, mcp_manager):
+    def test_delete_task_exists(self, make_task):
         """Test deleting an existing task."""
-        created = create_task(title="Task to delete")
-        task_id = created["id"]
+        task_id = make_task(title="Task to delete")
 
         result = delete_task(task_id)
 
@@ -297,20 +308,13 @@ class TestDeleteTask:
         # Verify task is gone
         assert get_task(task_id) is None
 
-    def test_delete_task_not_found(self, mcp_manager):
-        """Test deleting non-existent task."""
-        result = delete_task("nonexistent-id")
-
-        assert result is False
-
 
 class TestAddTaskNote:
     """Test add_task_note MCP tool."""
 
-    def test_add_task_note(self, mcp_manager):
+    def test_add_task_note(self, make_task):
         """Test adding a note to a task."""
-        created = create_task(title="Task")
-        task_id = created["id"]
+        task_id = make_task()
 
         result = add_task_note(task_id, "This is a test note")
 
@@ -318,10 +322,9 @@ class TestAddTaskNote:
         assert len(result["notes"]) == 1
         assert "This is a test note" in result["notes"][0]
 
-    def test_add_multiple_notes(self, mcp_manager):
+    def test_add_multiple_notes(self, make_task):
         """Test adding multiple notes to a task."""
-        created = create_task(title="Task")
-        task_id = created["id"]
+        task_id = make_task()
 
         add_task_note(task_id, "First note")
         add_task_note(task_id, "Second note")
@@ -329,66 +332,61 @@ class TestAddTaskNote:
 
         assert len(result["notes"]) == 3
 
-    def test_add_note_to_nonexistent_task(self, mcp_manager):
-        """Test adding note to non-existent task."""
-        result = add_task_note("nonexistent-id", "Note")
-
-        assert result is None
 
+class TestMarkTaskStatus:
+    """Test mark_task_done and mark_task_in_progress MCP tools."""
 
-class TestMarkTaskDone:
-    """Test mark_task_done MCP tool."""
+    @pytest.mark.parametrize("tool,target,start", [
+        (mark_task_done, "done", "in_progress"),
+        (mark_task_done, "done", "done"),
+        (mark_task_in_progress, "in_progress", "todo"),
+        (mark_task_in_progress, "in_progress", "in_progress"),
+    ], ids=["done", "done_already_done", "in_progress", "in_progress_already_in_progress"])
+    def test_mark_task_status(self, make_task, tool, target, start):
+        """Test marking a task moves it to the target status."""
+        task_id = make_task(status=start)
 
-    def test_mark_task_done(self, mcp_manager):
-        """Test marking a task as done."""
-        created = create_task(title="Task", status="in_progress")
-        task_id = created["id"]
-
-        result = mark_task_done(task_id)
+        result = tool(task_id)
 
         assert result is not None
-        assert result["status"] == "done"
-
-    def test_mark_task_done_already_done(self, mcp_manager):
-        """Test marking an already done task."""
-        created = create_task(title="Task", status="done")
-        task_id = created["id"]
-
-        result = mark_task_done(task_id)
+        assert result["status"] == target
 
-        assert result["status"] == "done"
 
-    def test_mark_task_done_not_found(self, mcp_manager):
-        """Test marking non-existent task as done."""
-        result = mark_task_done("nonexistent-id")
+class TestTaskNotFound:
+    """Test task tools given an unknown task ID."""
 
-        assert result is None
+    @pytest.mark.parametrize("tool,kwargs,expected", [
+        (get_task, {}, None),
+        (update_task, {"title": "New Title"}, None),
+        (delete_task, {}, False),
+        (add_task_note, {"note": "Note"}, None),
+        (mark_task_done, {}, None),
+        (mark_task_in_progress, {}, None),
+    ], ids=["get", "update", "delete", "add_note", "mark_done", "mark_in_progress"])
+    def test_task_not_found(self, mcp_manager, tool, kwargs, expected):
+        """Test a non-existent task ID returns None (False for delete)."""
+        assert tool("nonexistent-id", **kwargs) is expected
 
 
-class TestMarkTaskInProgress:
-    """Test mark_task_in_progress MCP tool."""
+class TestParseDatetime:
+    """Test _parse_datetime helper."""
 
-    def test_mark_task_in_progress(self, mcp_manager):
-        """Test marking a task as in progress."""
-        created = create_task(title="Task", status="todo")
-        task_id = created["id"]
+    def test_parse_iso_format(self):
+        """Test ISO-8601 strings parse exactly."""
+        assert _parse_datetime("2026-01-15T10:30:00") == datetime(2026, 1, 15, 10, 30)
 
-        result = mark_task_in_progress(task_id)
+    def test_parse_utc_suffix(self):
+        """Test a trailing Z is read as UTC."""
+        result = _parse_datetime("2026-01-15T10:30:00Z")
 
-        assert result is not None
-        assert result["status"] == "in_progress"
-
-    def test_mark_task_in_progress_already_in_progress(self, mcp_manager):
-        """Test marking an already in-progress task."""
-        created = create_task(title="Task", status="in_progress")
-        task_id = created["id"]
-
-        result = mark_task_in_progress(task_id)
-
-        assert result["status"] == "in_progress"
+        assert result == datetime(2026, 1, 15, 10, 30, tzinfo=timezone.utc)
 
-    def test_mark_task_in_progress_not_found(self, mcp_manager):
-        """Test marking non-existent task as in progress."""
-        result = mark_task_in_progress("nonexistent-id")
+    def test_parse_falls_back_to_dateutil(self):
+        """Test non-ISO strings are still accepted."""
+        assert _parse_datetime("Jan 15 2026 10:30") == datetime(2026, 1, 15, 10, 30)
 
-        assert result is None
+    def test_parse_invalid_and_empty(self):
+        """Test unparseable and empty input returns None."""
+        assert _parse_datetime("not a date") is None
+        assert _parse_datetime("") is None
+        assert _parse_datetime(None) is None
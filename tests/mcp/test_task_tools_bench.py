@@ -0,0 +1,41 @@
+"""Micro-benchmarks for task MCP tools.
+
+Skipped unless pytest-benchmark is installed. Run with:
+
+    pytest tests/mcp/test_task_tools_bench.py --benchmark-only
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pm.mcp.tools.task_tools import create_tasks_bulk, list_tasks
+
+TASK_COUNT = 1000
+
+
+@pytest.fixture
+def bench_corpus(mcp_manager):
+    """TASK_COUNT tasks with mixed status, priority and tags."""
+    create_tasks_bulk([
+        {
+            "title": f"T{i}",
+            "description": "review" if i % 7 == 0 else "",
+            "status": "todo" if i % 2 else "done",
+            "priority": "high" if i % 3 == 0 else "low",
+            "tags": ["a"] if i % 5 == 0 else [],
+        }
+        for i in range(TASK_COUNT)
+    ])
+    return mcp_manager
+
+
+@pytest.mark.benchmark(group="list_tasks")
+def test_bench_list_tasks_filtered(benchmark, bench_corpus):
+    """Benchmark list_tasks with every filter applied."""
+    filters = {"status": "todo", "priority": "high", "tags": ["a"], "search": "review"}
+
+    result = benchmark.pedantic(list_tasks, kwargs=filters, rounds=20)
+
+    # i odd, divisible by 3, 5 and 7
+    assert len(result) == len([i for i in range(TASK_COUNT) if i % 210 == 105])
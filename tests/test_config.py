@@ -2,6 +2,7 @@
 
 import pytest
 import yaml
+from operator import attrgetter
 from pathlib import Path
 
 from pm.utils.config import (
@@ -12,9 +13,48 @@ from pm.utils.config import (
     NotificationConfig,
     SchedulerConfig,
     DefaultsConfig,
+    SafeDumper,
+    SafeLoader,
+    get_config,
+    get_config_manager,
+    override_config,
 )
 
 
+CANONICAL_CONFIG = {
+    "data_dir": "/srv/pm-data",
+    "storage_mode": "single_file",
+    "notifications": {
+        "email": {
+            "enabled": True,
+            "smtp_server": "smtp.gmail.com",
+            "smtp_port": 587,
+            "sender": "user@example.com",
+            "password": "secret",
+            "recipient": "user@example.com",
+        },
+        "terminal": {
+            "enabled": False,
+            "show_on_login": False,
+        },
+    },
+    "scheduler": {
+        "check_interval": 7200,
+        "daily_summary_time": "08:30",
+        "weekly_summary_day": "Friday",
+    },
+    "defaults": {"priority": "low"},
+}
+
+
+@pytest.fixture(scope="class")
+def loaded_manager(tmp_path_factory):
+    """ConfigManager loaded once from a file holding CANONICAL_CONFIG."""
+    config_file = tmp_path_factory.mktemp("cfg") / "config.yaml"
+    config_file.write_text(yaml.dump(CANONICAL_CONFIG, Dumper=SafeDumper))
+    return ConfigManager(config_file=str(config_file))
+
+
 class TestConfigDataClasses:
     """Test configuration dataclasses."""
 
@@ -66,6 +106,18 @@ class TestConfigDataClasses:
         config = Config(data_dir=str(temp_dir))
         assert config.data_path == temp_dir
 
+    def test_config_uses_slots(self):
+        """Test config instances are slotted but still mutable."""
+        config = Config()
+
+        assert not hasattr(config, "__dict__")
+        assert not hasattr(config.notifications.email, "__dict__")
+
+        config.defaults.priority = "low"
+        assert config.defaults.priority == "low"
+        with pytest.raises(AttributeError):
+            config.unknown_setting = True
+
 
 class TestConfigManager:
     """Test ConfigManager class."""
@@ -81,9 +133,7 @@ class TestConfigManager:
         assert manager.config.data_dir == "~/pm-data"
 
     def test_config_manager_load_file(self, temp_dir):
-        """Test ConfigManager loading from file."""
-        # Create config file
-        config_file = temp_dir / "config.yaml"
+        """Test ConfigManager parsing loaded config data."""
         config_data = {
             "data_dir": str(temp_dir / "tasks"),
             "storage_mode": "single_file",
@@ -98,10 +148,7 @@ class TestConfigManager:
             },
         }
 
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
-
-        manager = ConfigManager(config_file=str(config_file))
+        manager = ConfigManager.from_mapping(config_data)
 
         assert manager.config.data_dir == str(temp_dir / "tasks")
         assert manager.config.storage_mode == "single_file"
@@ -130,19 +177,27 @@ class TestConfigManager:
         assert new_manager.config.data_dir == str(temp_dir / "my-tasks")
         assert new_manager.config.notifications.email.sender == "test@example.com"
 
-    def test_config_manager_partial_config(self, temp_dir):
-        """Test loading partial config (missing fields use defaults)."""
+    def test_config_manager_save_layout(self, temp_dir):
+        """Test saved file keeps sections in dataclass field order."""
         config_file = temp_dir / "config.yaml"
 
+        ConfigManager(config_file=str(config_file)).save_config()
+
+        data = yaml.load(config_file.read_text(), Loader=SafeLoader)
+        assert list(data) == [
+            "data_dir", "storage_mode", "notifications", "scheduler", "defaults", "backup",
+        ]
+        assert list(data["notifications"]) == ["email", "terminal"]
+        assert data["backup"]["backup_on_sync"] is True
+
+    def test_config_manager_partial_config(self, temp_dir):
+        """Test loading partial config (missing fields use defaults)."""
         # Minimal config
         config_data = {
             "data_dir": str(temp_dir),
         }
 
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
-
-        manager = ConfigManager(config_file=str(config_file))
+        manager = ConfigManager.from_mapping(config_data)
 
         # Specified field
         assert manager.config.data_dir == str(temp_dir)
@@ -163,97 +218,107 @@ class TestConfigManager:
 
         assert manager.config.data_dir == "~/pm-data"
 
-    def test_config_manager_nested_notifications(self, temp_dir):
-        """Test loading nested notification config."""
-        config_file = temp_dir / "config.yaml"
+    def test_config_manager_reuses_parsed_file(self, temp_dir, monkeypatch):
+        """Test an unchanged config file is not parsed again."""
+        import pm.utils.config as config_module
 
-        config_data = {
-            "notifications": {
-                "email": {
-                    "enabled": True,
-                    "smtp_server": "smtp.gmail.com",
-                    "smtp_port": 587,
-                    "sender": "user@example.com",
-                    "password": "secret",
-                    "recipient": "user@example.com",
-                },
-                "terminal": {
-                    "enabled": False,
-                    "show_on_login": False,
-                },
-            },
-        }
+        config_file = temp_dir / "config.yaml"
+        config_file.write_text("data_dir: /tmp/first\n")
+        first = ConfigManager(config_file=str(config_file))
 
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+        def fail_load(*args, **kwargs):
+            raise AssertionError("config file parsed twice")
 
-        manager = ConfigManager(config_file=str(config_file))
+        monkeypatch.setattr(config_module.yaml, "load", fail_load)
+        second = ConfigManager(config_file=str(config_file))
 
-        assert manager.config.notifications.email.enabled is True
-        assert manager.config.notifications.email.smtp_server == "smtp.gmail.com"
-        assert manager.config.notifications.email.sender == "user@example.com"
-        assert manager.config.notifications.terminal.enabled is False
-        assert manager.config.notifications.terminal.show_on_login is False
+        assert second.config.data_dir == "/tmp/first"
+        assert second.config is not first.config
 
-    def test_config_manager_scheduler_settings(self, temp_dir):
-        """Test loading scheduler settings."""
+    def test_config_manager_reparses_changed_file(self, temp_dir):
+        """Test edits to the config file are picked up."""
         config_file = temp_dir / "config.yaml"
+        config_file.write_text("data_dir: /tmp/first\n")
+        ConfigManager(config_file=str(config_file))
 
-        config_data = {
-            "scheduler": {
-                "check_interval": 7200,
-                "daily_summary_time": "08:30",
-                "weekly_summary_day": "Friday",
-            },
-        }
-
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
-
+        config_file.write_text("data_dir: /tmp/second-dir\n")
         manager = ConfigManager(config_file=str(config_file))
 
-        assert manager.config.scheduler.check_interval == 7200
-        assert manager.config.scheduler.daily_summary_time == "08:30"
-        assert manager.config.scheduler.weekly_summary_day == "Friday"
+        assert manager.config.data_dir == "/tmp/second-dir"
 
-    def test_config_roundtrip(self, temp_dir):
-        """Test saving and loading config preserves all data."""
+    def test_config_manager_null_and_unknown_keys(self, temp_dir):
+        """Test null sections keep defaults and unknown keys are ignored."""
         config_file = temp_dir / "config.yaml"
+        config_file.write_text(
+            "notifications:\n"
+            "scheduler:\n"
+            "  check_interval: 600\n"
+            "  unknown_option: 1\n"
+            "backup:\n"
+            "  retention_days: 30\n"
+            "extra_section: true\n"
+        )
 
-        # Create manager with custom config
         manager = ConfigManager(config_file=str(config_file))
-        manager.config.data_dir = str(temp_dir / "data")
-        manager.config.storage_mode = "single_file"
-        manager.config.notifications.email.enabled = True
-        manager.config.notifications.email.sender = "test@example.com"
-        manager.config.scheduler.check_interval = 1800
-        manager.config.defaults.priority = "low"
 
-        # Save
+        assert manager.config.notifications.email.smtp_port == 587
+        assert manager.config.scheduler.check_interval == 600
+        assert manager.config.scheduler.daily_summary_time == "09:00"
+        assert manager.config.backup.retention_days == 30
+        assert manager.config.backup.enabled is True
+
+    @pytest.mark.parametrize("path,expected", [
+        ("notifications.email.enabled", True),
+        ("notifications.email.smtp_server", "smtp.gmail.com"),
+        ("notifications.email.sender", "user@example.com"),
+        ("notifications.terminal.enabled", False),
+        ("notifications.terminal.show_on_login", False),
+        ("scheduler.check_interval", 7200),
+        ("scheduler.daily_summary_time", "08:30"),
+        ("scheduler.weekly_summary_day", "Friday"),
+    ])
+    def test_config_manager_nested_settings(self, loaded_manager, path, expected):
+        """Test nested notification and scheduler settings are loaded."""
+        assert attrgetter(path)(loaded_manager.config) == expected
+
+    def test_config_manager_from_mapping_save(self, temp_dir):
+        """Test a manager built from data saves to the given file."""
+        config_file = temp_dir / "config.yaml"
+
+        manager = ConfigManager.from_mapping({"defaults": {"priority": "low"}}, str(config_file))
         manager.save_config()
 
-        # Load fresh
-        new_manager = ConfigManager(config_file=str(config_file))
+        assert ConfigManager(config_file=str(config_file)).config.defaults.priority == "low"
 
-        # Verify all fields
-        assert new_manager.config.data_dir == str(temp_dir / "data")
-        assert new_manager.config.storage_mode == "single_file"
-        assert new_manager.config.notifications.email.enabled is True
-        assert new_manager.config.notifications.email.sender == "test@example.com"
-        assert new_manager.config.scheduler.check_interval == 1800
-        assert new_manager.config.defaults.priority == "low"
+    def test_config_roundtrip(self, loaded_manager, temp_dir):
+        """Test saving and loading config preserves all data."""
+        config_file = temp_dir / "config.yaml"
+
+        ConfigManager.from_mapping(CANONICAL_CONFIG, str(config_file)).save_config()
+
+        assert ConfigManager(config_file=str(config_file)).config == loaded_manager.config
+        assert loaded_manager.config.storage_mode == "single_file"
+        assert loaded_manager.config.defaults.priority == "low"
 
     def test_get_config(self, temp_dir):
         """Test get_config convenience function."""
-        from pm.utils.config import get_config
-
         config_file = temp_dir / "config.yaml"
         config_data = {"data_dir": str(temp_dir)}
 
         with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+            yaml.dump(config_data, f, Dumper=SafeDumper)
 
         config = get_config(config_file=str(config_file))
 
         assert isinstance(config, Config)
         assert config.data_dir == str(temp_dir)
+
+    def test_override_config(self, temp_dir):
+        """Test override_config swaps the global config for the block only."""
+        test_cfg = Config(data_dir=str(temp_dir))
+
+        with override_config(test_cfg):
+            assert get_config() is test_cfg
+            assert get_config_manager().config_file == temp_dir / "config.yaml"
+
+        assert get_config() is not test_cfg
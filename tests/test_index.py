@@ -0,0 +1,165 @@
+"""Tests for TaskIndex."""
+
+from datetime import datetime, timedelta, timezone
+
+from pm.core.index import TaskIndex
+from pm.core.task import Task, TaskType, TaskStatus, CheckFrequency
+
+
+class TestTaskIndex:
+    """Test TaskIndex class."""
+
+    def test_index_initialization(self, multiple_tasks):
+        """Test index built from an initial mapping."""
+        index = TaskIndex({t.id: t for t in multiple_tasks})
+
+        assert len(index) == len(multiple_tasks)
+        assert len(index.by_status["todo"]) == 2
+        assert len(index.by_priority["high"]) == 2
+
+    def test_lookup_intersects_postings(self, multiple_tasks):
+        """Test lookup with several attributes."""
+        index = TaskIndex({t.id: t for t in multiple_tasks})
+
+        results = index.lookup(status="todo", priority="high")
+
+        assert len(results) == 1
+        assert results[0].title == "DAT Ticket Task"
+
+    def test_lookup_tags_any_match(self):
+        """Test tag lookup matches any of the given tags."""
+        index = TaskIndex()
+        task1 = Task(title="One", tags=["a"])
+        task2 = Task(title="Two", tags=["b"])
+        task3 = Task(title="Three", tags=["c"])
+        for task in (task1, task2, task3):
+            index[task.id] = task
+
+        results = index.lookup(tags=["a", "b"])
+
+        assert {t.id for t in results} == {task1.id, task2.id}
+
+    def test_lookup_no_filters_returns_all(self, multiple_tasks):
+        """Test lookup without filters returns every task."""
+        index = TaskIndex({t.id: t for t in multiple_tasks})
+
+        assert len(index.lookup()) == len(multiple_tasks)
+
+    def test_delete_removes_postings(self, sample_task):
+        """Test deleting a task drops it from postings."""
+        index = TaskIndex({sample_task.id: sample_task})
+
+        del index[sample_task.id]
+
+        assert index.lookup(status="todo") == []
+        assert index.by_status == {}
+        assert index.by_tag == {}
+
+    def test_reindex_after_mutation(self, sample_task):
+        """Test reindex picks up in-place attribute changes."""
+        index = TaskIndex({sample_task.id: sample_task})
+
+        sample_task.status = TaskStatus.DONE
+        index.reindex(sample_task.id)
+
+        assert index.lookup(status="todo") == []
+        assert index.lookup(status="done") == [sample_task]
+
+    def test_replace_task(self, sample_task):
+        """Test assigning over an existing ID replaces its postings."""
+        index = TaskIndex({sample_task.id: sample_task})
+        replacement = Task(id=sample_task.id, title="New", type=TaskType.PROJECT)
+
+        index[sample_task.id] = replacement
+
+        assert index.lookup(task_type="dat_ticket") == []
+        assert index.lookup(task_type="project") == [replacement]
+
+    def test_search_title_and_description(self):
+        """Test search matches either field, ignoring case."""
+        index = TaskIndex()
+        task1 = Task(title="Review DAT", description="labeling")
+        task2 = Task(title="Other", description="dat cleanup")
+        task3 = Task(title="Unrelated", description="nothing")
+        for task in (task1, task2, task3):
+            index[task.id] = task
+
+        assert index.search("DaT") == [task1, task2]
+        assert index.search("dat", [task2, task3]) == [task2]
+
+    def test_search_not_across_fields(self):
+        """Test a match cannot span the end of title and start of description."""
+        task = Task(title="ab", description="cd")
+        index = TaskIndex({task.id: task})
+
+        assert index.search("bc") == []
+
+    def test_search_after_reindex(self, sample_task):
+        """Test search text is refreshed by reindex."""
+        index = TaskIndex({sample_task.id: sample_task})
+
+        sample_task.title = "Renamed"
+        sample_task.description = ""
+        index.reindex(sample_task.id)
+
+        assert index.search("renamed") == [sample_task]
+        assert index.search("test task") == []
+
+    def test_overdue_sorted_by_eta(self):
+        """Test overdue returns unfinished past-ETA tasks, earliest first."""
+        now = datetime(2025, 1, 10, 12, 0)
+        late = Task(title="Late", eta=now - timedelta(days=1))
+        later = Task(title="Later", eta=now - timedelta(days=3))
+        future = Task(title="Future", eta=now + timedelta(days=1))
+        done = Task(title="Done", eta=now - timedelta(days=2), status=TaskStatus.DONE)
+        no_eta = Task(title="No ETA")
+        index = TaskIndex({t.id: t for t in (late, later, future, done, no_eta)})
+
+        assert index.overdue(now) == [later, late]
+
+    def test_overdue_after_reindex_and_delete(self):
+        """Test the ETA list follows status changes and removals."""
+        now = datetime(2025, 1, 10, 12, 0)
+        task1 = Task(title="One", eta=now - timedelta(days=1))
+        task2 = Task(title="Two", eta=now - timedelta(days=2))
+        index = TaskIndex({t.id: t for t in (task1, task2)})
+
+        task1.status = TaskStatus.DONE
+        index.reindex(task1.id)
+        del index[task2.id]
+
+        assert index.overdue(now) == []
+        assert index._by_eta == []
+
+    def test_overdue_aware_eta(self):
+        """Test timezone-aware ETAs compare against naive local time."""
+        now = datetime(2025, 1, 10, 12, 0)
+        eta = (now - timedelta(hours=1)).astimezone(timezone.utc)
+        task = Task(title="Aware", eta=eta)
+        index = TaskIndex({task.id: task})
+
+        assert index.overdue(now) == [task]
+
+    def test_needing_check(self):
+        """Test tasks are due once last_checked plus the interval has passed."""
+        now = datetime(2025, 1, 10, 12, 0)
+        never = Task(title="Never")
+        daily = Task(title="Daily", check_frequency=CheckFrequency.DAILY, last_checked=now - timedelta(days=2))
+        weekly = Task(title="Weekly", last_checked=now - timedelta(days=2))
+        custom = Task(title="Custom", check_frequency=CheckFrequency.CUSTOM, last_checked=now - timedelta(days=60))
+        done = Task(title="Done", status=TaskStatus.DONE)
+        index = TaskIndex({t.id: t for t in (daily, weekly, custom, done, never)})
+
+        assert index.needing_check(now) == [never, daily]
+
+    def test_needing_check_after_reindex(self):
+        """Test reindex picks up a new last_checked time."""
+        now = datetime(2025, 1, 10, 12, 0)
+        task = Task(title="Checked")
+        index = TaskIndex({task.id: task})
+
+        task.last_checked = now
+        index.reindex(task.id)
+
+        assert index.needing_check(now) == []
+        assert index.needing_check(now + timedelta(days=7)) == [task]
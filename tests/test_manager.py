@@ -1,7 +1,7 @@
 """Tests for TaskManager."""
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from pm.core.task import TaskType, TaskStatus, TaskPriority, CheckFrequency
 
@@ -38,6 +38,18 @@ class TestTaskManager:
         assert task.check_frequency == CheckFrequency.WEEKLY  # default
         assert task.status == TaskStatus.TODO
 
+    def test_create_tasks(self, manager):
+        """Test creating several tasks in one call."""
+        tasks = manager.create_tasks([
+            {"title": "First", "priority": TaskPriority.HIGH},
+            {"title": "Second"},
+        ])
+
+        assert [t.title for t in tasks] == ["First", "Second"]
+        assert tasks[0].priority == TaskPriority.HIGH
+        assert tasks[1].priority == TaskPriority.MEDIUM  # default
+        assert set(manager.storage.load_all_tasks()) == {t.id for t in tasks}
+
     def test_get_task(self, manager):
         """Test getting a task by ID."""
         task = manager.create_task(title="Test Task")
@@ -55,16 +67,23 @@ class TestTaskManager:
 
     def test_get_all_tasks(self, manager, multiple_tasks):
         """Test getting all tasks."""
-        # Create multiple tasks
-        for task in multiple_tasks:
-            manager._tasks[task.id] = task
-            manager.storage.save_task(task)
+        manager._tasks.update({t.id: t for t in multiple_tasks})
 
         all_tasks = manager.get_all_tasks()
 
         assert len(all_tasks) == len(multiple_tasks)
         assert all(isinstance(t, type(multiple_tasks[0])) for t in all_tasks)
 
+    def test_iter_tasks(self, manager):
+        """Test iterating tasks lazily in insertion order."""
+        first = manager.create_task(title="First")
+        manager.create_task(title="Second")
+
+        tasks = manager.iter_tasks()
+
+        assert next(tasks) is first
+        assert [t.title for t in tasks] == ["Second"]
+
     def test_update_task(self, manager):
         """Test updating a task."""
         task = manager.create_task(title="Original Title")
@@ -149,34 +168,37 @@ class TestTaskManager:
         assert started is not None
         assert started.status == TaskStatus.IN_PROGRESS
 
-    def test_filter_by_status(self, manager, multiple_tasks):
-        """Test filtering tasks by status."""
-        for task in multiple_tasks:
-            manager._tasks[task.id] = task
+    @pytest.mark.parametrize("kwarg,value,attr", [
+        ("status", TaskStatus.TODO, "status"),
+        ("status", TaskStatus.WAITING, "status"),
+        ("task_type", TaskType.DAT_TICKET, "type"),
+        ("priority", TaskPriority.HIGH, "priority"),
+    ])
+    def test_filter_single_field(self, manager, multiple_tasks, kwarg, value, attr):
+        """Test filtering tasks by one attribute."""
+        manager._tasks.update({t.id: t for t in multiple_tasks})
 
-        # Filter by TODO
-        todo_tasks = manager.filter_tasks(status=TaskStatus.TODO)
-        assert all(t.status == TaskStatus.TODO for t in todo_tasks)
+        results = manager.filter_tasks(**{kwarg: value})
 
-        # Filter by WAITING
-        waiting_tasks = manager.filter_tasks(status=TaskStatus.WAITING)
-        assert all(t.status == TaskStatus.WAITING for t in waiting_tasks)
+        assert results
+        assert all(getattr(t, attr) == value for t in results)
 
-    def test_filter_by_type(self, manager, multiple_tasks):
-        """Test filtering tasks by type."""
-        for task in multiple_tasks:
-            manager._tasks[task.id] = task
+    def test_filter_after_update(self, manager):
+        """Test filters reflect updated task attributes."""
+        task = manager.create_task(title="Moving Task", status=TaskStatus.TODO)
 
-        dat_tasks = manager.filter_tasks(task_type=TaskType.DAT_TICKET)
-        assert all(t.type == TaskType.DAT_TICKET for t in dat_tasks)
+        manager.update_task(task.id, status=TaskStatus.BLOCKED)
 
-    def test_filter_by_priority(self, manager, multiple_tasks):
-        """Test filtering tasks by priority."""
-        for task in multiple_tasks:
-            manager._tasks[task.id] = task
+        assert manager.filter_tasks(status=TaskStatus.TODO) == []
+        assert manager.filter_tasks(status=TaskStatus.BLOCKED) == [task]
 
-        high_priority = manager.filter_tasks(priority=TaskPriority.HIGH)
-        assert all(t.priority == TaskPriority.HIGH for t in high_priority)
+    def test_filter_status_and_priority(self, manager, multiple_tasks):
+        """Test filtering by several attributes at once."""
+        manager._tasks.update({t.id: t for t in multiple_tasks})
+
+        results = manager.filter_tasks(status=TaskStatus.TODO, priority=TaskPriority.MEDIUM)
+
+        assert [t.title for t in results] == ["Training Run"]
 
     def test_filter_by_tags(self, manager):
         """Test filtering tasks by tags."""
@@ -231,18 +253,18 @@ class TestTaskManager:
         assert len(results) == 1
         assert results[0].id == task1.id
 
-    def test_get_overdue_tasks(self, manager):
+    def test_get_overdue_tasks(self, manager, frozen_now):
         """Test getting overdue tasks."""
         # Create task with past ETA
         task1 = manager.create_task(
             title="Overdue Task",
-            eta=datetime.now() - timedelta(days=1),
+            eta=frozen_now - timedelta(days=1),
         )
 
         # Create task with future ETA
         task2 = manager.create_task(
             title="Future Task",
-            eta=datetime.now() + timedelta(days=1),
+            eta=frozen_now + timedelta(days=1),
         )
 
         overdue = manager.get_overdue_tasks()
@@ -250,38 +272,38 @@ class TestTaskManager:
         assert len(overdue) == 1
         assert overdue[0].id == task1.id
 
-    def test_get_tasks_needing_check(self, manager):
+    def test_get_tasks_needing_check(self, manager, frozen_now):
         """Test getting tasks that need status check."""
         # Task never checked
         task1 = manager.create_task(title="Never Checked")
 
         # Task checked recently
         task2 = manager.create_task(title="Recently Checked")
-        task2.last_checked = datetime.now()
+        task2.last_checked = frozen_now
         manager._tasks[task2.id] = task2
 
         # Task checked long ago
         task3 = manager.create_task(title="Checked Long Ago")
-        task3.last_checked = datetime.now() - timedelta(days=10)
+        task3.last_checked = frozen_now - timedelta(days=10)
         manager._tasks[task3.id] = task3
 
         needs_check = manager.get_tasks_needing_check()
 
         # task1 and task3 should need check
-        assert len(needs_check) >= 2
+        assert {t.id for t in needs_check} == {task1.id, task3.id}
 
-    def test_get_tasks_needing_notification(self, manager):
+    def test_get_tasks_needing_notification(self, manager, frozen_now):
         """Test getting tasks that need notification."""
         # Task with past notify_at
         task1 = manager.create_task(
             title="Needs Notification",
-            notify_at=datetime.now() - timedelta(hours=1),
+            notify_at=frozen_now - timedelta(hours=1),
         )
 
         # Task with future notify_at
         task2 = manager.create_task(
             title="Future Notification",
-            notify_at=datetime.now() + timedelta(hours=1),
+            notify_at=frozen_now + timedelta(hours=1),
         )
 
         needs_notify = manager.get_tasks_needing_notification()
@@ -291,8 +313,7 @@ class TestTaskManager:
 
     def test_get_summary(self, manager, multiple_tasks):
         """Test getting summary statistics."""
-        for task in multiple_tasks:
-            manager._tasks[task.id] = task
+        manager._tasks.update({t.id: t for t in multiple_tasks})
 
         summary = manager.get_summary()
 
@@ -307,6 +328,16 @@ class TestTaskManager:
         assert summary["by_status"]["todo"] >= 1
         assert summary["by_type"]["dat_ticket"] >= 1
 
+    def test_get_counts(self, manager, multiple_tasks):
+        """Test counts skip empty values and follow enum order."""
+        manager._tasks.update({t.id: t for t in multiple_tasks})
+
+        counts = manager.get_counts()
+
+        assert counts["total"] == len(multiple_tasks)
+        assert list(counts["by_status"].items()) == [("todo", 2), ("in_progress", 1), ("waiting", 1)]
+        assert "low" not in counts["by_priority"]
+
     def test_reload_tasks(self, manager):
         """Test reloading tasks from storage."""
         # Create task
@@ -0,0 +1,114 @@
+"""Tests for journal migration helpers."""
+
+import pytest
+from datetime import datetime
+
+from pm.core.storage import TaskStorage
+from pm.core.task import Task
+from pm.scripts import migrate_to_journal
+from pm.scripts.migrate_to_journal import (
+    copy_tree_snapshot,
+    group_tasks_by_week,
+)
+from pm.utils.config import Config
+
+
+class TestCopyTreeSnapshot:
+    """Test copy_tree_snapshot backup helper."""
+
+    def test_snapshot_copies_tree(self, temp_dir):
+        """Test files and subdirectories are copied."""
+        src = temp_dir / "tasks"
+        (src / "nested").mkdir(parents=True)
+        (src / "task-1.md").write_text("one")
+        (src / "nested" / "task-2.md").write_text("two")
+
+        copy_tree_snapshot(src, temp_dir / "backup")
+
+        assert (temp_dir / "backup" / "task-1.md").read_text() == "one"
+        assert (temp_dir / "backup" / "nested" / "task-2.md").read_text() == "two"
+
+    def test_snapshot_is_independent(self, temp_dir):
+        """Test in-place edits to the source do not reach the backup."""
+        src = temp_dir / "tasks"
+        src.mkdir()
+        (src / "task-1.md").write_text("original")
+
+        copy_tree_snapshot(src, temp_dir / "backup")
+        with open(src / "task-1.md", "w") as f:
+            f.write("edited")
+
+        assert (temp_dir / "backup" / "task-1.md").read_text() == "original"
+
+    def test_snapshot_without_cp(self, temp_dir, monkeypatch):
+        """Test fallback to shutil.copytree when cp is unavailable."""
+        monkeypatch.setattr(migrate_to_journal.shutil, "which", lambda name: None)
+        src = temp_dir / "tasks"
+        src.mkdir()
+        (src / "task-1.md").write_text("one")
+
+        copy_tree_snapshot(src, temp_dir / "backup")
+
+        assert (temp_dir / "backup" / "task-1.md").read_text() == "one"
+
+
+class TestGroupTasksByWeek:
+    """Test group_tasks_by_week."""
+
+    def test_group_by_creation_week(self):
+        """Test tasks are bucketed by ISO week of creation."""
+        tasks = [
+            Task(title="Mon", created_at=datetime(2026, 1, 5)),
+            Task(title="Sun", created_at=datetime(2026, 1, 11)),
+            Task(title="Next Mon", created_at=datetime(2026, 1, 12)),
+        ]
+
+        grouped = group_tasks_by_week({t.id: t for t in tasks})
+
+        assert {key: [t.title for t in week.values()] for key, week in grouped.items()} == {
+            (2026, 2): ["Mon", "Sun"],
+            (2026, 3): ["Next Mon"],
+        }
+
+
+class TestMigrateTasksToJournal:
+    """Test migrate_tasks_to_journal."""
+
+    @pytest.fixture
+    def task_files(self, temp_dir, monkeypatch):
+        """Task files spread over three weeks, with config pointing at them."""
+        config = Config(data_dir=str(temp_dir), storage_mode="multi_file")
+        monkeypatch.setattr(migrate_to_journal, "get_config", lambda: config)
+
+        storage = TaskStorage(str(temp_dir), storage_mode="multi_file")
+        for day in (5, 6, 13, 20):
+            storage.save_task(Task(title=f"Task {day}", created_at=datetime(2026, 1, day)))
+        return temp_dir
+
+    def test_migrate_writes_each_week(self, task_files):
+        """Test one journal is created per creation week."""
+        result = migrate_to_journal.migrate_tasks_to_journal(backup=False)
+
+        assert result["errors"] == []
+        assert result["tasks_migrated"] == 4
+        assert result["journals_created"] == 3
+        assert sorted(p.name for p in (task_files / "journal").glob("*.md")) == [
+            "2026-W02.md", "2026-W03.md", "2026-W04.md",
+        ]
+
+    def test_migrate_without_task_files(self, task_files):
+        """Test migration stops early when there are no task files."""
+        for path in (task_files / "tasks").glob("*.md"):
+            path.unlink()
+
+        result = migrate_to_journal.migrate_tasks_to_journal(backup=False)
+
+        assert result["tasks_found"] == 0
+
+    def test_migrate_dry_run_writes_nothing(self, task_files):
+        """Test dry run leaves the journal directory untouched."""
+        result = migrate_to_journal.migrate_tasks_to_journal(dry_run=True, backup=False)
+
+        assert result["tasks_found"] == 4
+        assert result["tasks_migrated"] == 0
+        assert list((task_files / "journal").glob("*.md")) == []
@@ -50,6 +50,10 @@ class TestTaskStorage:
         assert loaded_task.priority == sample_task.priority
         assert len(loaded_task.notes) == 2
 
+    def test_load_task_missing(self, storage, sample_task):
+        """Test loading a single task that was never saved."""
+        assert storage.load_task(sample_task.id) is None
+
     def test_load_empty_directory(self, storage):
         """Test loading from empty directory."""
         tasks = storage.load_all_tasks()
@@ -58,8 +62,7 @@ class TestTaskStorage:
     def test_load_multiple_tasks(self, storage, multiple_tasks):
         """Test loading multiple tasks."""
         # Save multiple tasks
-        for task in multiple_tasks:
-            storage.save_task(task)
+        storage.save_tasks(multiple_tasks)
 
         # Load all
         loaded = storage.load_all_tasks()
@@ -70,6 +73,15 @@ class TestTaskStorage:
             assert task.id in loaded
             assert loaded[task.id].title == task.title
 
+    def test_load_skips_non_task_entries(self, temp_dir, sample_task):
+        """Test only .md files in the tasks directory are loaded."""
+        storage = TaskStorage(data_dir=str(temp_dir))
+        storage.save_task(sample_task)
+        (storage.tasks_dir / "notes.txt").write_text("not a task")
+        (storage.tasks_dir / "archive.md").mkdir()
+
+        assert list(storage.load_all_tasks()) == [sample_task.id]
+
     def test_delete_task(self, storage, sample_task):
         """Test deleting a task."""
         # Save task first
@@ -104,54 +116,21 @@ class TestTaskStorage:
 
         assert path == storage.tasks_dir / f"{task_id}.md"
 
-    def test_task_with_description(self, storage):
-        """Test task with description is saved and loaded correctly."""
-        task = Task(
-            title="Test Task",
-            description="This is a detailed description\nwith multiple lines",
-            type=TaskType.PROJECT,
-        )
-
-        storage.save_task(task)
-        loaded = storage.load_all_tasks()[task.id]
-
-        assert loaded.description == task.description
-
-    def test_task_with_eta(self, storage):
-        """Test task with ETA is saved and loaded correctly."""
-        task = Task(
-            title="Task with ETA",
-            eta=datetime(2026, 3, 15, 10, 0, 0),
-        )
-
-        storage.save_task(task)
-        loaded = storage.load_all_tasks()[task.id]
-
-        assert loaded.eta == task.eta
-
-    def test_task_with_dependencies(self, storage):
-        """Test task with dependencies."""
-        task = Task(
-            title="Dependent Task",
-            dependencies=["task-001", "task-002"],
-        )
-
-        storage.save_task(task)
-        loaded = storage.load_all_tasks()[task.id]
-
-        assert loaded.dependencies == ["task-001", "task-002"]
-
-    def test_task_with_tags(self, storage):
-        """Test task with tags."""
-        task = Task(
-            title="Tagged Task",
-            tags=["important", "urgent", "dat"],
-        )
+    @pytest.mark.parametrize("fields", [
+        {"description": "This is a detailed description\nwith multiple lines", "type": TaskType.PROJECT},
+        {"eta": datetime(2026, 3, 15, 10, 0, 0)},
+        {"dependencies": ["task-001", "task-002"]},
+        {"tags": ["important", "urgent", "dat"]},
+        {"title": "Task: DAT-12345 [URGENT]", "description": "Description with special chars: @#$%^&*()"},
+    ], ids=["description", "eta", "dependencies", "tags", "special_characters"])
+    def test_task_field_roundtrip(self, storage, fields):
+        """Test task fields are saved and loaded unchanged."""
+        task = Task(**{"title": "Round Trip Task", **fields})
 
         storage.save_task(task)
-        loaded = storage.load_all_tasks()[task.id]
+        loaded = storage.load_task(task.id)
 
-        assert loaded.tags == ["important", "urgent", "dat"]
+        assert {name: getattr(loaded, name) for name in fields} == fields
 
     def test_update_existing_task(self, storage, sample_task):
         """Test updating an existing task."""
@@ -167,25 +146,12 @@ class TestTaskStorage:
         storage.save_task(sample_task)
 
         # Load and verify
-        loaded = storage.load_all_tasks()[sample_task.id]
+        loaded = storage.load_task(sample_task.id)
 
         assert loaded.title == "Updated Title"
         assert loaded.status == TaskStatus.IN_PROGRESS
         assert len(loaded.notes) == 1
 
-    def test_storage_with_special_characters(self, storage):
-        """Test tasks with special characters in title/description."""
-        task = Task(
-            title="Task: DAT-12345 [URGENT]",
-            description="Description with special chars: @#$%^&*()",
-        )
-
-        storage.save_task(task)
-        loaded = storage.load_all_tasks()[task.id]
-
-        assert loaded.title == task.title
-        assert loaded.description == task.description
-
     def test_corrupted_file_handling(self, storage, sample_task):
         """Test handling of corrupted task file."""
         # Save valid task
@@ -201,6 +167,18 @@ class TestTaskStorage:
         # The corrupted task may or may not be loaded depending on error handling
         # Main thing is it shouldn't crash
         assert isinstance(tasks, dict)
+        assert storage.load_task(sample_task.id) is None
+
+    def test_repeated_loads_independent(self, storage, sample_task):
+        """Test loads of an unchanged file do not share mutable fields."""
+        storage.save_task(sample_task)
+
+        first = storage.load_task(sample_task.id)
+        first.tags.append("extra")
+        second = storage.load_task(sample_task.id)
+
+        assert second.tags == sample_task.tags
+        assert second.notes == sample_task.notes
 
     def test_markdown_frontmatter_format(self, storage, sample_task):
         """Test that saved files have correct markdown frontmatter format."""
@@ -217,15 +195,41 @@ class TestTaskStorage:
         assert f"title: {sample_task.title}" in content
         assert f"type: {sample_task.type.value}" in content
 
+    def test_memory_mode_skips_filesystem(self, temp_dir, sample_task):
+        """Test memory mode keeps tasks without creating any files."""
+        storage = TaskStorage(data_dir=str(temp_dir / "mem"), storage_mode="memory")
+
+        storage.save_task(sample_task)
+
+        assert not storage.data_dir.exists()
+        assert storage.task_exists(sample_task.id)
+        assert storage.load_all_tasks()[sample_task.id].title == sample_task.title
+
+    def test_memory_mode_returns_copies(self, temp_dir, sample_task):
+        """Test edits to loaded tasks are not visible until saved."""
+        storage = TaskStorage(data_dir=str(temp_dir), storage_mode="memory")
+        storage.save_task(sample_task)
+
+        sample_task.title = "Changed"
+        storage.load_all_tasks()[sample_task.id].title = "Also changed"
+
+        assert storage.load_all_tasks()[sample_task.id].title == "Test Task"
+        assert storage.delete_task(sample_task.id)
+        assert not storage.delete_task(sample_task.id)
+
+    def test_memory_mode_clear(self, temp_dir, sample_task):
+        """Test clear_memory drops every stored task."""
+        storage = TaskStorage(data_dir=str(temp_dir), storage_mode="memory")
+        storage.save_task(sample_task)
+
+        storage.clear_memory()
+
+        assert storage.load_all_tasks() == {}
+
 
 class TestJournalStorage:
     """Test JournalStorage class."""
 
-    @pytest.fixture
-    def journal_storage(self, temp_dir):
-        """Create a JournalStorage instance for testing."""
-        return JournalStorage(data_dir=str(temp_dir), backup_enabled=False)
-
     def test_storage_initialization(self, temp_dir):
         """Test storage initialization creates directories."""
         storage = JournalStorage(data_dir=str(temp_dir))
@@ -346,6 +350,15 @@ Line 5
         assert "Line 4" in errors[0]
         assert "Line 6" in errors[1]
 
+    def test_detect_new_tasks_line_numbers_for_valid_entries(self, journal_storage):
+        """Test line numbers stay correct across valid and consecutive entries."""
+        content = "- [ ] NEW: One (general, high)\n- [ ] NEW: Two (project, low)\n\n- [ ] NEW: Bad\n"
+
+        new_tasks, errors = journal_storage.detect_new_tasks(content)
+
+        assert [t["line_num"] for t in new_tasks] == [1, 2]
+        assert errors[0].startswith("Line 4:")
+
     def test_process_new_task_entries_creates_files(self, journal_storage):
         """Test that process_new_task_entries creates task files."""
         content = """
@@ -387,6 +400,27 @@ Line 5
         # Should have 2 errors
         assert len(errors) == 2
 
+    def test_process_new_task_entries_replaces_in_place(self, journal_storage):
+        """Test several NEW: lines are replaced and other text is kept."""
+        content = textwrap.dedent("""\
+            ### 📋 Planned
+            - [ ] NEW: First (general, high)
+            - [x] task-abc12300: Existing (general, low)
+            - [ ] NEW: Second (project, medium)
+            Trailing note
+            """)
+
+        updated_content, created_tasks, errors = journal_storage.process_new_task_entries(content)
+
+        first, second = created_tasks
+        assert updated_content == textwrap.dedent(f"""\
+            ### 📋 Planned
+            - [ ] {first.id}: First (general, high)
+            - [x] task-abc12300: Existing (general, low)
+            - [ ] {second.id}: Second (project, medium)
+            Trailing note
+            """)
+
     def test_get_journal_task_ids(self, journal_storage):
         """Test extracting task IDs from journal content."""
         content = textwrap.dedent("""\
@@ -436,53 +470,29 @@ Line 5
 class TestJournalStorageErrorMessages:
     """Test error message quality for JournalStorage."""
 
-    @pytest.fixture
-    def journal_storage(self, temp_dir):
-        """Create a JournalStorage instance for testing."""
-        return JournalStorage(data_dir=str(temp_dir), backup_enabled=False)
-
-    def test_error_message_includes_expected_format(self, journal_storage):
-        """Test that error messages include the expected format."""
-        content = """
-- [ ] NEW: Bad entry
-"""
-        _, errors = journal_storage.detect_new_tasks(content)
-
-        assert len(errors) == 1
-        assert "Expected format: '- [ ] NEW: Task title (type, priority)'" in errors[0]
-
-    def test_error_message_includes_valid_types(self, journal_storage):
-        """Test that error messages list valid task types."""
-        content = """
-- [ ] NEW: Task with bad type (badtype, high)
-"""
-        _, errors = journal_storage.detect_new_tasks(content)
-
-        assert len(errors) == 1
-        assert "dat_ticket" in errors[0]
-        assert "cross_team" in errors[0]
-        assert "project" in errors[0]
-        assert "training_run" in errors[0]
-        assert "general" in errors[0]
-
-    def test_error_message_includes_valid_priorities(self, journal_storage):
-        """Test that error messages list valid priorities."""
-        content = """
-- [ ] NEW: Task with bad priority (general, badpriority)
-"""
-        _, errors = journal_storage.detect_new_tasks(content)
-
-        assert len(errors) == 1
-        assert "high" in errors[0]
-        assert "medium" in errors[0]
-        assert "low" in errors[0]
-
-    def test_error_message_shows_actual_input(self, journal_storage):
-        """Test that error messages show what was actually entered."""
-        content = """
-- [ ] NEW: My malformed task entry
-"""
-        _, errors = journal_storage.detect_new_tasks(content)
-
-        assert len(errors) == 1
-        assert "- [ ] NEW: My malformed task entry" in errors[0]
+    @pytest.mark.parametrize("entry,expected", [
+        (
+            "- [ ] NEW: Bad entry",
+            "Line 2: Malformed NEW entry. Expected format: "
+            "'- [ ] NEW: Task title (type, priority)'. Got: '- [ ] NEW: Bad entry'",
+        ),
+        (
+            "- [ ] NEW: Task with bad type (badtype, high)",
+            "Line 2: Invalid task type 'badtype'. "
+            "Valid types: dat_ticket, cross_team, project, training_run, general",
+        ),
+        (
+            "- [ ] NEW: Task with bad priority (general, badpriority)",
+            "Line 2: Invalid priority 'badpriority'. Valid priorities: high, medium, low",
+        ),
+        (
+            "- [ ] NEW: My malformed task entry",
+            "Line 2: Malformed NEW entry. Expected format: "
+            "'- [ ] NEW: Task title (type, priority)'. Got: '- [ ] NEW: My malformed task entry'",
+        ),
+    ], ids=["expected_format", "valid_types", "valid_priorities", "actual_input"])
+    def test_error_message(self, journal_storage, entry, expected):
+        """Test error messages give the line, the problem and how to fix it."""
+        _, errors = journal_storage.detect_new_tasks(f"\n{entry}\n")
+
+        assert errors == [expected]
@@ -67,6 +67,18 @@ class TestTask:
         assert task.status == TaskStatus.TODO
         assert task.priority == TaskPriority.MEDIUM
 
+    def test_task_uses_slots(self, sample_task):
+        """Test tasks and notes are slotted but still mutable."""
+        sample_task.add_note("Slotted")
+
+        assert not hasattr(sample_task, "__dict__")
+        assert not hasattr(sample_task.notes[0], "__dict__")
+
+        sample_task.title = "Renamed"
+        assert sample_task.title == "Renamed"
+        with pytest.raises(AttributeError):
+            sample_task.unknown_field = True
+
     def test_add_note(self, sample_task):
         """Test adding a note to task."""
         initial_notes = len(sample_task.notes)
@@ -75,74 +87,68 @@ class TestTask:
         assert len(sample_task.notes) == initial_notes + 1
         assert sample_task.notes[-1].content == "First note"
 
-    def test_is_overdue_no_eta(self, sample_task):
-        """Test is_overdue when no ETA set."""
-        assert not sample_task.is_overdue()
-
-    def test_is_overdue_past_eta(self, sample_task):
-        """Test is_overdue when ETA is in the past."""
-        sample_task.eta = datetime.now() - timedelta(days=1)
-        assert sample_task.is_overdue()
-
-    def test_is_overdue_future_eta(self, sample_task):
-        """Test is_overdue when ETA is in the future."""
-        sample_task.eta = datetime.now() + timedelta(days=1)
-        assert not sample_task.is_overdue()
-
-    def test_is_overdue_done_task(self, sample_task):
-        """Test is_overdue for done task (should be False)."""
-        sample_task.eta = datetime.now() - timedelta(days=1)
-        sample_task.status = TaskStatus.DONE
-        assert not sample_task.is_overdue()
-
-    def test_needs_check_never_checked(self, sample_task):
-        """Test needs_check when never checked."""
-        assert sample_task.needs_check()
-
-    def test_needs_check_done_task(self, sample_task):
-        """Test needs_check for done task (should be False)."""
-        sample_task.status = TaskStatus.DONE
-        assert not sample_task.needs_check()
-
-    def test_needs_check_weekly(self, sample_task):
-        """Test needs_check with weekly frequency."""
-        sample_task.check_frequency = CheckFrequency.WEEKLY
-
-        # Just checked - shouldn't need check
-        sample_task.last_checked = datetime.now()
-        assert not sample_task.needs_check()
-
-        # Checked 8 days ago - should need check
-        sample_task.last_checked = datetime.now() - timedelta(days=8)
-        assert sample_task.needs_check()
-
-    def test_needs_check_daily(self, sample_task):
-        """Test needs_check with daily frequency."""
+    @pytest.mark.parametrize("eta_offset,status,expected", [
+        (None, TaskStatus.TODO, False),
+        (timedelta(days=-1), TaskStatus.TODO, True),
+        (timedelta(days=1), TaskStatus.TODO, False),
+        (timedelta(days=-1), TaskStatus.DONE, False),
+    ], ids=["no_eta", "past_eta", "future_eta", "done_task"])
+    def test_is_overdue(self, sample_task, eta_offset, status, expected):
+        """Test is_overdue against the current time."""
+        sample_task.eta = datetime.now() + eta_offset if eta_offset is not None else None
+        sample_task.status = status
+
+        assert sample_task.is_overdue() is expected
+
+    @pytest.mark.parametrize("frequency,checked_offset,status,expected", [
+        (CheckFrequency.WEEKLY, None, TaskStatus.TODO, True),
+        (CheckFrequency.WEEKLY, None, TaskStatus.DONE, False),
+        (CheckFrequency.WEEKLY, timedelta(0), TaskStatus.TODO, False),
+        (CheckFrequency.WEEKLY, timedelta(days=-8), TaskStatus.TODO, True),
+        (CheckFrequency.DAILY, timedelta(days=-2), TaskStatus.TODO, True),
+    ], ids=["never_checked", "done_task", "weekly_just_checked", "weekly_overdue", "daily_overdue"])
+    def test_needs_check(self, sample_task, frequency, checked_offset, status, expected):
+        """Test needs_check against the current time."""
+        sample_task.check_frequency = frequency
+        sample_task.last_checked = datetime.now() + checked_offset if checked_offset is not None else None
+        sample_task.status = status
+
+        assert sample_task.needs_check() is expected
+
+    @pytest.mark.parametrize("notify_offset,status,expected", [
+        (None, TaskStatus.TODO, False),
+        (timedelta(hours=1), TaskStatus.TODO, False),
+        (timedelta(hours=-1), TaskStatus.TODO, True),
+        (timedelta(hours=-1), TaskStatus.DONE, False),
+    ], ids=["no_notify_at", "future", "past", "done_task"])
+    def test_needs_notification(self, sample_task, notify_offset, status, expected):
+        """Test needs_notification against the current time."""
+        sample_task.notify_at = datetime.now() + notify_offset if notify_offset is not None else None
+        sample_task.status = status
+
+        assert sample_task.needs_notification() is expected
+
+    def test_needs_notification_at_given_time(self, sample_task):
+        """Test needs_notification compares against an explicit time."""
+        sample_task.notify_at = datetime(2026, 1, 10, 12, 0)
+
+        assert not sample_task.needs_notification(datetime(2026, 1, 10, 11, 59))
+        assert sample_task.needs_notification(datetime(2026, 1, 10, 12, 0))
+
+    def test_is_overdue_at_given_time(self, sample_task):
+        """Test is_overdue compares against an explicit time."""
+        sample_task.eta = datetime(2026, 1, 10, 12, 0)
+
+        assert not sample_task.is_overdue(datetime(2026, 1, 10, 12, 0))
+        assert sample_task.is_overdue(datetime(2026, 1, 10, 12, 1))
+
+    def test_needs_check_at_given_time(self, sample_task):
+        """Test needs_check compares against an explicit time."""
         sample_task.check_frequency = CheckFrequency.DAILY
+        sample_task.last_checked = datetime(2026, 1, 10, 12, 0)
 
-        # Checked 2 days ago - should need check
-        sample_task.last_checked = datetime.now() - timedelta(days=2)
-        assert sample_task.needs_check()
-
-    def test_needs_notification_no_notify_at(self, sample_task):
-        """Test needs_notification when no notify_at set."""
-        assert not sample_task.needs_notification()
-
-    def test_needs_notification_future(self, sample_task):
-        """Test needs_notification when notify_at is in future."""
-        sample_task.notify_at = datetime.now() + timedelta(hours=1)
-        assert not sample_task.needs_notification()
-
-    def test_needs_notification_past(self, sample_task):
-        """Test needs_notification when notify_at is in past."""
-        sample_task.notify_at = datetime.now() - timedelta(hours=1)
-        assert sample_task.needs_notification()
-
-    def test_needs_notification_done_task(self, sample_task):
-        """Test needs_notification for done task (should be False)."""
-        sample_task.notify_at = datetime.now() - timedelta(hours=1)
-        sample_task.status = TaskStatus.DONE
-        assert not sample_task.needs_notification()
+        assert not sample_task.needs_check(datetime(2026, 1, 11, 11, 59))
+        assert sample_task.needs_check(datetime(2026, 1, 11, 12, 0))
 
     def test_mark_checked(self, sample_task):
         """Test mark_checked method."""
@@ -1,106 +1,109 @@
 """Test fixtures for web module tests."""
 
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
-from datetime import datetime
+from typing import List
 
-from pm.core.task import Task, TaskType, TaskStatus, TaskPriority, CheckFrequency
-from pm.core.journal import WeeklyJournal, DaySection
+from pm.core.task import Task, TaskType, TaskStatus, TaskPriority
+from pm.core.journal import WeeklyJournal
 from pm.core.manager import TaskManager
-from pm.core.journal_manager import JournalManager
+from pm.utils.config import Config, override_config
 
 
 @pytest.fixture
-def web_temp_dir():
+def web_temp_dir(tmp_path):
     """Create a temporary directory for web test data."""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    shutil.rmtree(temp_path)
+    return tmp_path
 
 
-@pytest.fixture
-def web_manager(web_temp_dir, monkeypatch):
-    """TaskManager with test data directory for web tests."""
-    import pm.utils.config as config_module
-    from pm.utils.config import Config, ConfigManager
-
-    # Reset the global config manager singleton
-    config_module._config_manager = None
-
-    test_cfg = Config(
-        data_dir=str(web_temp_dir),
+def _test_config(data_dir: Path) -> Config:
+    """Config storing one task file per task under data_dir."""
+    return Config(
+        data_dir=str(data_dir),
         storage_mode="multi_file",
     )
 
-    # Create a test config manager
-    test_config_manager = ConfigManager.__new__(ConfigManager)
-    test_config_manager.config = test_cfg
-    test_config_manager.config_file = web_temp_dir / "test_config.yaml"
 
-    # Patch the global singleton
-    config_module._config_manager = test_config_manager
+def _create_sample_tasks(manager: TaskManager) -> List[Task]:
+    """Create one done, one in-progress and one todo task."""
+    return manager.create_tasks([
+        {
+            "title": "Review PR #123",
+            "task_type": TaskType.DAT_TICKET,
+            "priority": TaskPriority.HIGH,
+            "status": TaskStatus.DONE,
+        },
+        {
+            "title": "Fix authentication bug",
+            "task_type": TaskType.PROJECT,
+            "priority": TaskPriority.MEDIUM,
+            "status": TaskStatus.IN_PROGRESS,
+        },
+        {
+            "title": "Write documentation",
+            "task_type": TaskType.GENERAL,
+            "priority": TaskPriority.LOW,
+            "status": TaskStatus.TODO,
+        },
+    ])
+
+
+def _write_sample_journal(data_dir: Path, tasks: List[Task]) -> WeeklyJournal:
+    """Write a week 2, 2026 journal planning all tasks on Monday."""
+    journal_dir = data_dir / "journal"
+    journal_dir.mkdir(parents=True, exist_ok=True)
 
-    def mock_get_config(*args, **kwargs):
-        return test_cfg
+    journal = WeeklyJournal(2026, 2, journal_dir)
 
-    monkeypatch.setattr("pm.utils.config.get_config", mock_get_config)
+    # Add Monday section with tasks
+    day_section = journal.add_day_section(journal.week_start)
+    day_section.planned = [t.id for t in tasks]
+    day_section.completed = [tasks[0].id]  # First task is done
 
-    manager = TaskManager()
-    yield manager
-    config_module._config_manager = None
+    journal.save({t.id: t for t in tasks})
+    return journal
+
+
+@pytest.fixture
+def web_manager(web_temp_dir):
+    """TaskManager with test data directory for web tests."""
+    with override_config(_test_config(web_temp_dir)):
+        yield TaskManager()
 
 
 @pytest.fixture
 def sample_tasks(web_manager):
     """Create sample tasks for testing."""
-    tasks = []
+    return _create_sample_tasks(web_manager)
 
-    task1 = web_manager.create_task(
-        title="Review PR #123",
-        task_type=TaskType.DAT_TICKET,
-        priority=TaskPriority.HIGH,
-        status=TaskStatus.DONE,
-    )
-    tasks.append(task1)
 
-    task2 = web_manager.create_task(
-        title="Fix authentication bug",
-        task_type=TaskType.PROJECT,
-        priority=TaskPriority.MEDIUM,
-        status=TaskStatus.IN_PROGRESS,
-    )
-    tasks.append(task2)
+@pytest.fixture
+def sample_journal(web_temp_dir, sample_tasks):
+    """Create a sample journal with tasks for testing."""
+    return _write_sample_journal(web_temp_dir, sample_tasks)
 
-    task3 = web_manager.create_task(
-        title="Write documentation",
-        task_type=TaskType.GENERAL,
-        priority=TaskPriority.LOW,
-        status=TaskStatus.TODO,
-    )
-    tasks.append(task3)
 
-    return tasks
+@pytest.fixture(scope="module")
+def _shared_web_root(tmp_path_factory):
+    """Data directory holding the module's shared sample data."""
+    return tmp_path_factory.mktemp("web-shared")
 
 
-@pytest.fixture
-def sample_journal(web_temp_dir, sample_tasks):
-    """Create a sample journal with tasks for testing."""
-    journal_dir = web_temp_dir / "journal"
-    journal_dir.mkdir(parents=True, exist_ok=True)
+@pytest.fixture(scope="module")
+def shared_sample_tasks(_shared_web_root):
+    """Sample tasks written once per module. Tests must not modify them."""
+    with override_config(_test_config(_shared_web_root)):
+        return _create_sample_tasks(TaskManager())
 
-    # Create a journal for week 2, 2026
-    journal = WeeklyJournal(2026, 2, journal_dir)
 
-    # Add Monday section with tasks
-    monday = journal.week_start
-    day_section = journal.add_day_section(monday)
-    day_section.planned = [t.id for t in sample_tasks]
-    day_section.completed = [sample_tasks[0].id]  # First task is done
+@pytest.fixture(scope="module")
+def shared_sample_journal(_shared_web_root, shared_sample_tasks):
+    """Sample journal written once per module. Tests must not modify it."""
+    return _write_sample_journal(_shared_web_root, shared_sample_tasks)
 
-    # Save the journal
-    tasks_by_id = {t.id: t for t in sample_tasks}
-    journal.save(tasks_by_id)
 
-    return journal
+@pytest.fixture
+def shared_web_dir(_shared_web_root):
+    """Data directory of the shared sample data, with the config pointed at it."""
+    with override_config(_test_config(_shared_web_root)):
+        yield _shared_web_root
@@ -1,5 +1,7 @@
 """Tests for JournalDataLoader."""
 
+import os
+
 import pytest
 from datetime import datetime
 
@@ -27,11 +29,11 @@ class TestJournalDataLoader:
         loader = JournalDataLoader(journal_dir=str(journal_dir))
         weeks = loader.get_available_weeks()
 
-        assert weeks == []
+        assert weeks == ()
 
-    def test_get_available_weeks_with_journals(self, web_manager, web_temp_dir, sample_journal):
+    def test_get_available_weeks_with_journals(self, shared_web_dir, shared_sample_journal):
         """Test get_available_weeks finds journal files."""
-        loader = JournalDataLoader(journal_dir=str(web_temp_dir / "journal"))
+        loader = JournalDataLoader(journal_dir=str(shared_web_dir / "journal"))
         weeks = loader.get_available_weeks()
 
         assert len(weeks) == 1
@@ -40,6 +42,42 @@ class TestJournalDataLoader:
         assert week == 2
         assert "2026-W02" in display
 
+    def test_get_available_weeks_ignores_other_files(self, web_manager, web_temp_dir, sample_journal):
+        """Test summaries and unrelated files are not listed as weeks."""
+        journal_dir = web_temp_dir / "journal"
+        (journal_dir / "2026-W02-summary.md").write_text("# Summary\n")
+        (journal_dir / "2026-Wxx.md").write_text("")
+        (journal_dir / "notes.txt").write_text("")
+
+        loader = JournalDataLoader(journal_dir=str(journal_dir))
+
+        assert [w[:2] for w in loader.get_available_weeks()] == [(2026, 2)]
+
+    def test_get_available_weeks_limit(self, web_manager, web_temp_dir):
+        """Test the listing is capped to the newest weeks unless limit is None."""
+        journal_dir = web_temp_dir / "journal"
+        journal_dir.mkdir(parents=True, exist_ok=True)
+        for week in range(1, 31):
+            (journal_dir / f"2026-W{week:02d}.md").write_text("")
+
+        loader = JournalDataLoader(journal_dir=str(journal_dir))
+
+        assert len(loader.get_available_weeks()) == 26
+        assert [w[1] for w in loader.get_available_weeks(limit=2)] == [30, 29]
+        assert len(loader.get_available_weeks(limit=None)) == 30
+
+    def test_get_available_weeks_sees_new_journal(self, web_manager, web_temp_dir, sample_journal):
+        """Test a newly created journal file shows up in the listing."""
+        journal_dir = web_temp_dir / "journal"
+        loader = JournalDataLoader(journal_dir=str(journal_dir))
+        assert len(loader.get_available_weeks()) == 1
+
+        (journal_dir / "2026-W03.md").write_text("# Week 3\n")
+        stat = journal_dir.stat()
+        os.utime(journal_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert [w[:2] for w in loader.get_available_weeks()] == [(2026, 3), (2026, 2)]
+
     def test_get_journal_data_not_found(self, web_manager, web_temp_dir):
         """Test get_journal_data returns None for missing journal."""
         journal_dir = web_temp_dir / "journal"
@@ -50,32 +88,32 @@ class TestJournalDataLoader:
 
         assert result is None
 
-    def test_get_journal_data_found(self, web_manager, web_temp_dir, sample_journal, sample_tasks):
+    def test_get_journal_data_found(self, shared_web_dir, shared_sample_journal, shared_sample_tasks):
         """Test get_journal_data returns journal data."""
-        loader = JournalDataLoader(journal_dir=str(web_temp_dir / "journal"))
+        loader = JournalDataLoader(journal_dir=str(shared_web_dir / "journal"))
         result = loader.get_journal_data(2026, 2)
 
         assert result is not None
         assert isinstance(result, WeeklyJournalData)
         assert result.year == 2026
         assert result.week == 2
-        assert len(result.days) == 7  # Monday to Sunday
+        assert len(list(result.iter_days())) == 7  # Monday to Sunday
 
-    def test_journal_data_has_week_info(self, web_manager, web_temp_dir, sample_journal):
+    def test_journal_data_has_week_info(self, shared_web_dir, shared_sample_journal):
         """Test journal data includes week range info."""
-        loader = JournalDataLoader(journal_dir=str(web_temp_dir / "journal"))
+        loader = JournalDataLoader(journal_dir=str(shared_web_dir / "journal"))
         result = loader.get_journal_data(2026, 2)
 
         assert result.week_range_str is not None
         assert "Jan" in result.week_range_str  # Week 2 of 2026 is in January
 
-    def test_journal_data_has_day_sections(self, web_manager, web_temp_dir, sample_journal, sample_tasks):
+    def test_journal_data_has_day_sections(self, shared_web_dir, shared_sample_journal, shared_sample_tasks):
         """Test journal data includes day sections with tasks."""
-        loader = JournalDataLoader(journal_dir=str(web_temp_dir / "journal"))
+        loader = JournalDataLoader(journal_dir=str(shared_web_dir / "journal"))
         result = loader.get_journal_data(2026, 2)
 
         # Find Monday's data
-        monday_key = sample_journal.get_day_key(sample_journal.week_start)
+        monday_key = shared_sample_journal.get_day_key(shared_sample_journal.week_start)
         assert monday_key in result.days
 
         monday_data = result.days[monday_key]
@@ -83,12 +121,12 @@ class TestJournalDataLoader:
         assert monday_data.day_name == "Monday"
         assert len(monday_data.planned_tasks) > 0
 
-    def test_task_display_data_structure(self, web_manager, web_temp_dir, sample_journal, sample_tasks):
+    def test_task_display_data_structure(self, shared_web_dir, shared_sample_journal, shared_sample_tasks):
         """Test TaskDisplayData has correct fields."""
-        loader = JournalDataLoader(journal_dir=str(web_temp_dir / "journal"))
+        loader = JournalDataLoader(journal_dir=str(shared_web_dir / "journal"))
         result = loader.get_journal_data(2026, 2)
 
-        monday_key = sample_journal.get_day_key(sample_journal.week_start)
+        monday_key = shared_sample_journal.get_day_key(shared_sample_journal.week_start)
         monday_data = result.days[monday_key]
 
         # Check planned tasks
@@ -102,22 +140,47 @@ class TestJournalDataLoader:
         assert task.priority in ["high", "medium", "low"]
         assert task.status in ["todo", "in_progress", "waiting", "blocked", "done"]
 
-    def test_completed_tasks_tracked(self, web_manager, web_temp_dir, sample_journal, sample_tasks):
+    def test_completed_tasks_tracked(self, shared_web_dir, shared_sample_journal, shared_sample_tasks):
         """Test completed tasks are correctly tracked."""
-        loader = JournalDataLoader(journal_dir=str(web_temp_dir / "journal"))
+        loader = JournalDataLoader(journal_dir=str(shared_web_dir / "journal"))
         result = loader.get_journal_data(2026, 2)
 
-        monday_key = sample_journal.get_day_key(sample_journal.week_start)
+        monday_key = shared_sample_journal.get_day_key(shared_sample_journal.week_start)
         monday_data = result.days[monday_key]
 
         # First task should be completed
         assert len(monday_data.completed_tasks) == 1
         completed_task = monday_data.completed_tasks[0]
         assert completed_task.is_completed is True
+        # Planned and completed entries for one task share display data
+        assert completed_task is monday_data.planned_tasks[0]
+
+    def test_only_journal_days_stored(self, shared_web_dir, shared_sample_journal, shared_sample_tasks):
+        """Test days without a section are filled in only when iterating."""
+        loader = JournalDataLoader(journal_dir=str(shared_web_dir / "journal"))
+        result = loader.get_journal_data(2026, 2)
+
+        monday_key = shared_sample_journal.get_day_key(shared_sample_journal.week_start)
+        days = list(result.iter_days())
+
+        assert list(result.days) == [monday_key]
+        assert days[0] == (monday_key, result.days[monday_key])
+        assert [data.day_name for _, data in days][1:3] == ["Tuesday", "Wednesday"]
+        assert days[1][1].planned_tasks == []
+
+    def test_in_progress_tasks_tracked(self, shared_web_dir, shared_sample_journal, shared_sample_tasks):
+        """Test planned, unfinished in-progress tasks are listed separately."""
+        loader = JournalDataLoader(journal_dir=str(shared_web_dir / "journal"))
+        result = loader.get_journal_data(2026, 2)
+
+        monday_data = result.days[shared_sample_journal.get_day_key(shared_sample_journal.week_start)]
+
+        assert [t.id for t in monday_data.in_progress_tasks] == [shared_sample_tasks[1].id]
+        assert [t.is_completed for t in monday_data.planned_tasks] == [True, False, False]
 
-    def test_total_counts(self, web_manager, web_temp_dir, sample_journal, sample_tasks):
+    def test_total_counts(self, shared_web_dir, shared_sample_journal, shared_sample_tasks):
         """Test total planned and completed counts."""
-        loader = JournalDataLoader(journal_dir=str(web_temp_dir / "journal"))
+        loader = JournalDataLoader(journal_dir=str(shared_web_dir / "journal"))
         result = loader.get_journal_data(2026, 2)
 
         # 3 tasks planned on Monday
@@ -125,6 +188,54 @@ class TestJournalDataLoader:
         # 1 task completed
         assert result.total_completed == 1
 
+    def test_reload_picks_up_task_edits(self, web_manager, web_temp_dir, sample_journal, sample_tasks):
+        """Test a long-lived loader sees task changes after reload."""
+        loader = JournalDataLoader(journal_dir=str(web_temp_dir / "journal"))
+        task = sample_tasks[0]
+        web_manager.update_task(task.id, title="Renamed Task")
+
+        loader.reload()
+        result = loader.get_journal_data(2026, 2)
+
+        titles = [t.title for day in result.days.values() for t in day.planned_tasks]
+        assert "Renamed Task" in titles
+
+    def test_loaders_share_managers(self, web_manager, web_temp_dir):
+        """Test loaders for the same config reuse one set of managers."""
+        journal_dir = str(web_temp_dir / "journal")
+        first = JournalDataLoader(journal_dir=journal_dir)
+        second = JournalDataLoader(journal_dir=journal_dir)
+
+        assert first._task_manager is second._task_manager
+        assert first._journal_manager is second._journal_manager
+
+    def test_task_snapshot_rebuilt_only_after_reload(self, web_manager, web_temp_dir, sample_tasks):
+        """Test the task snapshot is reused until tasks are reloaded."""
+        loader = JournalDataLoader(journal_dir=str(web_temp_dir / "journal"))
+        loader.reload()
+        first = loader._task_snapshots()
+
+        assert loader._task_snapshots() is first
+        loader.reload()
+        assert loader._task_snapshots() is not first
+        assert loader._task_snapshots() == first
+
+    def test_journal_data_cached_until_file_changes(self, web_manager, web_temp_dir, sample_journal, sample_tasks):
+        """Test journal parsing is reused until the journal file changes."""
+        loader = JournalDataLoader(journal_dir=str(web_temp_dir / "journal"))
+        first = loader.get_journal_data(2026, 2)
+
+        path = sample_journal.get_file_path()
+        path.write_text(path.read_text().replace("## Monday", "## Tuesday"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        second = loader.get_journal_data(2026, 2)
+
+        monday_key = sample_journal.get_day_key(sample_journal.week_start)
+        assert len(first.days[monday_key].planned_tasks) == 3
+        assert monday_key not in second.days
+        assert second.total_planned == 3
+
 
 class TestTaskDisplayData:
     """Test TaskDisplayData dataclass."""
@@ -161,6 +272,39 @@ class TestTaskDisplayData:
         assert data.eta is None
         assert data.notes_count == 0
 
+    def test_task_display_data_is_slotted_and_frozen(self):
+        """Test display data has no instance dict and rejects mutation."""
+        data = TaskDisplayData(
+            id="task-xyz",
+            title="Simple Task",
+            type="general",
+            priority="low",
+            status="todo",
+            is_completed=False
+        )
+
+        assert not hasattr(data, "__dict__")
+        with pytest.raises(AttributeError):
+            data.title = "Changed"
+
+    def test_task_display_data_render_strings(self):
+        """Test markdown and caption strings are prebuilt."""
+        data = TaskDisplayData(
+            id="task-abc123",
+            title="Done Task",
+            type="project",
+            priority="high",
+            status="done",
+            is_completed=True,
+            eta="2026-01-15"
+        )
+
+        assert data.markdown == "🔴 **~~Done Task~~**"
+        assert data.caption == "`task-abc123` | project | high | ETA: 2026-01-15"
+        assert data.markdown_with_icon("⚪") == (
+            "✅ 🔴 **~~Done Task~~**  \n:gray[`task-abc123` | project | high | ETA: 2026-01-15]"
+        )
+
 
 class TestDaySectionData:
     """Test DaySectionData dataclass."""
@@ -202,3 +346,5 @@ class TestWeeklyJournalData:
         assert data.week == 2
         assert data.total_planned == 10
         assert data.total_completed == 7
+        assert data.completion_rate == 70.0
+        assert data.delta_color == "off"